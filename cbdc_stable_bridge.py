@@ -13,15 +13,87 @@ Version: 1.0.0
 import json
 import uuid
 import logging
+from functools import lru_cache
+from types import MappingProxyType
 from datetime import datetime, timedelta
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Optional, List, Dict, Tuple, Any
+from typing import Optional, List, Dict, Tuple, Any, AsyncIterator
 from pathlib import Path
 from dataclasses import dataclass, field
 from enum import Enum
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Underlying fiat currency for each known CBDC (read-only, shared)
+_CBDC_FIAT_MAP = MappingProxyType({
+    "e-INR": "INR",
+    "e-CNY": "CNY",
+    "e-HKD": "HKD",
+    "e-THB": "THB",
+    "e-AED": "AED",
+    "e-SGD": "SGD",
+    "e-EUR": "EUR",
+    "e-USD": "USD",
+})
+
+# Reference FX rates between fiat currencies (base + quote)
+_FX_RATES = MappingProxyType({
+    "USDINR": Decimal("84.50"),
+    "USDCNY": Decimal("7.25"),
+    "USDHKD": Decimal("7.82"),
+    "USDTHB": Decimal("34.50"),
+    "USDAED": Decimal("3.67"),
+    "USDSGD": Decimal("1.345"),
+    "EURUSD": Decimal("1.056"),
+    "GBPUSD": Decimal("1.26"),
+})
+
+# Quantization steps, applied only to final rates and amounts
+_AMOUNT_Q = Decimal("0.01")
+_FX_RATE_Q = Decimal("0.0001")
+_C2S_RATE_Q = Decimal("0.000001")
+
+# Smallest amount that gets a P2P/OTC route
+_OTC_MIN_AMOUNT = Decimal("100000")
+
+# Route scoring weights
+_ROUTE_SCORE_WEIGHTS = MappingProxyType({
+    "cost": 0.35,
+    "speed": 0.25,
+    "liquidity": 0.15,
+    "regulatory": 0.15,
+    "reliability": 0.10
+})
+
+# Below this many routes the per-route scorer beats NumPy setup overhead
+_VECTORIZE_MIN_ROUTES = 16
+
+# Shared fallbacks for missing config entries (avoid rebuilding per lookup)
+_DEFAULT_NETWORKS = ({"chain": "ETHEREUM"},)
+_DEFAULT_JURISDICTIONS = ("US",)
+_DEFAULT_MAX_TRANSACTION = Decimal("10000000")
+
+# Leg description templates; assets come from a small universe so the
+# formatted strings are memoized and shared across route builds
+_DESC_REDEEM_TO = "Redeem {} to {}"
+_DESC_FX = "FX {} → {}"
+_DESC_MINT = "Mint {}"
+_DESC_CEX = "CEX: {} → {}"
+_DESC_OTC = "OTC: {} → {}"
+
+
+@lru_cache(maxsize=1024)
+def _describe(template: str, *assets: str) -> str:
+    """Format (and memoize) a leg description from a template"""
+    return template.format(*assets)
+
 
 class BridgeType(str, Enum):
     """Types of bridges between CBDC and Stablecoin"""
@@ -41,7 +113,17 @@ class BridgeStatus(str, Enum):
     PLANNED = "PLANNED"
 
 
-@dataclass
+# Enum members used by the route builders, bound once at import
+_BT_FIAT = BridgeType.FIAT_INTERMEDIARY
+_BT_CEX = BridgeType.CEX_BRIDGE
+_BT_MBRIDGE = BridgeType.HYBRID_MBRIDGE
+_BT_ATOMIC = BridgeType.ATOMIC_SWAP
+_BS_ACTIVE = BridgeStatus.ACTIVE
+_BS_PILOT = BridgeStatus.PILOT
+_BS_EXPERIMENTAL = BridgeStatus.EXPERIMENTAL
+
+
+@dataclass(slots=True)
 class BridgeLeg:
     """Single leg in a bridge route"""
     leg_id: str
@@ -64,7 +146,7 @@ class BridgeLeg:
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class BridgeRoute:
     """Complete bridge route"""
     route_id: str
@@ -127,6 +209,7 @@ class CBDCStableBridge:
         self._load_configurations()
         self._init_bridge_providers()
         self._init_liquidity_pools()
+        self._init_fx_matrix()
     
     def _load_configurations(self):
         """Load configuration files"""
@@ -233,6 +316,16 @@ class CBDCStableBridge:
             }
         }
     
+    def _init_fx_matrix(self):
+        """Precompute direct, inverse and USD-triangulated rates for all known pairs"""
+        currencies = sorted({pair[:3] for pair in _FX_RATES} | {pair[3:] for pair in _FX_RATES})
+        self._fx_matrix: Dict[Tuple[str, str], Decimal] = {
+            (source, target): self._compute_fx_rate(source, target)
+            for source in currencies
+            for target in currencies
+            if source != target
+        }
+    
     # =========================================================================
     # CBDC TO STABLECOIN ROUTES
     # =========================================================================
@@ -303,8 +396,7 @@ class CBDCStableBridge:
         routes = [r for r in routes if r.slippage_tolerance_bps <= max_slippage_bps]
         
         # Calculate overall scores and sort
-        for route in routes:
-            route.overall_score = self._calculate_route_score(route)
+        self._score_routes(routes)
         
         return sorted(routes, key=lambda r: r.overall_score, reverse=True)
     
@@ -333,8 +425,11 @@ class CBDCStableBridge:
         if preferred_network:
             networks = [n for n in networks if n["chain"] == preferred_network] or networks[:1]
         
+        redeem_settlement = cbdc_info.get("settlement_seconds", 5)
+        
         for network in networks[:2]:
             legs = []
+            mint_settlement = network.get("settlement_seconds", 60) + 1800
             
             # Leg 1: CBDC Redemption
             legs.append(BridgeLeg(
@@ -352,10 +447,10 @@ class CBDCStableBridge:
                 amount_out=fiat_amount,
                 fee_bps=0,
                 gas_cost_usd=Decimal("0"),
-                settlement_seconds=cbdc_info.get("settlement_seconds", 5),
+                settlement_seconds=redeem_settlement,
                 requires_kyc=True,
                 compliance_check="CENTRAL_BANK_VALIDATED",
-                description=f"Redeem {cbdc} to {cbdc_fiat}"
+                description=_describe(_DESC_REDEEM_TO, cbdc, cbdc_fiat)
             ))
             
             # Leg 2: FX Conversion (if different currencies)
@@ -378,7 +473,7 @@ class CBDCStableBridge:
                     settlement_seconds=14400,  # 4 hours
                     requires_kyc=True,
                     compliance_check="BANK_KYC",
-                    description=f"FX {cbdc_fiat} → {stable_peg}"
+                    description=_describe(_DESC_FX, cbdc_fiat, stable_peg)
                 ))
             
             # Leg 3: Stablecoin Minting
@@ -397,28 +492,32 @@ class CBDCStableBridge:
                 amount_out=stable_amount,
                 fee_bps=on_ramp_fee,
                 gas_cost_usd=Decimal(str(network.get("avg_fee_usd", 0.5))),
-                settlement_seconds=network.get("settlement_seconds", 60) + 1800,
+                settlement_seconds=mint_settlement,
                 requires_kyc=True,
                 compliance_check="EXCHANGE_KYC",
                 description=f"Mint {stablecoin} on {network['chain']}"
             ))
             
             total_fee = fx_fee + on_ramp_fee
-            total_settlement = sum(leg.settlement_seconds for leg in legs)
+            total_settlement = (
+                redeem_settlement
+                + (14400 if cbdc_fiat != stable_peg else 0)
+                + mint_settlement
+            )
             
             routes.append(BridgeRoute(
                 route_id=f"C2S-FI-{cbdc[:3]}-{stablecoin}-{network['chain'][:3]}-{uuid.uuid4().hex[:4]}",
                 route_name=f"Fiat Bridge: {cbdc} → {stablecoin} ({network['chain']})",
-                bridge_type=BridgeType.FIAT_INTERMEDIARY,
-                status=BridgeStatus.ACTIVE,
+                bridge_type=_BT_FIAT,
+                status=_BS_ACTIVE,
                 legs=legs,
                 source_asset=cbdc,
                 source_type="CBDC",
                 source_amount=amount,
                 target_asset=stablecoin,
                 target_type="STABLECOIN",
-                target_amount=stable_amount.quantize(Decimal("0.01")),
-                effective_rate=(stable_amount / amount).quantize(Decimal("0.000001")),
+                target_amount=stable_amount.quantize(_AMOUNT_Q),
+                effective_rate=(stable_amount / amount).quantize(_C2S_RATE_Q),
                 total_fee_bps=total_fee,
                 total_gas_usd=Decimal(str(network.get("avg_fee_usd", 0.5))),
                 slippage_tolerance_bps=10,
@@ -432,7 +531,7 @@ class CBDCStableBridge:
                 kyc_required=True,
                 travel_rule_applies=True,
                 sanctions_check=True,
-                jurisdictions=[cbdc_info.get("country", ""), stable_info.get("jurisdictions", ["US"])[0]],
+                jurisdictions=[cbdc_info.get("country", ""), (stable_info.get("jurisdictions") or _DEFAULT_JURISDICTIONS)[0]],
                 min_amount=Decimal("100"),
                 max_amount=Decimal("10000000"),
                 daily_limit=Decimal("50000000"),
@@ -465,7 +564,7 @@ class CBDCStableBridge:
         fiat_amount = amount
         stable_amount = fiat_amount * fx_rate * (1 - Decimal(total_fee) / 10000)
         
-        network = stable_info.get("networks", [{"chain": "ETHEREUM"}])[0]
+        network = (stable_info.get("networks") or _DEFAULT_NETWORKS)[0]
         
         legs = [
             BridgeLeg(
@@ -513,16 +612,16 @@ class CBDCStableBridge:
         routes.append(BridgeRoute(
             route_id=f"C2S-CEX-{cbdc[:3]}-{stablecoin}-{uuid.uuid4().hex[:4]}",
             route_name=f"CEX Bridge: {cbdc} → {stablecoin}",
-            bridge_type=BridgeType.CEX_BRIDGE,
-            status=BridgeStatus.ACTIVE,
+            bridge_type=_BT_CEX,
+            status=_BS_ACTIVE,
             legs=legs,
             source_asset=cbdc,
             source_type="CBDC",
             source_amount=amount,
             target_asset=stablecoin,
             target_type="STABLECOIN",
-            target_amount=stable_amount.quantize(Decimal("0.01")),
-            effective_rate=(stable_amount / amount).quantize(Decimal("0.000001")),
+            target_amount=stable_amount.quantize(_AMOUNT_Q),
+            effective_rate=(stable_amount / amount).quantize(_C2S_RATE_Q),
             total_fee_bps=total_fee,
             total_gas_usd=Decimal("0.50"),
             slippage_tolerance_bps=20,
@@ -629,23 +728,23 @@ class CBDCStableBridge:
                 settlement_seconds=3600,
                 requires_kyc=True,
                 compliance_check="EXCHANGE_KYC",
-                description=f"Mint {stablecoin}"
+                description=_describe(_DESC_MINT, stablecoin)
             )
         ]
         
         routes.append(BridgeRoute(
             route_id=f"C2S-MB-{cbdc[:3]}-{stablecoin}-{uuid.uuid4().hex[:4]}",
             route_name=f"mBridge Hybrid: {cbdc} → {stablecoin}",
-            bridge_type=BridgeType.HYBRID_MBRIDGE,
-            status=BridgeStatus.PILOT,
+            bridge_type=_BT_MBRIDGE,
+            status=_BS_PILOT,
             legs=legs,
             source_asset=cbdc,
             source_type="CBDC",
             source_amount=amount,
             target_asset=stablecoin,
             target_type="STABLECOIN",
-            target_amount=stable_amount.quantize(Decimal("0.01")),
-            effective_rate=(stable_amount / amount).quantize(Decimal("0.000001")),
+            target_amount=stable_amount.quantize(_AMOUNT_Q),
+            effective_rate=(stable_amount / amount).quantize(_C2S_RATE_Q),
             total_fee_bps=total_fee,
             total_gas_usd=Decimal("1.00"),
             slippage_tolerance_bps=15,
@@ -717,16 +816,16 @@ class CBDCStableBridge:
         routes.append(BridgeRoute(
             route_id=f"C2S-AS-{cbdc[:3]}-{stablecoin}-{uuid.uuid4().hex[:4]}",
             route_name=f"Atomic Swap: {cbdc} ↔ {stablecoin} (Experimental)",
-            bridge_type=BridgeType.ATOMIC_SWAP,
-            status=BridgeStatus.EXPERIMENTAL,
+            bridge_type=_BT_ATOMIC,
+            status=_BS_EXPERIMENTAL,
             legs=legs,
             source_asset=cbdc,
             source_type="CBDC",
             source_amount=amount,
             target_asset=stablecoin,
             target_type="STABLECOIN",
-            target_amount=stable_amount.quantize(Decimal("0.01")),
-            effective_rate=(stable_amount / amount).quantize(Decimal("0.000001")),
+            target_amount=stable_amount.quantize(_AMOUNT_Q),
+            effective_rate=(stable_amount / amount).quantize(_C2S_RATE_Q),
             total_fee_bps=atomic_fee,
             total_gas_usd=Decimal("2.00"),
             slippage_tolerance_bps=5,
@@ -770,7 +869,8 @@ class CBDCStableBridge:
         cbdc: str,
         amount: Decimal,
         source_network: Optional[str] = None,
-        require_regulated: bool = True
+        require_regulated: bool = True,
+        top_k: Optional[int] = None
     ) -> List[BridgeRoute]:
         """
         Get all available routes for Stablecoin → CBDC conversion
@@ -781,6 +881,7 @@ class CBDCStableBridge:
             amount: Amount in source stablecoin
             source_network: Network where stablecoin is held
             require_regulated: Only return regulated routes
+            top_k: Only return the best top_k routes
         
         Returns:
             List of BridgeRoute sorted by overall_score
@@ -793,36 +894,70 @@ class CBDCStableBridge:
         if not stable_info or not cbdc_info:
             return routes
         
+        routes = [
+            route async for route in self.iter_stable_to_cbdc_routes(
+                stablecoin, cbdc, amount, source_network, require_regulated
+            )
+        ]
+        routes.sort(key=lambda r: r.overall_score, reverse=True)
+        
+        if top_k is not None:
+            # Routes are already sorted best-first
+            return routes[:max(top_k, 0)]
+        
+        return routes
+    
+    async def iter_stable_to_cbdc_routes(
+        self,
+        stablecoin: str,
+        cbdc: str,
+        amount: Decimal,
+        source_network: Optional[str] = None,
+        require_regulated: bool = True
+    ) -> AsyncIterator[BridgeRoute]:
+        """
+        Lazily yield scored Stablecoin → CBDC routes in build order
+        
+        Each route builder only runs once the previous routes have been
+        consumed, so callers can stop early (e.g. after the first acceptable
+        route). Routes are not sorted; use get_stable_to_cbdc_routes for that.
+        """
+        stable_info = self.digital_currencies["stablecoins"].get(stablecoin)
+        cbdc_info = self.digital_currencies["cbdc"].get(cbdc)
+        
+        if not stable_info or not cbdc_info:
+            return
+        
         stable_peg = stable_info["pegged_currency"]
         cbdc_fiat = self._get_cbdc_fiat(cbdc)
         
         # Route 1: Standard off-ramp path
-        routes.extend(await self._build_stable_to_cbdc_fiat_route(
+        for route in await self._build_stable_to_cbdc_fiat_route(
             stablecoin, cbdc, amount, stable_peg, cbdc_fiat,
             stable_info, cbdc_info, source_network
-        ))
+        ):
+            if self._passes_regulatory_filter(route, require_regulated):
+                route.overall_score = self._calculate_route_score(route)
+                yield route
         
         # Route 2: CEX Bridge
-        routes.extend(await self._build_stable_to_cbdc_cex_route(
+        for route in await self._build_stable_to_cbdc_cex_route(
             stablecoin, cbdc, amount, stable_peg, cbdc_fiat,
             stable_info, cbdc_info
-        ))
+        ):
+            if self._passes_regulatory_filter(route, require_regulated):
+                route.overall_score = self._calculate_route_score(route)
+                yield route
         
         # Route 3: P2P/OTC Route (for large amounts)
-        if amount >= Decimal("100000"):
-            routes.extend(await self._build_stable_to_cbdc_otc_route(
+        if amount >= _OTC_MIN_AMOUNT:
+            for route in await self._build_stable_to_cbdc_otc_route(
                 stablecoin, cbdc, amount, stable_peg, cbdc_fiat,
                 stable_info, cbdc_info
-            ))
-        
-        # Filter and sort
-        if require_regulated:
-            routes = [r for r in routes if r.regulatory_score >= 70]
-        
-        for route in routes:
-            route.overall_score = self._calculate_route_score(route)
-        
-        return sorted(routes, key=lambda r: r.overall_score, reverse=True)
+            ):
+                if self._passes_regulatory_filter(route, require_regulated):
+                    route.overall_score = self._calculate_route_score(route)
+                    yield route
     
     async def _build_stable_to_cbdc_fiat_route(
         self, stablecoin: str, cbdc: str, amount: Decimal,
@@ -833,98 +968,83 @@ class CBDCStableBridge:
         """Build Stablecoin → Fiat → CBDC route"""
         routes = []
         
-        fx_rate = self._get_fx_rate(stable_peg, cbdc_fiat)
+        # Same-currency peg needs no FX leg, so skip the rate lookup and math
+        needs_fx = stable_peg != cbdc_fiat
         
         off_ramp_fee = 25
-        fx_fee = 0 if stable_peg == cbdc_fiat else 15
+        fx_fee = 15 if needs_fx else 0
         total_fee = off_ramp_fee + fx_fee
         
         fiat_amount = amount * (1 - Decimal(off_ramp_fee) / 10000)
-        cbdc_amount = fiat_amount * fx_rate * (1 - Decimal(fx_fee) / 10000)
-        
-        network = source_network or stable_info.get("networks", [{"chain": "ETHEREUM"}])[0]["chain"]
-        
-        legs = [
-            BridgeLeg(
-                leg_id=f"S2C-L1-{uuid.uuid4().hex[:6]}",
-                sequence=1,
-                from_asset=stablecoin,
-                from_type="STABLECOIN",
-                to_asset=stable_peg,
-                to_type="FIAT",
-                provider=stable_info.get("issuer", "Issuer"),
-                protocol="OFF_RAMP",
-                network=network,
-                rate=Decimal("1.0"),
-                amount_in=amount,
-                amount_out=fiat_amount,
-                fee_bps=off_ramp_fee,
-                gas_cost_usd=Decimal("0.50"),
-                settlement_seconds=3600,
-                requires_kyc=True,
-                compliance_check="EXCHANGE_KYC",
-                description=f"Redeem {stablecoin} to {stable_peg}"
-            )
-        ]
-        
-        if stable_peg != cbdc_fiat:
+        if needs_fx:
+            fx_rate = self._get_fx_rate(stable_peg, cbdc_fiat)
+            converted_amount = fiat_amount * fx_rate
+            cbdc_amount = converted_amount * (1 - Decimal(fx_fee) / 10000)
+        else:
+            converted_amount = fiat_amount
+            cbdc_amount = fiat_amount
+        
+        # Resolve config lookups once for the whole route
+        network = source_network or (stable_info.get("networks") or _DEFAULT_NETWORKS)[0]["chain"]
+        stable_issuer = stable_info.get("issuer", "Issuer")
+        stable_jurisdiction = (stable_info.get("jurisdictions") or _DEFAULT_JURISDICTIONS)[0]
+        cbdc_issuer = cbdc_info.get("issuer", "Central Bank")
+        cbdc_technology = cbdc_info.get("technology")
+        cbdc_country = cbdc_info.get("country", "")
+        tx_limits = cbdc_info.get("transaction_limits") or {}
+        max_transaction = tx_limits.get("max_transaction", _DEFAULT_MAX_TRANSACTION)
+        daily_limit = tx_limits.get("daily_limit")
+        mint_settlement = cbdc_info.get("settlement_seconds", 5)
+        
+        # Legs: off-ramp, optional FX, mint (the mint leg is numbered last).
+        # BridgeLeg args are positional, in dataclass field order.
+        n_legs = 3 if needs_fx else 2
+        legs: List[BridgeLeg] = [BridgeLeg(
+            f"S2C-L1-{uuid.uuid4().hex[:6]}", 1,
+            stablecoin, "STABLECOIN", stable_peg, "FIAT",
+            stable_issuer, "OFF_RAMP", network,
+            Decimal("1.0"), amount, fiat_amount,
+            off_ramp_fee, Decimal("0.50"), 3600,
+            True, "EXCHANGE_KYC",
+            _describe(_DESC_REDEEM_TO, stablecoin, stable_peg)
+        )]
+        
+        if needs_fx:
             legs.append(BridgeLeg(
-                leg_id=f"S2C-L2-{uuid.uuid4().hex[:6]}",
-                sequence=2,
-                from_asset=stable_peg,
-                from_type="FIAT",
-                to_asset=cbdc_fiat,
-                to_type="FIAT",
-                provider="FX Provider",
-                protocol="SWIFT/LOCAL",
-                network=None,
-                rate=fx_rate,
-                amount_in=fiat_amount,
-                amount_out=fiat_amount * fx_rate,
-                fee_bps=fx_fee,
-                gas_cost_usd=Decimal("0"),
-                settlement_seconds=14400,
-                requires_kyc=True,
-                compliance_check="BANK_KYC",
-                description=f"FX {stable_peg} → {cbdc_fiat}"
+                f"S2C-L2-{uuid.uuid4().hex[:6]}", 2,
+                stable_peg, "FIAT", cbdc_fiat, "FIAT",
+                "FX Provider", "SWIFT/LOCAL", None,
+                fx_rate, fiat_amount, converted_amount,
+                fx_fee, Decimal("0"), 14400,
+                True, "BANK_KYC",
+                _describe(_DESC_FX, stable_peg, cbdc_fiat)
             ))
         
         legs.append(BridgeLeg(
-            leg_id=f"S2C-L3-{uuid.uuid4().hex[:6]}",
-            sequence=len(legs) + 1,
-            from_asset=cbdc_fiat,
-            from_type="FIAT",
-            to_asset=cbdc,
-            to_type="CBDC",
-            provider=cbdc_info.get("issuer", "Central Bank"),
-            protocol="CBDC_MINT",
-            network=cbdc_info.get("technology"),
-            rate=Decimal("1.0"),
-            amount_in=fiat_amount * fx_rate if stable_peg != cbdc_fiat else fiat_amount,
-            amount_out=cbdc_amount,
-            fee_bps=0,
-            gas_cost_usd=Decimal("0"),
-            settlement_seconds=cbdc_info.get("settlement_seconds", 5),
-            requires_kyc=True,
-            compliance_check="CENTRAL_BANK_VALIDATED",
-            description=f"Mint {cbdc}"
+            f"S2C-L3-{uuid.uuid4().hex[:6]}", n_legs,
+            cbdc_fiat, "FIAT", cbdc, "CBDC",
+            cbdc_issuer, "CBDC_MINT", cbdc_technology,
+            Decimal("1.0"), converted_amount, cbdc_amount,
+            0, Decimal("0"), mint_settlement,
+            True, "CENTRAL_BANK_VALIDATED",
+            _describe(_DESC_MINT, cbdc)
         ))
         
-        total_settlement = sum(leg.settlement_seconds for leg in legs)
+        total_settlement = 3600 + (14400 if needs_fx else 0) + mint_settlement
         
         routes.append(BridgeRoute(
             route_id=f"S2C-FI-{stablecoin}-{cbdc[:3]}-{uuid.uuid4().hex[:4]}",
             route_name=f"Fiat Bridge: {stablecoin} → {cbdc}",
-            bridge_type=BridgeType.FIAT_INTERMEDIARY,
-            status=BridgeStatus.ACTIVE,
+            bridge_type=_BT_FIAT,
+            status=_BS_ACTIVE,
             legs=legs,
             source_asset=stablecoin,
             source_type="STABLECOIN",
             source_amount=amount,
             target_asset=cbdc,
             target_type="CBDC",
-            target_amount=cbdc_amount.quantize(Decimal("0.01")),
-            effective_rate=(cbdc_amount / amount).quantize(Decimal("0.0001")),
+            target_amount=cbdc_amount.quantize(_AMOUNT_Q),
+            effective_rate=(cbdc_amount / amount).quantize(_FX_RATE_Q),
             total_fee_bps=total_fee,
             total_gas_usd=Decimal("0.50"),
             slippage_tolerance_bps=10,
@@ -938,11 +1058,11 @@ class CBDCStableBridge:
             kyc_required=True,
             travel_rule_applies=True,
             sanctions_check=True,
-            jurisdictions=[stable_info.get("jurisdictions", ["US"])[0], cbdc_info.get("country", "")],
+            jurisdictions=[stable_jurisdiction, cbdc_country],
             min_amount=Decimal("100"),
-            max_amount=cbdc_info.get("transaction_limits", {}).get("max_transaction", Decimal("10000000")),
-            daily_limit=cbdc_info.get("transaction_limits", {}).get("daily_limit"),
-            warnings=["FX settlement may take 4+ hours"] if stable_peg != cbdc_fiat else [],
+            max_amount=max_transaction,
+            daily_limit=daily_limit,
+            warnings=["FX settlement may take 4+ hours"] if needs_fx else [],
             benefits=["Fully regulated", "Central bank guarantee", "No smart contract risk"]
         ))
         
@@ -963,60 +1083,38 @@ class CBDCStableBridge:
         
         legs = [
             BridgeLeg(
-                leg_id=f"S2C-CEX-L1-{uuid.uuid4().hex[:6]}",
-                sequence=1,
-                from_asset=stablecoin,
-                from_type="STABLECOIN",
-                to_asset=cbdc_fiat,
-                to_type="FIAT",
-                provider="Coinbase Prime",
-                protocol="CEX_OFFRAMP",
-                network="ETHEREUM",
-                rate=fx_rate,
-                amount_in=amount,
-                amount_out=amount * fx_rate * (1 - Decimal(cex_fee) / 10000),
-                fee_bps=cex_fee,
-                gas_cost_usd=Decimal("0.50"),
-                settlement_seconds=7200,
-                requires_kyc=True,
-                compliance_check="EXCHANGE_KYC",
-                description=f"CEX: {stablecoin} → {cbdc_fiat}"
+                f"S2C-CEX-L1-{uuid.uuid4().hex[:6]}", 1,
+                stablecoin, "STABLECOIN", cbdc_fiat, "FIAT",
+                "Coinbase Prime", "CEX_OFFRAMP", "ETHEREUM",
+                fx_rate, amount, amount * fx_rate * (1 - Decimal(cex_fee) / 10000),
+                cex_fee, Decimal("0.50"), 7200,
+                True, "EXCHANGE_KYC",
+                _describe(_DESC_CEX, stablecoin, cbdc_fiat)
             ),
             BridgeLeg(
-                leg_id=f"S2C-CEX-L2-{uuid.uuid4().hex[:6]}",
-                sequence=2,
-                from_asset=cbdc_fiat,
-                from_type="FIAT",
-                to_asset=cbdc,
-                to_type="CBDC",
-                provider=cbdc_info.get("issuer", "Central Bank"),
-                protocol="CBDC_MINT",
-                network=cbdc_info.get("technology"),
-                rate=Decimal("1.0"),
-                amount_in=cbdc_amount,
-                amount_out=cbdc_amount,
-                fee_bps=0,
-                gas_cost_usd=Decimal("0"),
-                settlement_seconds=5,
-                requires_kyc=True,
-                compliance_check="CENTRAL_BANK_VALIDATED",
-                description=f"Mint {cbdc}"
+                f"S2C-CEX-L2-{uuid.uuid4().hex[:6]}", 2,
+                cbdc_fiat, "FIAT", cbdc, "CBDC",
+                cbdc_info.get("issuer", "Central Bank"), "CBDC_MINT", cbdc_info.get("technology"),
+                Decimal("1.0"), cbdc_amount, cbdc_amount,
+                0, Decimal("0"), 5,
+                True, "CENTRAL_BANK_VALIDATED",
+                _describe(_DESC_MINT, cbdc)
             )
         ]
         
         routes.append(BridgeRoute(
             route_id=f"S2C-CEX-{stablecoin}-{cbdc[:3]}-{uuid.uuid4().hex[:4]}",
             route_name=f"CEX Bridge: {stablecoin} → {cbdc}",
-            bridge_type=BridgeType.CEX_BRIDGE,
-            status=BridgeStatus.ACTIVE,
+            bridge_type=_BT_CEX,
+            status=_BS_ACTIVE,
             legs=legs,
             source_asset=stablecoin,
             source_type="STABLECOIN",
             source_amount=amount,
             target_asset=cbdc,
             target_type="CBDC",
-            target_amount=cbdc_amount.quantize(Decimal("0.01")),
-            effective_rate=(cbdc_amount / amount).quantize(Decimal("0.0001")),
+            target_amount=cbdc_amount.quantize(_AMOUNT_Q),
+            effective_rate=(cbdc_amount / amount).quantize(_FX_RATE_Q),
             total_fee_bps=cex_fee,
             total_gas_usd=Decimal("0.50"),
             slippage_tolerance_bps=20,
@@ -1055,40 +1153,29 @@ class CBDCStableBridge:
         
         legs = [
             BridgeLeg(
-                leg_id=f"S2C-OTC-L1-{uuid.uuid4().hex[:6]}",
-                sequence=1,
-                from_asset=stablecoin,
-                from_type="STABLECOIN",
-                to_asset=cbdc,
-                to_type="CBDC",
-                provider="OTC Desk (Cumberland/Circle Trade)",
-                protocol="OTC_TRADE",
-                network="BILATERAL",
-                rate=fx_rate * (1 - Decimal(otc_fee) / 10000),
-                amount_in=amount,
-                amount_out=cbdc_amount,
-                fee_bps=otc_fee,
-                gas_cost_usd=Decimal("0"),
-                settlement_seconds=86400,  # T+1
-                requires_kyc=True,
-                compliance_check="INSTITUTIONAL_KYC",
-                description=f"OTC: {stablecoin} → {cbdc}"
+                f"S2C-OTC-L1-{uuid.uuid4().hex[:6]}", 1,
+                stablecoin, "STABLECOIN", cbdc, "CBDC",
+                "OTC Desk (Cumberland/Circle Trade)", "OTC_TRADE", "BILATERAL",
+                fx_rate * (1 - Decimal(otc_fee) / 10000), amount, cbdc_amount,
+                otc_fee, Decimal("0"), 86400,  # T+1
+                True, "INSTITUTIONAL_KYC",
+                _describe(_DESC_OTC, stablecoin, cbdc)
             )
         ]
         
         routes.append(BridgeRoute(
             route_id=f"S2C-OTC-{stablecoin}-{cbdc[:3]}-{uuid.uuid4().hex[:4]}",
             route_name=f"OTC Trade: {stablecoin} → {cbdc}",
-            bridge_type=BridgeType.FIAT_INTERMEDIARY,
-            status=BridgeStatus.ACTIVE,
+            bridge_type=_BT_FIAT,
+            status=_BS_ACTIVE,
             legs=legs,
             source_asset=stablecoin,
             source_type="STABLECOIN",
             source_amount=amount,
             target_asset=cbdc,
             target_type="CBDC",
-            target_amount=cbdc_amount.quantize(Decimal("0.01")),
-            effective_rate=(cbdc_amount / amount).quantize(Decimal("0.0001")),
+            target_amount=cbdc_amount.quantize(_AMOUNT_Q),
+            effective_rate=(cbdc_amount / amount).quantize(_FX_RATE_Q),
             total_fee_bps=otc_fee,
             total_gas_usd=Decimal("0"),
             slippage_tolerance_bps=5,
@@ -1118,61 +1205,86 @@ class CBDCStableBridge:
     
     def _get_cbdc_fiat(self, cbdc: str) -> str:
         """Get underlying fiat currency for CBDC"""
-        mapping = {
-            "e-INR": "INR",
-            "e-CNY": "CNY",
-            "e-HKD": "HKD",
-            "e-THB": "THB",
-            "e-AED": "AED",
-            "e-SGD": "SGD",
-            "e-EUR": "EUR",
-            "e-USD": "USD",
-        }
-        return mapping.get(cbdc, cbdc.replace("e-", ""))
+        fiat = _CBDC_FIAT_MAP.get(cbdc)
+        if fiat is not None:
+            return fiat
+        return cbdc[2:] if cbdc.startswith("e-") else cbdc
     
     def _get_fx_rate(self, source: str, target: str) -> Decimal:
         """Get FX rate between fiat currencies"""
         if source == target:
             return Decimal("1.0")
         
-        rates = {
-            "USDINR": Decimal("84.50"),
-            "USDCNY": Decimal("7.25"),
-            "USDHKD": Decimal("7.82"),
-            "USDTHB": Decimal("34.50"),
-            "USDAED": Decimal("3.67"),
-            "USDSGD": Decimal("1.345"),
-            "EURUSD": Decimal("1.056"),
-            "GBPUSD": Decimal("1.26"),
-        }
+        rate = self._fx_matrix.get((source, target))
+        if rate is not None:
+            return rate
+        
+        return self._compute_fx_rate(source, target)
+    
+    def _compute_fx_rate(self, source: str, target: str) -> Decimal:
+        """Derive FX rate from the reference table (direct, inverse or via USD)"""
+        key = f"{source}{target}"
+        if key in _FX_RATES:
+            return _FX_RATES[key]
+        
+        # Derived rates are rounded once, after any triangulation
+        return self._raw_fx_rate(source, target).quantize(_FX_RATE_Q)
+    
+    def _raw_fx_rate(self, source: str, target: str) -> Decimal:
+        """Unrounded FX rate from the reference table"""
+        if source == target:
+            return Decimal("1.0")
         
         key = f"{source}{target}"
-        if key in rates:
-            return rates[key]
+        if key in _FX_RATES:
+            return _FX_RATES[key]
         
         inv_key = f"{target}{source}"
-        if inv_key in rates:
-            return (Decimal("1") / rates[inv_key]).quantize(Decimal("0.0001"))
+        if inv_key in _FX_RATES:
+            return Decimal("1") / _FX_RATES[inv_key]
         
         # Try via USD
         if source != "USD" and target != "USD":
-            source_to_usd = self._get_fx_rate(source, "USD")
-            usd_to_target = self._get_fx_rate("USD", target)
+            source_to_usd = self._raw_fx_rate(source, "USD")
+            usd_to_target = self._raw_fx_rate("USD", target)
             if source_to_usd and usd_to_target:
-                return (source_to_usd * usd_to_target).quantize(Decimal("0.0001"))
+                return source_to_usd * usd_to_target
         
         return Decimal("1.0")
     
+    def _passes_regulatory_filter(self, route: BridgeRoute, require_regulated: bool) -> bool:
+        """Check route against the regulated-only filter"""
+        return not require_regulated or route.regulatory_score >= 70
+    
+    def _score_routes(self, routes: List[BridgeRoute]):
+        """Set overall_score on every route, vectorized with NumPy for large batches"""
+        if not NUMPY_AVAILABLE or len(routes) < _VECTORIZE_MIN_ROUTES:
+            for route in routes:
+                route.overall_score = self._calculate_route_score(route)
+            return
+        
+        n = len(routes)
+        weights = _ROUTE_SCORE_WEIGHTS
+        fee = np.fromiter((r.total_fee_bps for r in routes), dtype=np.float64, count=n)
+        settle = np.fromiter((r.total_settlement_seconds for r in routes), dtype=np.float64, count=n)
+        liquidity = np.fromiter((r.liquidity_score for r in routes), dtype=np.float64, count=n)
+        regulatory = np.fromiter((r.regulatory_score for r in routes), dtype=np.float64, count=n)
+        counterparty = np.fromiter((r.counterparty_score for r in routes), dtype=np.float64, count=n)
+        
+        scores = (
+            np.maximum(0, 100 - fee) * weights["cost"] +
+            np.maximum(0, 100 - settle / 3600) * weights["speed"] +
+            liquidity * weights["liquidity"] +
+            regulatory * weights["regulatory"] +
+            counterparty * weights["reliability"]
+        )
+        
+        for route, score in zip(routes, scores.tolist()):
+            route.overall_score = round(score, 2)
+    
     def _calculate_route_score(self, route: BridgeRoute) -> float:
         """Calculate overall route score"""
-        # Weighted scoring
-        weights = {
-            "cost": 0.35,
-            "speed": 0.25,
-            "liquidity": 0.15,
-            "regulatory": 0.15,
-            "reliability": 0.10
-        }
+        weights = _ROUTE_SCORE_WEIGHTS
         
         # Normalize cost score (lower fees = higher score)
         cost_score = max(0, 100 - route.total_fee_bps)
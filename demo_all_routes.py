@@ -15,26 +15,37 @@ Version: 2.0.0
 
 import asyncio
 import json
+import logging
 import sys
 import os
+import random
 from decimal import Decimal
 from datetime import datetime
-from dataclasses import dataclass, asdict
-from typing import Dict, List, Any, Optional
-from enum import Enum
+from dataclasses import dataclass, asdict, is_dataclass
+from typing import Dict, Final, FrozenSet, List, Any, Optional, Tuple
+from enum import Enum, IntEnum
 import time
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-# Try to import engines
+logger = logging.getLogger(__name__)
+
+# Optional fast JSON encoder for result export
 try:
-    from app.services.universal_conversion_engine import UniversalConversionEngine, ConversionType
-    from app.services.cbdc_stable_bridge import CBDCStableBridge, get_bridge_engine, BridgeType
-    ENGINES_AVAILABLE = True
-except ImportError as e:
-    print(f"⚠️  Warning: Could not import engines: {e}")
-    ENGINES_AVAILABLE = False
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Bound once; used for simulated per-scenario latency jitter
+_uniform = random.uniform
+
+# Monotonic, nanosecond-resolution clock for per-scenario timing
+_perf_counter_ns = time.perf_counter_ns
+
+# Upper bound on scenarios in flight against the routing engines at once
+MAX_CONCURRENT_SCENARIOS = 32
 
 
 class DemoMode(str, Enum):
@@ -46,7 +57,28 @@ class DemoMode(str, Enum):
     STABLE = "stable"    # Stablecoin routes focus
 
 
-@dataclass
+class ConversionCategory(IntEnum):
+    """Conversion category (numbered as in the demo banner)"""
+    FIAT_TO_FIAT = 1
+    FIAT_TO_CBDC = 2
+    CBDC_TO_FIAT = 3
+    CBDC_TO_CBDC = 4
+    FIAT_TO_STABLECOIN = 5
+    STABLECOIN_TO_FIAT = 6
+    STABLECOIN_TO_STABLECOIN = 7
+    CBDC_TO_STABLECOIN = 8
+    STABLECOIN_TO_CBDC = 9
+
+
+_CBDC_CATEGORIES: Final[FrozenSet[ConversionCategory]] = frozenset(
+    c for c in ConversionCategory if "CBDC" in c.name
+)
+_STABLECOIN_CATEGORIES: Final[FrozenSet[ConversionCategory]] = frozenset(
+    c for c in ConversionCategory if "STABLECOIN" in c.name
+)
+
+
+@dataclass(slots=True)
 class DemoScenario:
     """Demo scenario definition"""
     id: str
@@ -55,13 +87,14 @@ class DemoScenario:
     source_type: str
     target: str
     target_type: str
-    amount: Decimal
+    amount: float
     description: str
-    category: str
+    category: ConversionCategory
     highlight: bool = False
+    is_atomic: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class DemoResult:
     """Demo execution result"""
     scenario_id: str
@@ -76,6 +109,449 @@ class DemoResult:
     error: str = ""
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# SCENARIO CATALOG (built once at import)
+# ═══════════════════════════════════════════════════════════════════════════
+
+_ALL_SCENARIOS: Tuple[DemoScenario, ...] = (
+    # ═══════════════════════════════════════════════════════════════
+    # FIAT TO FIAT
+    # ═══════════════════════════════════════════════════════════════
+    DemoScenario(
+        id="F2F-001", name="USD → INR Direct",
+        source="USD", source_type="FIAT",
+        target="INR", target_type="FIAT",
+        amount=100_000.0,
+        description="Standard cross-border FX via SWIFT/Local",
+        category=ConversionCategory.FIAT_TO_FIAT
+    ),
+    DemoScenario(
+        id="F2F-002", name="EUR → SGD Cross",
+        source="EUR", source_type="FIAT",
+        target="SGD", target_type="FIAT",
+        amount=50_000.0,
+        description="Cross-rate via USD triangulation",
+        category=ConversionCategory.FIAT_TO_FIAT
+    ),
+    DemoScenario(
+        id="F2F-003", name="GBP → AED",
+        source="GBP", source_type="FIAT",
+        target="AED", target_type="FIAT",
+        amount=25_000.0,
+        description="UK to UAE remittance corridor",
+        category=ConversionCategory.FIAT_TO_FIAT
+    ),
+    
+    # ═══════════════════════════════════════════════════════════════
+    # FIAT TO CBDC
+    # ═══════════════════════════════════════════════════════════════
+    DemoScenario(
+        id="F2C-001", name="INR → e-INR Mint",
+        source="INR", source_type="FIAT",
+        target="e-INR", target_type="CBDC",
+        amount=100_000.0,
+        description="Direct CBDC minting (same currency)",
+        category=ConversionCategory.FIAT_TO_CBDC,
+        highlight=True
+    ),
+    DemoScenario(
+        id="F2C-002", name="USD → e-INR",
+        source="USD", source_type="FIAT",
+        target="e-INR", target_type="CBDC",
+        amount=10_000.0,
+        description="FX conversion + CBDC mint",
+        category=ConversionCategory.FIAT_TO_CBDC
+    ),
+    DemoScenario(
+        id="F2C-003", name="USD → e-CNY",
+        source="USD", source_type="FIAT",
+        target="e-CNY", target_type="CBDC",
+        amount=100_000.0,
+        description="Cross-border to Chinese Digital Yuan",
+        category=ConversionCategory.FIAT_TO_CBDC
+    ),
+    DemoScenario(
+        id="F2C-004", name="EUR → e-AED",
+        source="EUR", source_type="FIAT",
+        target="e-AED", target_type="CBDC",
+        amount=50_000.0,
+        description="Europe to UAE CBDC",
+        category=ConversionCategory.FIAT_TO_CBDC
+    ),
+    
+    # ═══════════════════════════════════════════════════════════════
+    # CBDC TO FIAT
+    # ═══════════════════════════════════════════════════════════════
+    DemoScenario(
+        id="C2F-001", name="e-INR → INR Redeem",
+        source="e-INR", source_type="CBDC",
+        target="INR", target_type="FIAT",
+        amount=100_000.0,
+        description="Direct CBDC redemption (same currency)",
+        category=ConversionCategory.CBDC_TO_FIAT,
+        highlight=True
+    ),
+    DemoScenario(
+        id="C2F-002", name="e-INR → USD",
+        source="e-INR", source_type="CBDC",
+        target="USD", target_type="FIAT",
+        amount=500_000.0,
+        description="CBDC redeem + FX conversion",
+        category=ConversionCategory.CBDC_TO_FIAT
+    ),
+    DemoScenario(
+        id="C2F-003", name="e-CNY → EUR",
+        source="e-CNY", source_type="CBDC",
+        target="EUR", target_type="FIAT",
+        amount=100_000.0,
+        description="China CBDC to Euro",
+        category=ConversionCategory.CBDC_TO_FIAT
+    ),
+    
+    # ═══════════════════════════════════════════════════════════════
+    # CBDC TO CBDC (mBridge)
+    # ═══════════════════════════════════════════════════════════════
+    DemoScenario(
+        id="C2C-001", name="e-CNY → e-AED (mBridge)",
+        source="e-CNY", source_type="CBDC",
+        target="e-AED", target_type="CBDC",
+        amount=500_000.0,
+        description="mBridge cross-border PvP settlement",
+        category=ConversionCategory.CBDC_TO_CBDC,
+        highlight=True
+    ),
+    DemoScenario(
+        id="C2C-002", name="e-HKD → e-THB (mBridge)",
+        source="e-HKD", source_type="CBDC",
+        target="e-THB", target_type="CBDC",
+        amount=200_000.0,
+        description="Hong Kong to Thailand CBDC corridor",
+        category=ConversionCategory.CBDC_TO_CBDC,
+        highlight=True
+    ),
+    DemoScenario(
+        id="C2C-003", name="e-INR → e-SGD (Fiat Bridge)",
+        source="e-INR", source_type="CBDC",
+        target="e-SGD", target_type="CBDC",
+        amount=100_000.0,
+        description="Non-mBridge CBDCs via fiat intermediary",
+        category=ConversionCategory.CBDC_TO_CBDC
+    ),
+    
+    # ═══════════════════════════════════════════════════════════════
+    # FIAT TO STABLECOIN
+    # ═══════════════════════════════════════════════════════════════
+    DemoScenario(
+        id="F2S-001", name="USD → USDC (Direct)",
+        source="USD", source_type="FIAT",
+        target="USDC", target_type="STABLECOIN",
+        amount=100_000.0,
+        description="Direct mint via Circle",
+        category=ConversionCategory.FIAT_TO_STABLECOIN,
+        highlight=True
+    ),
+    DemoScenario(
+        id="F2S-002", name="EUR → EURC",
+        source="EUR", source_type="FIAT",
+        target="EURC", target_type="STABLECOIN",
+        amount=50_000.0,
+        description="Euro to Euro Coin (MiCA compliant)",
+        category=ConversionCategory.FIAT_TO_STABLECOIN
+    ),
+    DemoScenario(
+        id="F2S-003", name="SGD → XSGD",
+        source="SGD", source_type="FIAT",
+        target="XSGD", target_type="STABLECOIN",
+        amount=100_000.0,
+        description="Singapore Dollar to XSGD (MAS licensed)",
+        category=ConversionCategory.FIAT_TO_STABLECOIN
+    ),
+    DemoScenario(
+        id="F2S-004", name="INR → USDC",
+        source="INR", source_type="FIAT",
+        target="USDC", target_type="STABLECOIN",
+        amount=500_000.0,
+        description="India to USD stablecoin (FX + on-ramp)",
+        category=ConversionCategory.FIAT_TO_STABLECOIN
+    ),
+    
+    # ═══════════════════════════════════════════════════════════════
+    # STABLECOIN TO FIAT
+    # ═══════════════════════════════════════════════════════════════
+    DemoScenario(
+        id="S2F-001", name="USDC → USD (Direct)",
+        source="USDC", source_type="STABLECOIN",
+        target="USD", target_type="FIAT",
+        amount=100_000.0,
+        description="Direct redeem via Circle",
+        category=ConversionCategory.STABLECOIN_TO_FIAT,
+        highlight=True
+    ),
+    DemoScenario(
+        id="S2F-002", name="USDT → INR",
+        source="USDT", source_type="STABLECOIN",
+        target="INR", target_type="FIAT",
+        amount=50_000.0,
+        description="Tether to INR via CEX off-ramp",
+        category=ConversionCategory.STABLECOIN_TO_FIAT
+    ),
+    DemoScenario(
+        id="S2F-003", name="EURC → GBP",
+        source="EURC", source_type="STABLECOIN",
+        target="GBP", target_type="FIAT",
+        amount=25_000.0,
+        description="Euro Coin to British Pounds",
+        category=ConversionCategory.STABLECOIN_TO_FIAT
+    ),
+    
+    # ═══════════════════════════════════════════════════════════════
+    # STABLECOIN TO STABLECOIN
+    # ═══════════════════════════════════════════════════════════════
+    DemoScenario(
+        id="S2S-001", name="USDC → USDT (DEX)",
+        source="USDC", source_type="STABLECOIN",
+        target="USDT", target_type="STABLECOIN",
+        amount=100_000.0,
+        description="DEX swap on Curve/Uniswap",
+        category=ConversionCategory.STABLECOIN_TO_STABLECOIN
+    ),
+    DemoScenario(
+        id="S2S-002", name="USDC → EURC",
+        source="USDC", source_type="STABLECOIN",
+        target="EURC", target_type="STABLECOIN",
+        amount=50_000.0,
+        description="USD to EUR stablecoin swap",
+        category=ConversionCategory.STABLECOIN_TO_STABLECOIN
+    ),
+    DemoScenario(
+        id="S2S-003", name="USDT → XSGD",
+        source="USDT", source_type="STABLECOIN",
+        target="XSGD", target_type="STABLECOIN",
+        amount=100_000.0,
+        description="Cross-currency stablecoin conversion",
+        category=ConversionCategory.STABLECOIN_TO_STABLECOIN
+    ),
+    
+    # ═══════════════════════════════════════════════════════════════
+    # CBDC TO STABLECOIN (Including Atomic Swaps)
+    # ═══════════════════════════════════════════════════════════════
+    DemoScenario(
+        id="C2S-001", name="e-INR → USDC (Fiat Bridge)",
+        source="e-INR", source_type="CBDC",
+        target="USDC", target_type="STABLECOIN",
+        amount=100_000.0,
+        description="CBDC to stablecoin via fiat intermediary",
+        category=ConversionCategory.CBDC_TO_STABLECOIN
+    ),
+    DemoScenario(
+        id="C2S-002", name="e-INR → USDC (Atomic Swap)",
+        source="e-INR", source_type="CBDC",
+        target="USDC", target_type="STABLECOIN",
+        amount=50_000.0,
+        description="⚛️ ATOMIC SWAP - Direct HTLC exchange",
+        category=ConversionCategory.CBDC_TO_STABLECOIN,
+        highlight=True,
+        is_atomic=True
+    ),
+    DemoScenario(
+        id="C2S-003", name="e-CNY → USDT (CEX Bridge)",
+        source="e-CNY", source_type="CBDC",
+        target="USDT", target_type="STABLECOIN",
+        amount=200_000.0,
+        description="Chinese CBDC to Tether via CEX",
+        category=ConversionCategory.CBDC_TO_STABLECOIN
+    ),
+    DemoScenario(
+        id="C2S-004", name="e-SGD → XSGD (Atomic Swap)",
+        source="e-SGD", source_type="CBDC",
+        target="XSGD", target_type="STABLECOIN",
+        amount=100_000.0,
+        description="⚛️ ATOMIC SWAP - Same-peg atomic exchange",
+        category=ConversionCategory.CBDC_TO_STABLECOIN,
+        highlight=True,
+        is_atomic=True
+    ),
+    DemoScenario(
+        id="C2S-005", name="e-AED → USDC (mBridge + Stable)",
+        source="e-AED", source_type="CBDC",
+        target="USDC", target_type="STABLECOIN",
+        amount=500_000.0,
+        description="mBridge CBDC to stablecoin hybrid route",
+        category=ConversionCategory.CBDC_TO_STABLECOIN
+    ),
+    
+    # ═══════════════════════════════════════════════════════════════
+    # STABLECOIN TO CBDC (Including Atomic Swaps)
+    # ═══════════════════════════════════════════════════════════════
+    DemoScenario(
+        id="S2C-001", name="USDC → e-INR (Fiat Bridge)",
+        source="USDC", source_type="STABLECOIN",
+        target="e-INR", target_type="CBDC",
+        amount=100_000.0,
+        description="Stablecoin to CBDC via fiat intermediary",
+        category=ConversionCategory.STABLECOIN_TO_CBDC
+    ),
+    DemoScenario(
+        id="S2C-002", name="USDC → e-INR (Atomic Swap)",
+        source="USDC", source_type="STABLECOIN",
+        target="e-INR", target_type="CBDC",
+        amount=50_000.0,
+        description="⚛️ ATOMIC SWAP - Direct HTLC exchange",
+        category=ConversionCategory.STABLECOIN_TO_CBDC,
+        highlight=True,
+        is_atomic=True
+    ),
+    DemoScenario(
+        id="S2C-003", name="USDT → e-CNY (CEX Bridge)",
+        source="USDT", source_type="STABLECOIN",
+        target="e-CNY", target_type="CBDC",
+        amount=100_000.0,
+        description="Tether to Chinese Digital Yuan",
+        category=ConversionCategory.STABLECOIN_TO_CBDC
+    ),
+    DemoScenario(
+        id="S2C-004", name="XSGD → e-SGD (Atomic Swap)",
+        source="XSGD", source_type="STABLECOIN",
+        target="e-SGD", target_type="CBDC",
+        amount=100_000.0,
+        description="⚛️ ATOMIC SWAP - Same-peg atomic exchange",
+        category=ConversionCategory.STABLECOIN_TO_CBDC,
+        highlight=True,
+        is_atomic=True
+    ),
+)
+
+# Mode → pre-filtered scenario tuple
+_BY_MODE: Dict[DemoMode, Tuple[DemoScenario, ...]] = {
+    DemoMode.FULL: _ALL_SCENARIOS,
+    DemoMode.QUICK: tuple(s for s in _ALL_SCENARIOS if s.highlight),
+    DemoMode.ATOMIC: tuple(s for s in _ALL_SCENARIOS if s.is_atomic),
+    DemoMode.CBDC: tuple(s for s in _ALL_SCENARIOS if s.category in _CBDC_CATEGORIES),
+    DemoMode.STABLE: tuple(s for s in _ALL_SCENARIOS if s.category in _STABLECOIN_CATEGORIES),
+}
+
+
+def _group_by_category(scenarios: Tuple[DemoScenario, ...]) -> Dict[ConversionCategory, Tuple[DemoScenario, ...]]:
+    """Group scenarios by category, keeping catalog order"""
+    grouped: Dict[ConversionCategory, List[DemoScenario]] = {}
+    for s in scenarios:
+        grouped.setdefault(s.category, []).append(s)
+    return {category: tuple(group) for category, group in grouped.items()}
+
+
+# Mode → scenarios grouped by category, in catalog order
+_GROUPED_BY_MODE: Dict[DemoMode, Dict[ConversionCategory, Tuple[DemoScenario, ...]]] = {
+    mode: _group_by_category(scenarios) for mode, scenarios in _BY_MODE.items()
+}
+_SCENARIOS_BY_CATEGORY: Dict[ConversionCategory, Tuple[DemoScenario, ...]] = _GROUPED_BY_MODE[DemoMode.FULL]
+
+
+# Static part of the demo header; only the run details below it vary
+_HEADER_BANNER = f"""
+{'='*70}
+🚀 FX SMART ROUTING - COMPREHENSIVE DEMO
+{'='*70}
+
+┌─────────────────────────────────────────────────────────────────────┐
+│                    UNIVERSAL FX CONVERSION ENGINE                    │
+├─────────────────────────────────────────────────────────────────────┤
+│  Supported Rails:                                                    │
+│    💵 FIAT      : USD, EUR, GBP, INR, SGD, AED, CNY, HKD, THB, JPY  │
+│    🏛️ CBDC      : e-INR, e-CNY, e-HKD, e-THB, e-AED, e-SGD         │
+│    🪙 STABLECOIN: USDC, USDT, EURC, PYUSD, XSGD                     │
+├─────────────────────────────────────────────────────────────────────┤
+│  Conversion Types (9):                                               │
+│    1. FIAT → FIAT         6. STABLECOIN → FIAT                      │
+│    2. FIAT → CBDC         7. STABLECOIN → STABLECOIN                │
+│    3. CBDC → FIAT         8. CBDC → STABLECOIN                      │
+│    4. CBDC → CBDC         9. STABLECOIN → CBDC                      │
+│    5. FIAT → STABLECOIN                                             │
+├─────────────────────────────────────────────────────────────────────┤
+│  Special Features:                                                   │
+│    ⚛️ Atomic Swaps (CBDC ↔ Stablecoin)                              │
+│    🌐 mBridge Cross-Border CBDC                                      │
+│    🔗 Multi-Network Stablecoin Support                               │
+└─────────────────────────────────────────────────────────────────────┘
+
+"""
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# DISPLAY & SIMULATION TABLES
+# ═══════════════════════════════════════════════════════════════════════════
+
+_CATEGORY_ICONS: Dict[ConversionCategory, str] = {
+    ConversionCategory.FIAT_TO_FIAT: "💱",
+    ConversionCategory.FIAT_TO_CBDC: "🏛️",
+    ConversionCategory.CBDC_TO_FIAT: "💵",
+    ConversionCategory.CBDC_TO_CBDC: "🌐",
+    ConversionCategory.FIAT_TO_STABLECOIN: "🪙",
+    ConversionCategory.STABLECOIN_TO_FIAT: "💰",
+    ConversionCategory.STABLECOIN_TO_STABLECOIN: "🔄",
+    ConversionCategory.CBDC_TO_STABLECOIN: "🔗",
+    ConversionCategory.STABLECOIN_TO_CBDC: "⚡",
+}
+
+# Currencies the demo engines can route (see banner above)
+_SUPPORTED_CURRENCIES: FrozenSet[str] = frozenset({
+    # Fiat
+    "USD", "EUR", "GBP", "INR", "SGD", "AED", "CNY", "HKD", "THB", "JPY",
+    # CBDC
+    "e-INR", "e-CNY", "e-HKD", "e-THB", "e-AED", "e-SGD",
+    # Stablecoin
+    "USDC", "USDT", "EURC", "PYUSD", "XSGD",
+})
+
+# Simulated route data per category: (routes, fee_bps, settlement, rate)
+_SIM_DATA: Dict[ConversionCategory, Tuple[int, int, str, float]] = {
+    ConversionCategory.FIAT_TO_FIAT: (3, 20, "4h", 1.0),
+    ConversionCategory.FIAT_TO_CBDC: (2, 0, "5s", 1.0),
+    ConversionCategory.CBDC_TO_FIAT: (2, 0, "5s", 1.0),
+    ConversionCategory.CBDC_TO_CBDC: (3, 13, "15s", 1.0),
+    ConversionCategory.FIAT_TO_STABLECOIN: (3, 0, "1h", 1.0),
+    ConversionCategory.STABLECOIN_TO_FIAT: (3, 25, "4h", 1.0),
+    ConversionCategory.STABLECOIN_TO_STABLECOIN: (2, 30, "30s", 1.0),
+    ConversionCategory.CBDC_TO_STABLECOIN: (4, 35, "1h", 1.0),
+    ConversionCategory.STABLECOIN_TO_CBDC: (3, 50, "4h", 1.0),
+}
+_SIM_DEFAULT: Tuple[int, int, str, float] = (1, 50, "1h", 1.0)
+_SIM_ATOMIC: Tuple[int, int, str, float] = (1, 15, "5m", 1.0)
+
+_CATEGORY_ROUTE_NAMES: Dict[ConversionCategory, str] = {
+    ConversionCategory.FIAT_TO_FIAT: "SWIFT Transfer",
+    ConversionCategory.FIAT_TO_CBDC: "Direct CBDC Mint",
+    ConversionCategory.CBDC_TO_FIAT: "Direct CBDC Redeem",
+    ConversionCategory.CBDC_TO_CBDC: "mBridge PvP",
+    ConversionCategory.FIAT_TO_STABLECOIN: "Direct Issuer Mint",
+    ConversionCategory.STABLECOIN_TO_FIAT: "Direct Issuer Redeem",
+    ConversionCategory.STABLECOIN_TO_STABLECOIN: "DEX Swap",
+    ConversionCategory.CBDC_TO_STABLECOIN: "Fiat Intermediary",
+    ConversionCategory.STABLECOIN_TO_CBDC: "Fiat Intermediary",
+}
+
+# Scenario ID prefix → display name for the summary
+_CATEGORY_SHORTNAMES: Dict[str, str] = {
+    "F2F": "Fiat → Fiat",
+    "F2C": "Fiat → CBDC",
+    "C2F": "CBDC → Fiat",
+    "C2C": "CBDC → CBDC",
+    "F2S": "Fiat → Stablecoin",
+    "S2F": "Stablecoin → Fiat",
+    "S2S": "Stablecoin → Stablecoin",
+    "C2S": "CBDC → Stablecoin",
+    "S2C": "Stablecoin → CBDC",
+}
+
+
+class _DataclassEncoder(json.JSONEncoder):
+    """JSON encoder that serializes dataclasses lazily, str() for the rest"""
+    
+    def default(self, o):
+        if is_dataclass(o) and not isinstance(o, type):
+            return asdict(o)
+        return str(o)
+
+
 class FXDemoRunner:
     """
     Comprehensive FX Smart Routing Demo Runner
@@ -87,15 +563,31 @@ class FXDemoRunner:
         self.results: List[DemoResult] = []
         self.universal_engine = None
         self.bridge_engine = None
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_SCENARIOS)
+        self._run_started_at: datetime = datetime.now()
+        self._engines_available = False
         
-    def setup(self):
+    async def setup(self):
         """Initialize demo environment"""
+        # Engine modules pull in heavy dependencies; only import them once a
+        # demo actually runs, so --help and module imports stay stdlib-only
+        try:
+            from app.services.universal_conversion_engine import UniversalConversionEngine
+            from app.services.cbdc_stable_bridge import get_bridge_engine
+            self._engines_available = True
+        except ImportError as e:
+            print(f"⚠️  Warning: Could not import engines: {e}")
+            self._engines_available = False
+        
         self._print_header()
         
-        if ENGINES_AVAILABLE:
+        if self._engines_available:
             try:
-                self.universal_engine = UniversalConversionEngine(self.config_dir)
-                self.bridge_engine = get_bridge_engine(self.config_dir)
+                # Both engines load their config from disk; load them concurrently
+                self.universal_engine, self.bridge_engine = await asyncio.gather(
+                    asyncio.to_thread(UniversalConversionEngine, self.config_dir),
+                    asyncio.to_thread(get_bridge_engine, self.config_dir),
+                )
                 print("✅ Engines initialized successfully")
             except Exception as e:
                 print(f"⚠️  Engine init warning: {e}")
@@ -104,524 +596,160 @@ class FXDemoRunner:
         
     def _print_header(self):
         """Print demo header"""
-        print("\n" + "="*70)
-        print("🚀 FX SMART ROUTING - COMPREHENSIVE DEMO")
-        print("="*70)
-        print(f"""
-┌─────────────────────────────────────────────────────────────────────┐
-│                    UNIVERSAL FX CONVERSION ENGINE                    │
-├─────────────────────────────────────────────────────────────────────┤
-│  Supported Rails:                                                    │
-│    💵 FIAT      : USD, EUR, GBP, INR, SGD, AED, CNY, HKD, THB, JPY  │
-│    🏛️ CBDC      : e-INR, e-CNY, e-HKD, e-THB, e-AED, e-SGD         │
-│    🪙 STABLECOIN: USDC, USDT, EURC, PYUSD, XSGD                     │
-├─────────────────────────────────────────────────────────────────────┤
-│  Conversion Types (9):                                               │
-│    1. FIAT → FIAT         6. STABLECOIN → FIAT                      │
-│    2. FIAT → CBDC         7. STABLECOIN → STABLECOIN                │
-│    3. CBDC → FIAT         8. CBDC → STABLECOIN                      │
-│    4. CBDC → CBDC         9. STABLECOIN → CBDC                      │
-│    5. FIAT → STABLECOIN                                             │
-├─────────────────────────────────────────────────────────────────────┤
-│  Special Features:                                                   │
-│    ⚛️ Atomic Swaps (CBDC ↔ Stablecoin)                              │
-│    🌐 mBridge Cross-Border CBDC                                      │
-│    🔗 Multi-Network Stablecoin Support                               │
-└─────────────────────────────────────────────────────────────────────┘
-""")
-        print(f"📅 Demo Run: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        sys.stdout.write(_HEADER_BANNER)
+        print(f"📅 Demo Run: {self._run_started_at.strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"📁 Config: {self.config_dir}")
         print(f"🎯 Mode: {self.mode.value.upper()}")
         print()
 
-    def get_scenarios(self) -> List[DemoScenario]:
+    def get_scenarios(self) -> Tuple[DemoScenario, ...]:
         """Get demo scenarios based on mode"""
-        all_scenarios = [
-            # ═══════════════════════════════════════════════════════════════
-            # FIAT TO FIAT
-            # ═══════════════════════════════════════════════════════════════
-            DemoScenario(
-                id="F2F-001", name="USD → INR Direct",
-                source="USD", source_type="FIAT",
-                target="INR", target_type="FIAT",
-                amount=Decimal("100000"),
-                description="Standard cross-border FX via SWIFT/Local",
-                category="FIAT_TO_FIAT"
-            ),
-            DemoScenario(
-                id="F2F-002", name="EUR → SGD Cross",
-                source="EUR", source_type="FIAT",
-                target="SGD", target_type="FIAT",
-                amount=Decimal("50000"),
-                description="Cross-rate via USD triangulation",
-                category="FIAT_TO_FIAT"
-            ),
-            DemoScenario(
-                id="F2F-003", name="GBP → AED",
-                source="GBP", source_type="FIAT",
-                target="AED", target_type="FIAT",
-                amount=Decimal("25000"),
-                description="UK to UAE remittance corridor",
-                category="FIAT_TO_FIAT"
-            ),
-            
-            # ═══════════════════════════════════════════════════════════════
-            # FIAT TO CBDC
-            # ═══════════════════════════════════════════════════════════════
-            DemoScenario(
-                id="F2C-001", name="INR → e-INR Mint",
-                source="INR", source_type="FIAT",
-                target="e-INR", target_type="CBDC",
-                amount=Decimal("100000"),
-                description="Direct CBDC minting (same currency)",
-                category="FIAT_TO_CBDC",
-                highlight=True
-            ),
-            DemoScenario(
-                id="F2C-002", name="USD → e-INR",
-                source="USD", source_type="FIAT",
-                target="e-INR", target_type="CBDC",
-                amount=Decimal("10000"),
-                description="FX conversion + CBDC mint",
-                category="FIAT_TO_CBDC"
-            ),
-            DemoScenario(
-                id="F2C-003", name="USD → e-CNY",
-                source="USD", source_type="FIAT",
-                target="e-CNY", target_type="CBDC",
-                amount=Decimal("100000"),
-                description="Cross-border to Chinese Digital Yuan",
-                category="FIAT_TO_CBDC"
-            ),
-            DemoScenario(
-                id="F2C-004", name="EUR → e-AED",
-                source="EUR", source_type="FIAT",
-                target="e-AED", target_type="CBDC",
-                amount=Decimal("50000"),
-                description="Europe to UAE CBDC",
-                category="FIAT_TO_CBDC"
-            ),
-            
-            # ═══════════════════════════════════════════════════════════════
-            # CBDC TO FIAT
-            # ═══════════════════════════════════════════════════════════════
-            DemoScenario(
-                id="C2F-001", name="e-INR → INR Redeem",
-                source="e-INR", source_type="CBDC",
-                target="INR", target_type="FIAT",
-                amount=Decimal("100000"),
-                description="Direct CBDC redemption (same currency)",
-                category="CBDC_TO_FIAT",
-                highlight=True
-            ),
-            DemoScenario(
-                id="C2F-002", name="e-INR → USD",
-                source="e-INR", source_type="CBDC",
-                target="USD", target_type="FIAT",
-                amount=Decimal("500000"),
-                description="CBDC redeem + FX conversion",
-                category="CBDC_TO_FIAT"
-            ),
-            DemoScenario(
-                id="C2F-003", name="e-CNY → EUR",
-                source="e-CNY", source_type="CBDC",
-                target="EUR", target_type="FIAT",
-                amount=Decimal("100000"),
-                description="China CBDC to Euro",
-                category="CBDC_TO_FIAT"
-            ),
-            
-            # ═══════════════════════════════════════════════════════════════
-            # CBDC TO CBDC (mBridge)
-            # ═══════════════════════════════════════════════════════════════
-            DemoScenario(
-                id="C2C-001", name="e-CNY → e-AED (mBridge)",
-                source="e-CNY", source_type="CBDC",
-                target="e-AED", target_type="CBDC",
-                amount=Decimal("500000"),
-                description="mBridge cross-border PvP settlement",
-                category="CBDC_TO_CBDC",
-                highlight=True
-            ),
-            DemoScenario(
-                id="C2C-002", name="e-HKD → e-THB (mBridge)",
-                source="e-HKD", source_type="CBDC",
-                target="e-THB", target_type="CBDC",
-                amount=Decimal("200000"),
-                description="Hong Kong to Thailand CBDC corridor",
-                category="CBDC_TO_CBDC",
-                highlight=True
-            ),
-            DemoScenario(
-                id="C2C-003", name="e-INR → e-SGD (Fiat Bridge)",
-                source="e-INR", source_type="CBDC",
-                target="e-SGD", target_type="CBDC",
-                amount=Decimal("100000"),
-                description="Non-mBridge CBDCs via fiat intermediary",
-                category="CBDC_TO_CBDC"
-            ),
-            
-            # ═══════════════════════════════════════════════════════════════
-            # FIAT TO STABLECOIN
-            # ═══════════════════════════════════════════════════════════════
-            DemoScenario(
-                id="F2S-001", name="USD → USDC (Direct)",
-                source="USD", source_type="FIAT",
-                target="USDC", target_type="STABLECOIN",
-                amount=Decimal("100000"),
-                description="Direct mint via Circle",
-                category="FIAT_TO_STABLECOIN",
-                highlight=True
-            ),
-            DemoScenario(
-                id="F2S-002", name="EUR → EURC",
-                source="EUR", source_type="FIAT",
-                target="EURC", target_type="STABLECOIN",
-                amount=Decimal("50000"),
-                description="Euro to Euro Coin (MiCA compliant)",
-                category="FIAT_TO_STABLECOIN"
-            ),
-            DemoScenario(
-                id="F2S-003", name="SGD → XSGD",
-                source="SGD", source_type="FIAT",
-                target="XSGD", target_type="STABLECOIN",
-                amount=Decimal("100000"),
-                description="Singapore Dollar to XSGD (MAS licensed)",
-                category="FIAT_TO_STABLECOIN"
-            ),
-            DemoScenario(
-                id="F2S-004", name="INR → USDC",
-                source="INR", source_type="FIAT",
-                target="USDC", target_type="STABLECOIN",
-                amount=Decimal("500000"),
-                description="India to USD stablecoin (FX + on-ramp)",
-                category="FIAT_TO_STABLECOIN"
-            ),
-            
-            # ═══════════════════════════════════════════════════════════════
-            # STABLECOIN TO FIAT
-            # ═══════════════════════════════════════════════════════════════
-            DemoScenario(
-                id="S2F-001", name="USDC → USD (Direct)",
-                source="USDC", source_type="STABLECOIN",
-                target="USD", target_type="FIAT",
-                amount=Decimal("100000"),
-                description="Direct redeem via Circle",
-                category="STABLECOIN_TO_FIAT",
-                highlight=True
-            ),
-            DemoScenario(
-                id="S2F-002", name="USDT → INR",
-                source="USDT", source_type="STABLECOIN",
-                target="INR", target_type="FIAT",
-                amount=Decimal("50000"),
-                description="Tether to INR via CEX off-ramp",
-                category="STABLECOIN_TO_FIAT"
-            ),
-            DemoScenario(
-                id="S2F-003", name="EURC → GBP",
-                source="EURC", source_type="STABLECOIN",
-                target="GBP", target_type="FIAT",
-                amount=Decimal("25000"),
-                description="Euro Coin to British Pounds",
-                category="STABLECOIN_TO_FIAT"
-            ),
-            
-            # ═══════════════════════════════════════════════════════════════
-            # STABLECOIN TO STABLECOIN
-            # ═══════════════════════════════════════════════════════════════
-            DemoScenario(
-                id="S2S-001", name="USDC → USDT (DEX)",
-                source="USDC", source_type="STABLECOIN",
-                target="USDT", target_type="STABLECOIN",
-                amount=Decimal("100000"),
-                description="DEX swap on Curve/Uniswap",
-                category="STABLECOIN_TO_STABLECOIN"
-            ),
-            DemoScenario(
-                id="S2S-002", name="USDC → EURC",
-                source="USDC", source_type="STABLECOIN",
-                target="EURC", target_type="STABLECOIN",
-                amount=Decimal("50000"),
-                description="USD to EUR stablecoin swap",
-                category="STABLECOIN_TO_STABLECOIN"
-            ),
-            DemoScenario(
-                id="S2S-003", name="USDT → XSGD",
-                source="USDT", source_type="STABLECOIN",
-                target="XSGD", target_type="STABLECOIN",
-                amount=Decimal("100000"),
-                description="Cross-currency stablecoin conversion",
-                category="STABLECOIN_TO_STABLECOIN"
-            ),
-            
-            # ═══════════════════════════════════════════════════════════════
-            # CBDC TO STABLECOIN (Including Atomic Swaps)
-            # ═══════════════════════════════════════════════════════════════
-            DemoScenario(
-                id="C2S-001", name="e-INR → USDC (Fiat Bridge)",
-                source="e-INR", source_type="CBDC",
-                target="USDC", target_type="STABLECOIN",
-                amount=Decimal("100000"),
-                description="CBDC to stablecoin via fiat intermediary",
-                category="CBDC_TO_STABLECOIN"
-            ),
-            DemoScenario(
-                id="C2S-002", name="e-INR → USDC (Atomic Swap)",
-                source="e-INR", source_type="CBDC",
-                target="USDC", target_type="STABLECOIN",
-                amount=Decimal("50000"),
-                description="⚛️ ATOMIC SWAP - Direct HTLC exchange",
-                category="CBDC_TO_STABLECOIN",
-                highlight=True
-            ),
-            DemoScenario(
-                id="C2S-003", name="e-CNY → USDT (CEX Bridge)",
-                source="e-CNY", source_type="CBDC",
-                target="USDT", target_type="STABLECOIN",
-                amount=Decimal("200000"),
-                description="Chinese CBDC to Tether via CEX",
-                category="CBDC_TO_STABLECOIN"
-            ),
-            DemoScenario(
-                id="C2S-004", name="e-SGD → XSGD (Atomic Swap)",
-                source="e-SGD", source_type="CBDC",
-                target="XSGD", target_type="STABLECOIN",
-                amount=Decimal("100000"),
-                description="⚛️ ATOMIC SWAP - Same-peg atomic exchange",
-                category="CBDC_TO_STABLECOIN",
-                highlight=True
-            ),
-            DemoScenario(
-                id="C2S-005", name="e-AED → USDC (mBridge + Stable)",
-                source="e-AED", source_type="CBDC",
-                target="USDC", target_type="STABLECOIN",
-                amount=Decimal("500000"),
-                description="mBridge CBDC to stablecoin hybrid route",
-                category="CBDC_TO_STABLECOIN"
-            ),
-            
-            # ═══════════════════════════════════════════════════════════════
-            # STABLECOIN TO CBDC (Including Atomic Swaps)
-            # ═══════════════════════════════════════════════════════════════
-            DemoScenario(
-                id="S2C-001", name="USDC → e-INR (Fiat Bridge)",
-                source="USDC", source_type="STABLECOIN",
-                target="e-INR", target_type="CBDC",
-                amount=Decimal("100000"),
-                description="Stablecoin to CBDC via fiat intermediary",
-                category="STABLECOIN_TO_CBDC"
-            ),
-            DemoScenario(
-                id="S2C-002", name="USDC → e-INR (Atomic Swap)",
-                source="USDC", source_type="STABLECOIN",
-                target="e-INR", target_type="CBDC",
-                amount=Decimal("50000"),
-                description="⚛️ ATOMIC SWAP - Direct HTLC exchange",
-                category="STABLECOIN_TO_CBDC",
-                highlight=True
-            ),
-            DemoScenario(
-                id="S2C-003", name="USDT → e-CNY (CEX Bridge)",
-                source="USDT", source_type="STABLECOIN",
-                target="e-CNY", target_type="CBDC",
-                amount=Decimal("100000"),
-                description="Tether to Chinese Digital Yuan",
-                category="STABLECOIN_TO_CBDC"
-            ),
-            DemoScenario(
-                id="S2C-004", name="XSGD → e-SGD (Atomic Swap)",
-                source="XSGD", source_type="STABLECOIN",
-                target="e-SGD", target_type="CBDC",
-                amount=Decimal("100000"),
-                description="⚛️ ATOMIC SWAP - Same-peg atomic exchange",
-                category="STABLECOIN_TO_CBDC",
-                highlight=True
-            ),
-        ]
-        
-        # Filter based on mode
-        if self.mode == DemoMode.QUICK:
-            return [s for s in all_scenarios if s.highlight]
-        elif self.mode == DemoMode.ATOMIC:
-            return [s for s in all_scenarios if "Atomic" in s.description or "ATOMIC" in s.description]
-        elif self.mode == DemoMode.CBDC:
-            return [s for s in all_scenarios if "CBDC" in s.category]
-        elif self.mode == DemoMode.STABLE:
-            return [s for s in all_scenarios if "STABLECOIN" in s.category]
-        else:
-            return all_scenarios
+        return _BY_MODE[self.mode]
+    
+    def get_scenarios_grouped(self) -> Dict[ConversionCategory, Tuple[DemoScenario, ...]]:
+        """Get demo scenarios for the current mode, grouped by category"""
+        return _GROUPED_BY_MODE[self.mode]
     
     async def run_scenario(self, scenario: DemoScenario) -> DemoResult:
+        """Execute a single demo scenario, bounded by the concurrency limit"""
+        async with self._semaphore:
+            return await self._execute_scenario(scenario)
+    
+    async def _execute_scenario(self, scenario: DemoScenario) -> DemoResult:
         """Execute a single demo scenario"""
-        start = time.time()
+        start = _perf_counter_ns()
+        
+        if not self.universal_engine:
+            # Simulation mode
+            return self._simulate_scenario(scenario, start)
+        
+        # Reject unknown currencies up front rather than via engine exceptions
+        for currency in (scenario.source, scenario.target):
+            if currency not in _SUPPORTED_CURRENCIES:
+                return self._failed_result(scenario, start, f"Unsupported currency: {currency}")
         
         try:
-            if self.universal_engine:
-                # Use actual engine
-                routes = await self.universal_engine.find_all_routes(
-                    scenario.source,
-                    scenario.source_type,
-                    scenario.target,
-                    scenario.target_type,
-                    scenario.amount
-                )
-                
-                if routes:
-                    best = routes[0]
-                    return DemoResult(
-                        scenario_id=scenario.id,
-                        scenario_name=scenario.name,
-                        success=True,
-                        routes_found=len(routes),
-                        best_route=best.route_name,
-                        best_fee_bps=best.total_fee_bps,
-                        best_settlement=f"{best.total_settlement_seconds}s",
-                        target_amount=f"{best.target_amount:,.2f}",
-                        execution_ms=(time.time() - start) * 1000
-                    )
-                else:
-                    return DemoResult(
-                        scenario_id=scenario.id,
-                        scenario_name=scenario.name,
-                        success=False,
-                        routes_found=0,
-                        best_route="N/A",
-                        best_fee_bps=0,
-                        best_settlement="N/A",
-                        target_amount="N/A",
-                        execution_ms=(time.time() - start) * 1000,
-                        error="No routes found"
-                    )
-            else:
-                # Simulation mode
-                return self._simulate_scenario(scenario, start)
-                
-        except Exception as e:
-            return DemoResult(
-                scenario_id=scenario.id,
-                scenario_name=scenario.name,
-                success=False,
-                routes_found=0,
-                best_route="N/A",
-                best_fee_bps=0,
-                best_settlement="N/A",
-                target_amount="N/A",
-                execution_ms=(time.time() - start) * 1000,
-                error=str(e)
+            routes = await self.universal_engine.find_all_routes(
+                scenario.source,
+                scenario.source_type,
+                scenario.target,
+                scenario.target_type,
+                Decimal(str(scenario.amount))
             )
-    
-    def _simulate_scenario(self, scenario: DemoScenario, start: float) -> DemoResult:
-        """Simulate scenario result for demo purposes"""
-        import random
+        except (ValueError, KeyError, RuntimeError) as e:
+            return self._failed_result(scenario, start, str(e))
+        except Exception as e:
+            # Unexpected engine errors fail this scenario only, not the whole run
+            logger.exception("Scenario %s failed unexpectedly", scenario.id)
+            return self._failed_result(scenario, start, f"{type(e).__name__}: {e}")
         
-        # Simulated route data based on category
-        sim_data = {
-            "FIAT_TO_FIAT": {"routes": 3, "fee": 20, "time": "4h", "rate": 1.0},
-            "FIAT_TO_CBDC": {"routes": 2, "fee": 0, "time": "5s", "rate": 1.0},
-            "CBDC_TO_FIAT": {"routes": 2, "fee": 0, "time": "5s", "rate": 1.0},
-            "CBDC_TO_CBDC": {"routes": 3, "fee": 13, "time": "15s", "rate": 1.0},
-            "FIAT_TO_STABLECOIN": {"routes": 3, "fee": 0, "time": "1h", "rate": 1.0},
-            "STABLECOIN_TO_FIAT": {"routes": 3, "fee": 25, "time": "4h", "rate": 1.0},
-            "STABLECOIN_TO_STABLECOIN": {"routes": 2, "fee": 30, "time": "30s", "rate": 1.0},
-            "CBDC_TO_STABLECOIN": {"routes": 4, "fee": 35, "time": "1h", "rate": 1.0},
-            "STABLECOIN_TO_CBDC": {"routes": 3, "fee": 50, "time": "4h", "rate": 1.0},
-        }
+        if not routes:
+            return self._failed_result(scenario, start, "No routes found")
         
-        data = sim_data.get(scenario.category, {"routes": 1, "fee": 50, "time": "1h", "rate": 1.0})
+        best = routes[0]
+        return DemoResult(
+            scenario_id=scenario.id,
+            scenario_name=scenario.name,
+            success=True,
+            routes_found=len(routes),
+            best_route=best.route_name,
+            best_fee_bps=best.total_fee_bps,
+            best_settlement=f"{best.total_settlement_seconds}s",
+            target_amount=f"{best.target_amount:,.2f}",
+            execution_ms=(_perf_counter_ns() - start) / 1_000_000
+        )
+    
+    def _failed_result(self, scenario: DemoScenario, start: int, error: str) -> DemoResult:
+        """Build the result for a scenario that produced no route"""
+        return DemoResult(
+            scenario_id=scenario.id,
+            scenario_name=scenario.name,
+            success=False,
+            routes_found=0,
+            best_route="N/A",
+            best_fee_bps=0,
+            best_settlement="N/A",
+            target_amount="N/A",
+            execution_ms=(_perf_counter_ns() - start) / 1_000_000,
+            error=error
+        )
+    
+    def _simulate_scenario(self, scenario: DemoScenario, start: int) -> DemoResult:
+        """Simulate scenario result for demo purposes"""
+        routes, fee, settlement, rate = _SIM_DATA.get(scenario.category, _SIM_DEFAULT)
         
         # Adjust for atomic swaps
-        if "Atomic" in scenario.description:
-            data = {"routes": 1, "fee": 15, "time": "5m", "rate": 1.0}
-        
-        target_amount = float(scenario.amount) * data["rate"] * (1 - data["fee"]/10000)
+        if scenario.is_atomic:
+            routes, fee, settlement, rate = _SIM_ATOMIC
         
-        route_names = {
-            "FIAT_TO_FIAT": "SWIFT Transfer",
-            "FIAT_TO_CBDC": "Direct CBDC Mint",
-            "CBDC_TO_FIAT": "Direct CBDC Redeem",
-            "CBDC_TO_CBDC": "mBridge PvP",
-            "FIAT_TO_STABLECOIN": "Direct Issuer Mint",
-            "STABLECOIN_TO_FIAT": "Direct Issuer Redeem",
-            "STABLECOIN_TO_STABLECOIN": "DEX Swap",
-            "CBDC_TO_STABLECOIN": "Fiat Intermediary",
-            "STABLECOIN_TO_CBDC": "Fiat Intermediary",
-        }
+        target_amount = scenario.amount * rate * (1 - fee/10000)
         
-        route_name = route_names.get(scenario.category, "Standard Route")
-        if "Atomic" in scenario.description:
+        route_name = _CATEGORY_ROUTE_NAMES.get(scenario.category, "Standard Route")
+        if scenario.is_atomic:
             route_name = "Atomic Swap (HTLC)"
         
         return DemoResult(
             scenario_id=scenario.id,
             scenario_name=scenario.name,
             success=True,
-            routes_found=data["routes"],
+            routes_found=routes,
             best_route=route_name,
-            best_fee_bps=data["fee"],
-            best_settlement=data["time"],
+            best_fee_bps=fee,
+            best_settlement=settlement,
             target_amount=f"{target_amount:,.2f}",
-            execution_ms=(time.time() - start) * 1000 + random.uniform(10, 50)
+            execution_ms=(_perf_counter_ns() - start) / 1_000_000 + _uniform(10, 50)
         )
     
     async def run_all(self):
         """Run all demo scenarios"""
-        scenarios = self.get_scenarios()
+        grouped = self.get_scenarios_grouped()
+        scenarios = [s for cat_scenarios in grouped.values() for s in cat_scenarios]
         
         print(f"\n📋 Running {len(scenarios)} scenarios...\n")
         
-        # Group by category
-        categories = {}
-        for s in scenarios:
-            if s.category not in categories:
-                categories[s.category] = []
-            categories[s.category].append(s)
+        if self.universal_engine is None:
+            # Simulation is synchronous; skip coroutine scheduling entirely
+            results = [self._simulate_scenario(s, _perf_counter_ns()) for s in scenarios]
+        else:
+            # Run all scenarios concurrently (gather preserves input order)
+            results = await asyncio.gather(*(self.run_scenario(s) for s in scenarios))
         
-        # Run scenarios by category
-        for category, cat_scenarios in categories.items():
+        # Print results by category; results line up with the flattened groups
+        pending = iter(results)
+        for category, cat_scenarios in grouped.items():
             self._print_category_header(category)
             
             for scenario in cat_scenarios:
-                result = await self.run_scenario(scenario)
+                result = next(pending)
                 self.results.append(result)
                 self._print_result(result, scenario)
+            sys.stdout.flush()
         
         # Print summary
         self._print_summary()
     
-    def _print_category_header(self, category: str):
+    def _print_category_header(self, category: ConversionCategory):
         """Print category header"""
-        icons = {
-            "FIAT_TO_FIAT": "💱",
-            "FIAT_TO_CBDC": "🏛️",
-            "CBDC_TO_FIAT": "💵",
-            "CBDC_TO_CBDC": "🌐",
-            "FIAT_TO_STABLECOIN": "🪙",
-            "STABLECOIN_TO_FIAT": "💰",
-            "STABLECOIN_TO_STABLECOIN": "🔄",
-            "CBDC_TO_STABLECOIN": "🔗",
-            "STABLECOIN_TO_CBDC": "⚡",
-        }
-        icon = icons.get(category, "📦")
+        icon = _CATEGORY_ICONS.get(category, "📦")
         print(f"\n{'─'*70}")
-        print(f"{icon} {category.replace('_', ' ')}")
+        print(f"{icon} {category.name.replace('_', ' ')}")
         print(f"{'─'*70}")
     
     def _print_result(self, result: DemoResult, scenario: DemoScenario):
         """Print scenario result"""
         status = "✅" if result.success else "❌"
         highlight = "⭐ " if scenario.highlight else ""
-        atomic = "⚛️ " if "Atomic" in scenario.description else ""
+        atomic = "⚛️ " if scenario.is_atomic else ""
         
-        print(f"""
+        error = f"   └─ ⚠️ Error: {result.error}\n" if result.error else ""
+        
+        sys.stdout.write(f"""
 {highlight}{atomic}{status} {result.scenario_id}: {result.scenario_name}
    └─ Routes: {result.routes_found} | Best: {result.best_route}
    └─ Fee: {result.best_fee_bps} bps | Settlement: {result.best_settlement}
    └─ Target Amount: {result.target_amount}
-   └─ Execution: {result.execution_ms:.1f}ms""")
-        
-        if result.error:
-            print(f"   └─ ⚠️ Error: {result.error}")
+   └─ Execution: {result.execution_ms:.1f}ms
+{error}""")
     
     def _print_summary(self):
         """Print execution summary"""
@@ -645,28 +773,15 @@ class FXDemoRunner:
 📈 Results by Category:
 """)
         
-        # Group results by category
-        from collections import defaultdict
-        by_category = defaultdict(list)
+        # Count (passed, total) per category in a single pass
+        counts: Dict[str, List[int]] = {}
         for r in self.results:
-            cat = r.scenario_id.split("-")[0]
-            by_category[cat].append(r)
+            slot = counts.setdefault(r.scenario_id.split("-", 1)[0], [0, 0])
+            slot[0] += r.success
+            slot[1] += 1
         
-        cat_names = {
-            "F2F": "Fiat → Fiat",
-            "F2C": "Fiat → CBDC",
-            "C2F": "CBDC → Fiat",
-            "C2C": "CBDC → CBDC",
-            "F2S": "Fiat → Stablecoin",
-            "S2F": "Stablecoin → Fiat",
-            "S2S": "Stablecoin → Stablecoin",
-            "C2S": "CBDC → Stablecoin",
-            "S2C": "Stablecoin → CBDC",
-        }
-        
-        for cat, results in by_category.items():
-            success_count = sum(1 for r in results if r.success)
-            print(f"   {cat_names.get(cat, cat):25s}: {success_count}/{len(results)} passed")
+        for cat, (success_count, cat_total) in counts.items():
+            print(f"   {_CATEGORY_SHORTNAMES.get(cat, cat):25s}: {success_count}/{cat_total} passed")
         
         print(f"""
 {'═'*70}
@@ -677,15 +792,22 @@ class FXDemoRunner:
     def export_results(self, filepath: str = "demo_results.json"):
         """Export results to JSON"""
         output = {
-            "run_date": datetime.now().isoformat(),
+            "run_date": self._run_started_at.isoformat(),
             "mode": self.mode.value,
             "total_scenarios": len(self.results),
             "success_count": sum(1 for r in self.results if r.success),
-            "results": [asdict(r) for r in self.results]
+            "results": self.results
         }
         
-        with open(filepath, "w") as f:
-            json.dump(output, f, indent=2, default=str)
+        if ORJSON_AVAILABLE:
+            # orjson serializes dataclasses natively
+            with open(filepath, "wb") as f:
+                f.write(orjson.dumps(output, default=str, option=orjson.OPT_INDENT_2))
+        else:
+            # json.dump encodes incrementally; each result becomes a dict only
+            # when the encoder reaches it
+            with open(filepath, "w") as f:
+                json.dump(output, f, indent=2, cls=_DataclassEncoder)
         
         print(f"📁 Results exported to: {filepath}")
 
@@ -719,7 +841,7 @@ async def main():
         mode=DemoMode(args.mode)
     )
     
-    demo.setup()
+    await demo.setup()
     await demo.run_all()
     
     if args.export:
@@ -727,4 +849,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop  # Optional: lower per-await overhead than the default loop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -1,78 +1,243 @@
 """
 FX MCP Client - CLI Interface
 Connects to MCP server and uses Claude for tool orchestration
+
+Usage:
+    python fx_mcp_client.py                             # interactive chat
+    python fx_mcp_client.py --queries FILE              # answer one query per line, concurrently
+    python fx_mcp_client.py --queries FILE --batch      # same, via the Message Batches API (offline)
 """
-import subprocess
+import argparse
+import asyncio
+import hashlib
 import json
 import sys
+import time
+from collections import OrderedDict
 import anthropic
 
 # Initialize Anthropic client
-client = anthropic.Anthropic()
+client = anthropic.AsyncAnthropic()
+
+# Claude model settings
+MODEL = "claude-sonnet-4-20250514"
+MAX_TOKENS = 4096
+
+# Conversation history kept per session (oldest exchanges are dropped first)
+MAX_HISTORY_MESSAGES = 40
+
+# Message Batches (offline) mode
+BATCH_POLL_SECONDS = 30
+BATCH_MAX_ROUNDS = 5
+
+# Anthropic rate limiting (kept at ~80% of a Tier 1 quota)
+MAX_CONCURRENT_REQUESTS = 40
+TOKENS_PER_MINUTE = 32_000
+
+# OS pipe capacity for the server's stdio; large route responses exceed the 64 KB default
+MCP_PIPE_SIZE = 1024 * 1024
+# Longest response line the stream reader accepts
+MCP_READ_LIMIT = 16 * 1024 * 1024
+
+# Tool result cache (read-only tools only): key -> (stored_at, text)
+CACHEABLE_TOOLS = frozenset({
+    "fx_get_rate",
+    "fx_list_cbdc",
+    "fx_list_stablecoins",
+    "fx_list_providers",
+    "fx_list_customer_tiers",
+    "fx_list_routing_objectives",
+})
+TOOL_CACHE_MAXSIZE = 256
+TOOL_CACHE_TTL_SECONDS = 300
+_tool_cache = OrderedDict()
+
+class MCPClient:
+    """Async JSON-RPC client for the MCP server over stdio.
+    
+    A single background task reads responses and resolves the pending
+    request with the matching id, so several tool calls can be in flight.
+    """
+    
+    def __init__(self):
+        self.process = None
+        self._pending: dict[int, asyncio.Future] = {}
+        self._next_id = 0
+        self._reader_task = None
+    
+    async def start(self, script: str = "app/fx_mcp_api_server.py"):
+        """Start the MCP server as subprocess"""
+        self.process = await asyncio.create_subprocess_exec(
+            sys.executable, script,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            limit=MCP_READ_LIMIT,
+            pipesize=MCP_PIPE_SIZE
+        )
+        self._reader_task = asyncio.create_task(self._read_responses())
+    
+    async def _read_responses(self):
+        """Dispatch each response line to the request waiting on its id"""
+        try:
+            while True:
+                line = await self.process.stdout.readline()
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                except json.JSONDecodeError:
+                    # Stray log or banner output on stdout; not a JSON-RPC message
+                    continue
+                if not isinstance(message, dict):
+                    continue
+                future = self._pending.pop(message.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(message)
+        finally:
+            # Reader is exiting (EOF, error or close); release anyone still waiting
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_result({})
+            self._pending.clear()
+    
+    def _register(self) -> tuple[int, asyncio.Future]:
+        """Allocate a request id and the future its response will resolve"""
+        self._next_id += 1
+        future = asyncio.get_running_loop().create_future()
+        self._pending[self._next_id] = future
+        return self._next_id, future
+    
+    async def _write(self, message: dict):
+        self.process.stdin.write(json.dumps(message).encode() + b"\n")
+        await self.process.stdin.drain()
+    
+    async def request(self, method: str, params: dict = None) -> dict:
+        """Send a JSON-RPC request and wait for its response"""
+        if self._reader_task is not None and self._reader_task.done():
+            # Server already went away; nothing would ever answer
+            return {}
+        request_id, future = self._register()
+        await self._write({
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": method,
+            "params": params or {}
+        })
+        return await future
+    
+    async def notify(self, method: str, params: dict = None):
+        """Send a JSON-RPC notification (no response expected)"""
+        await self._write({
+            "jsonrpc": "2.0",
+            "method": method,
+            "params": params or {}
+        })
+    
+    async def close(self):
+        """Stop the reader and terminate the server"""
+        if self._reader_task:
+            self._reader_task.cancel()
+        if self.process and self.process.returncode is None:
+            self.process.terminate()
+            await self.process.wait()
 
-# MCP Server process
-mcp_process = None
 
-def start_mcp_server():
+# MCP Server connection
+mcp_client = MCPClient()
+
+async def start_mcp_server():
     """Start the MCP server as subprocess"""
-    global mcp_process
-    mcp_process = subprocess.Popen(
-        [sys.executable, "app/fx_mcp_api_server.py"],
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        bufsize=1
-    )
+    await mcp_client.start()
     print("MCP Server started")
 
-def send_mcp_request(method: str, params: dict = None) -> dict:
+async def send_mcp_request(method: str, params: dict = None) -> dict:
     """Send JSON-RPC request to MCP server"""
-    request = {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": method,
-        "params": params or {}
-    }
-    
-    mcp_process.stdin.write(json.dumps(request) + "\n")
-    mcp_process.stdin.flush()
-    
-    response_line = mcp_process.stdout.readline()
-    if response_line:
-        return json.loads(response_line)
-    return {}
+    return await mcp_client.request(method, params)
 
-def initialize_mcp():
+async def initialize_mcp():
     """Initialize MCP connection"""
-    response = send_mcp_request("initialize", {
+    response = await send_mcp_request("initialize", {
         "protocolVersion": "2024-11-05",
         "capabilities": {},
         "clientInfo": {"name": "fx-cli-client", "version": "1.0.0"}
     })
     
     # Send initialized notification
-    send_mcp_request("notifications/initialized")
+    await mcp_client.notify("notifications/initialized")
     return response
 
-def list_tools() -> list:
+async def list_tools() -> list:
     """Get list of available tools"""
-    response = send_mcp_request("tools/list")
+    response = await send_mcp_request("tools/list")
     return response.get("result", {}).get("tools", [])
 
-def call_tool(name: str, arguments: dict) -> str:
-    """Call an MCP tool"""
-    response = send_mcp_request("tools/call", {
-        "name": name,
-        "arguments": arguments
-    })
-    
+def _tool_cache_key(name: str, arguments: dict) -> str:
+    """Cache key from tool name and canonicalised arguments"""
+    digest = hashlib.sha256(json.dumps(arguments, sort_keys=True).encode()).hexdigest()
+    return f"{name}:{digest}"
+
+def _get_cached_tool_result(key: str):
+    """Return a cached tool result if present and not expired"""
+    entry = _tool_cache.get(key)
+    if entry is None:
+        return None
+    stored_at, text = entry
+    if time.monotonic() - stored_at > TOOL_CACHE_TTL_SECONDS:
+        del _tool_cache[key]
+        return None
+    _tool_cache.move_to_end(key)
+    return text
+
+def _cache_tool_result(key: str, text: str):
+    """Store a tool result, evicting the least recently used entry when full"""
+    _tool_cache[key] = (time.monotonic(), text)
+    _tool_cache.move_to_end(key)
+    if len(_tool_cache) > TOOL_CACHE_MAXSIZE:
+        _tool_cache.popitem(last=False)
+
+def flush_tool_cache():
+    """Drop all cached tool results"""
+    _tool_cache.clear()
+
+def _tool_result_text(name: str, arguments: dict, response: dict) -> str:
+    """Extract the text of a tools/call response, caching it when allowed"""
     result = response.get("result", {})
     content = result.get("content", [])
     
     if content and len(content) > 0:
-        return content[0].get("text", "")
-    return json.dumps(result)
+        text = content[0].get("text", "")
+    else:
+        text = json.dumps(result)
+    
+    # Never cache errors (JSON-RPC, tool-level, or API errors relayed by the server)
+    if (name in CACHEABLE_TOOLS and "error" not in response and not result.get("isError")
+            and not text.lstrip().startswith('{"error"')):
+        _cache_tool_result(_tool_cache_key(name, arguments), text)
+    return text
+
+async def call_tools(calls: list[tuple[str, dict]]) -> list[str]:
+    """Call several MCP tools, sending all cache misses concurrently"""
+    results: list = [None] * len(calls)
+    misses = []
+    for i, (name, arguments) in enumerate(calls):
+        if name in CACHEABLE_TOOLS:
+            results[i] = _get_cached_tool_result(_tool_cache_key(name, arguments))
+        if results[i] is None:
+            misses.append(i)
+    
+    if misses:
+        responses = await asyncio.gather(*(
+            send_mcp_request("tools/call", {"name": calls[i][0], "arguments": calls[i][1]})
+            for i in misses
+        ))
+        for i, response in zip(misses, responses):
+            results[i] = _tool_result_text(calls[i][0], calls[i][1], response)
+    return results
+
+async def call_tool(name: str, arguments: dict) -> str:
+    """Call an MCP tool"""
+    return (await call_tools([(name, arguments)]))[0]
 
 def get_tools_for_claude(tools: list) -> list:
     """Convert MCP tools to Claude tool format"""
@@ -83,6 +248,9 @@ def get_tools_for_claude(tools: list) -> list:
             "description": tool.get("description", ""),
             "input_schema": tool.get("inputSchema", {"type": "object", "properties": {}})
         })
+    # Cache breakpoint on the last tool caches the whole tool schema block
+    if claude_tools:
+        claude_tools[-1]["cache_control"] = CACHE_CONTROL
     return claude_tools
 
 # System prompt
@@ -98,84 +266,284 @@ You have access to tools to help users with:
 
 Always use the tools to get accurate, real-time data. Be concise and helpful."""
 
+# Prompt caching: the system prompt and tool schemas are identical on every
+# request, so mark them as cacheable and only pay for them once per session
+CACHE_CONTROL = {"type": "ephemeral"}
+SYSTEM_BLOCKS = [{"type": "text", "text": SYSTEM_PROMPT, "cache_control": CACHE_CONTROL}]
+
 
-def chat(user_message: str, tools: list, conversation_history: list) -> str:
-    """Process user message with Claude"""
+def _with_cache_breakpoint(messages: list) -> list:
+    """Copy of messages with a cache breakpoint on the final block.
+    
+    The conversation so far then becomes a cached prefix for the next request.
+    The last message is always a user turn (text or tool results).
+    """
+    last = messages[-1]
+    content = last["content"]
+    blocks = [{"type": "text", "text": content}] if isinstance(content, str) else list(content)
+    blocks[-1] = {**blocks[-1], "cache_control": CACHE_CONTROL}
+    return messages[:-1] + [{**last, "content": blocks}]
+
+
+class TokenBucket:
+    """Tokens-per-minute limiter.
+    
+    Usage is charged after each response; new requests wait while the
+    bucket is in debt, so bursts are allowed but the average rate is capped.
+    """
+    
+    def __init__(self, tokens_per_minute: int):
+        self.capacity = tokens_per_minute
+        self.rate = tokens_per_minute / 60
+        self.tokens = float(tokens_per_minute)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    async def wait(self):
+        """Wait until the bucket is out of debt"""
+        async with self._lock:
+            self._refill()
+            if self.tokens < 0:
+                await asyncio.sleep(-self.tokens / self.rate)
+                self._refill()
+    
+    def consume(self, tokens: int):
+        """Charge tokens used by a completed request"""
+        self._refill()
+        self.tokens -= tokens
+
+
+_request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+_token_bucket = TokenBucket(TOKENS_PER_MINUTE)
+
+
+def _trim_history(history: list, max_messages: int = MAX_HISTORY_MESSAGES):
+    """Drop the oldest exchanges so at most max_messages remain.
+    
+    Trims in place and always cuts at a plain user message, so no
+    tool_result is left without its tool_use. The current exchange is
+    never split, even if it alone exceeds the limit.
+    """
+    if len(history) <= max_messages:
+        return
+    starts = [i for i, msg in enumerate(history)
+              if msg["role"] == "user" and isinstance(msg["content"], str)]
+    if not starts:
+        return
+    cut = next((i for i in starts if i >= len(history) - max_messages), starts[-1])
+    del history[:cut]
+
+
+def _assistant_message(response) -> dict:
+    """History entry for a Claude reply, with content blocks stored as plain dicts"""
+    return {"role": "assistant", "content": [block.model_dump(exclude_unset=True) for block in response.content]}
+
+
+def _message_params(claude_tools: list, conversation_history: list) -> dict:
+    """Request parameters for the next Claude turn of a conversation"""
+    return {
+        "model": MODEL,
+        "max_tokens": MAX_TOKENS,
+        "system": SYSTEM_BLOCKS,
+        "tools": claude_tools,
+        "messages": _with_cache_breakpoint(conversation_history)
+    }
+
+
+def _tool_results(tool_blocks: list, results: list) -> list:
+    """tool_result blocks answering a turn's tool_use blocks"""
+    return [
+        {
+            "type": "tool_result",
+            "tool_use_id": block.id,
+            "content": result
+        }
+        for block, result in zip(tool_blocks, results)
+    ]
+
+
+async def _create_message(claude_tools: list, conversation_history: list):
+    """Send the conversation to Claude"""
+    async with _request_slots:
+        await _token_bucket.wait()
+        response = await client.messages.create(**_message_params(claude_tools, conversation_history))
+    _token_bucket.consume(response.usage.input_tokens + response.usage.output_tokens)
+    return response
+
+
+async def chat(user_message: str, claude_tools: list, conversation_history: list) -> str:
+    """Process user message with Claude (claude_tools from get_tools_for_claude)"""
     
-    claude_tools = get_tools_for_claude(tools)
     conversation_history.append({"role": "user", "content": user_message})
+    _trim_history(conversation_history)
     
-    response = client.messages.create(
-        model="claude-sonnet-4-20250514",
-        max_tokens=4096,
-        system=SYSTEM_PROMPT,
-        tools=claude_tools,
-        messages=conversation_history
-    )
+    response = await _create_message(claude_tools, conversation_history)
     
     # Handle tool use
     while response.stop_reason == "tool_use":
-        tool_results = []
-        assistant_content = response.content
+        tool_blocks = [block for block in response.content if block.type == "tool_use"]
         
-        for block in response.content:
-            if block.type == "tool_use":
-                print(f"\n[Calling tool: {block.name}]")
-                
-                # Call MCP tool
-                result = call_tool(block.name, block.input)
-                print(f"[Tool result received]")
-                
-                tool_results.append({
-                    "type": "tool_result",
-                    "tool_use_id": block.id,
-                    "content": result
-                })
+        for block in tool_blocks:
+            print(f"\n[Calling tool: {block.name}]")
         
-        conversation_history.append({"role": "assistant", "content": assistant_content})
-        conversation_history.append({"role": "user", "content": tool_results})
+        # Call this turn's MCP tools concurrently; results keep block order
+        results = await call_tools([(block.name, block.input) for block in tool_blocks])
+        print(f"[Tool results received: {len(results)}]")
         
-        response = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=4096,
-            system=SYSTEM_PROMPT,
-            tools=claude_tools,
-            messages=conversation_history
-        )
+        conversation_history.append(_assistant_message(response))
+        conversation_history.append({"role": "user", "content": _tool_results(tool_blocks, results)})
+        _trim_history(conversation_history)
+        
+        response = await _create_message(claude_tools, conversation_history)
     
     # Extract final response
-    final_response = ""
-    for block in response.content:
-        if hasattr(block, "text"):
-            final_response += block.text
+    final_response = "".join(block.text for block in response.content if block.type == "text")
     
-    conversation_history.append({"role": "assistant", "content": response.content})
+    conversation_history.append(_assistant_message(response))
     return final_response
 
 
-def main():
+async def chat_many(queries: list[str], claude_tools: list) -> list:
+    """Answer independent queries concurrently, each in its own conversation.
+    
+    Failed queries come back as the exception instead of aborting the batch.
+    """
+    return await asyncio.gather(
+        *(chat(query, claude_tools, []) for query in queries),
+        return_exceptions=True
+    )
+
+
+async def _run_message_batch(params_by_id: dict) -> dict:
+    """Submit one Message Batch, wait for it to end, and return results by custom_id"""
+    batch = await client.messages.batches.create(requests=[
+        {"custom_id": custom_id, "params": params}
+        for custom_id, params in params_by_id.items()
+    ])
+    while batch.processing_status != "ended":
+        await asyncio.sleep(BATCH_POLL_SECONDS)
+        batch = await client.messages.batches.retrieve(batch.id)
+    
+    results = {}
+    async for entry in await client.messages.batches.results(batch.id):
+        results[entry.custom_id] = entry.result
+    return results
+
+
+async def batch_chat(queries: list[str], claude_tools: list) -> list[str]:
+    """Answer independent queries through the Message Batches API.
+    
+    For offline workloads (e.g. re-pricing stored routing queries): about half
+    the cost of interactive calls and outside the per-minute limits, but not
+    real-time. Tool use is resolved between rounds: each round's tool_use
+    replies are answered locally via MCP and resubmitted as the next batch.
+    """
+    histories = {f"q{i}": [{"role": "user", "content": query}] for i, query in enumerate(queries)}
+    answers = {}
+    pending = list(histories)
+    
+    for _ in range(BATCH_MAX_ROUNDS):
+        if not pending:
+            break
+        results = await _run_message_batch({
+            custom_id: _message_params(claude_tools, histories[custom_id])
+            for custom_id in pending
+        })
+        
+        tool_turns = []
+        for custom_id in pending:
+            result = results.get(custom_id)
+            if result is None or result.type != "succeeded":
+                answers[custom_id] = f"Error: batch request {result.type if result else 'missing'}"
+                continue
+            message = result.message
+            histories[custom_id].append(_assistant_message(message))
+            if message.stop_reason == "tool_use":
+                tool_turns.append((custom_id, [block for block in message.content if block.type == "tool_use"]))
+            else:
+                answers[custom_id] = "".join(block.text for block in message.content if block.type == "text")
+        
+        # Run every query's tool calls locally, in parallel, before the next round
+        outputs = await asyncio.gather(*(
+            call_tools([(block.name, block.input) for block in tool_blocks])
+            for _, tool_blocks in tool_turns
+        ))
+        for (custom_id, tool_blocks), results in zip(tool_turns, outputs):
+            histories[custom_id].append({"role": "user", "content": _tool_results(tool_blocks, results)})
+        pending = [custom_id for custom_id, _ in tool_turns]
+    
+    for custom_id in pending:
+        answers[custom_id] = f"Error: still calling tools after {BATCH_MAX_ROUNDS} rounds"
+    return [answers[f"q{i}"] for i in range(len(queries))]
+
+
+def _read_queries(path: str) -> list[str]:
+    """Non-empty lines of a query file, one query per line"""
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+async def answer_queries(queries: list[str], claude_tools: list, use_batch: bool = False) -> list[str]:
+    """Answer independent queries, concurrently or through the Message Batches API"""
+    if use_batch:
+        return await batch_chat(queries, claude_tools)
+    answers = await chat_many(queries, claude_tools)
+    return [f"Error: {a}" if isinstance(a, Exception) else a for a in answers]
+
+
+def _parse_args(argv: list = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="FX Smart Routing Agent - MCP Client")
+    parser.add_argument("--queries", metavar="FILE",
+                        help="answer the queries in FILE (one per line) instead of starting a chat")
+    parser.add_argument("--batch", action="store_true",
+                        help="with --queries, use the Message Batches API (cheaper, not real-time)")
+    args = parser.parse_args(argv)
+    if args.batch and not args.queries:
+        parser.error("--batch requires --queries")
+    return args
+
+
+async def main(argv: list = None):
+    args = _parse_args(argv)
+    
     print("=" * 60)
     print("FX Smart Routing Agent - MCP Client")
     print("=" * 60)
     
     # Start MCP server
     print("\nStarting MCP server...")
-    start_mcp_server()
+    await start_mcp_server()
     
     # Initialize
     print("Initializing MCP connection...")
-    initialize_mcp()
+    await initialize_mcp()
     
     # Get tools
     print("Loading tools...")
-    tools = list_tools()
+    tools = await list_tools()
+    # Tool list is fixed for the session; convert it to Claude's format once
+    claude_tools = get_tools_for_claude(tools)
     print(f"Loaded {len(tools)} tools:")
     for t in tools:
         print(f"  - {t['name']}")
     
+    if args.queries:
+        queries = _read_queries(args.queries)
+        print(f"\nAnswering {len(queries)} queries{' via Message Batches' if args.batch else ''}...")
+        answers = await answer_queries(queries, claude_tools, use_batch=args.batch)
+        for query, answer in zip(queries, answers):
+            print(f"\nQ: {query}\nA: {answer}")
+        await mcp_client.close()
+        return
+    
     print("\n" + "=" * 60)
     print("Ready! Ask me about FX rates, routes, CBDCs, stablecoins...")
-    print("Type 'quit' to exit, 'tools' to list tools")
+    print("Type 'quit' to exit, 'tools' to list tools, 'flush-cache' to clear cached tool results")
     print("=" * 60 + "\n")
     
     conversation_history = []
@@ -191,6 +559,11 @@ def main():
                 print("\nGoodbye!")
                 break
             
+            if user_input.lower() == "flush-cache":
+                flush_tool_cache()
+                print("\nTool result cache cleared.\n")
+                continue
+            
             if user_input.lower() == "tools":
                 print("\nAvailable tools:")
                 for t in tools:
@@ -199,7 +572,7 @@ def main():
                 continue
             
             print("\nAgent: ", end="")
-            response = chat(user_input, tools, conversation_history)
+            response = await chat(user_input, claude_tools, conversation_history)
             print(response)
             print()
             
@@ -211,9 +584,8 @@ def main():
             print("Please try again.\n")
     
     # Cleanup
-    if mcp_process:
-        mcp_process.terminate()
+    await mcp_client.close()
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
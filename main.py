@@ -18,22 +18,50 @@ Comprehensive FX routing system supporting:
 8. CBDC ↔ STABLECOIN
 9. STABLECOIN ↔ CBDC
 """
+import atexit
 import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
+import json
+import os
+import secrets
 import time
-import uuid
 
-# Configure logging
+try:
+    import orjson  # noqa: F401
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Configure logging: handlers only enqueue records; a listener thread formats them
+# and writes to stderr, so request paths never block on I/O. The listener runs from
+# import (not lifespan) so the queue is drained even when lifespan never runs.
+_log_queue: queue.Queue = queue.Queue(-1)
+_log_stream_handler = logging.StreamHandler(sys.stderr)
+_log_stream_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+)
+_log_listener = QueueListener(_log_queue, _log_stream_handler, respect_handler_level=True)
+_log_queue_handler = QueueHandler(_log_queue)
+_log_queue_handler.setFormatter(logging.Formatter('%(message)s'))
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    handlers=[_log_queue_handler]
 )
+_log_listener.start()
+# Stop at interpreter exit so queued records are flushed
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
+# Request ID generator (64-bit random hex), bound once for the middleware
+_token_hex = secrets.token_hex
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -42,8 +70,11 @@ async def lifespan(app: FastAPI):
     logger.info("📊 Supported conversions: 9 types")
     logger.info("🏛️ CBDCs: e-INR, e-CNY, e-HKD, e-THB, e-AED, e-SGD")
     logger.info("🪙 Stablecoins: USDC, USDT, EURC, PYUSD, XSGD")
-    yield
-    logger.info("👋 Shutting down FX Smart Routing Engine...")
+    logger.info("🌐 CORS allowed origins: %s", ", ".join(sorted(ALLOWED_ORIGINS)))
+    try:
+        yield
+    finally:
+        logger.info("👋 Shutting down FX Smart Routing Engine...")
 
 
 # Create FastAPI app
@@ -78,32 +109,49 @@ app = FastAPI(
     - Settlement time optimization
     """,
     version="2.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
 )
 
 # CORS middleware
+# Credentialed requests need an explicit origin list ("*" is rejected by browsers).
+# Local UI dev servers are allowed by default; deployments add theirs via
+# CORS_ALLOWED_ORIGINS (comma-separated).
+ALLOWED_ORIGINS = frozenset({
+    "http://localhost:3000",
+    "http://localhost:5173",
+    "http://127.0.0.1:3000",
+    "http://127.0.0.1:5173",
+}) | frozenset(
+    origin.strip()
+    for origin in os.environ.get("CORS_ALLOWED_ORIGINS", "").split(",")
+    if origin.strip()
+)
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=sorted(ALLOWED_ORIGINS),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,
 )
 
 
 # Request ID middleware
 @app.middleware("http")
 async def add_request_id(request: Request, call_next):
-    request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
-    start_time = time.time()
+    request_id = request.headers.get("X-Request-ID") or _token_hex(8)
+    start_time = time.perf_counter()
     
     response = await call_next(request)
     
-    process_time = time.time() - start_time
+    process_time = time.perf_counter() - start_time
     response.headers["X-Request-ID"] = request_id
     response.headers["X-Process-Time"] = str(process_time)
     
-    logger.info(f"{request.method} {request.url.path} - {response.status_code} - {process_time:.3f}s")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("%s %s - %d - %.3fs", request.method, request.url.path, response.status_code, process_time)
     
     return response
 
@@ -128,74 +176,87 @@ app.include_router(multi_rail_router)
 app.include_router(universal_router)
 
 
+def _json_bytes(payload: dict) -> bytes:
+    """Encode a static payload once, exactly as JSONResponse would render it"""
+    return json.dumps(
+        payload, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
 # Root endpoint
+_ROOT_PAYLOAD = _json_bytes({
+    "service": "FX Smart Routing Engine",
+    "version": "2.0.0",
+    "description": "Universal FX routing across Fiat, CBDC, and Stablecoin",
+    "endpoints": {
+        "smart_routing": "/api/v1/fx/routing/recommend",
+        "multi_rail": "/api/v1/fx/multi-rail/route",
+        "universal": "/api/v1/fx/universal/convert",
+        "docs": "/docs",
+        "redoc": "/redoc"
+    },
+    "supported_conversions": [
+        "FIAT_TO_FIAT",
+        "FIAT_TO_CBDC",
+        "CBDC_TO_FIAT",
+        "CBDC_TO_CBDC",
+        "FIAT_TO_STABLECOIN",
+        "STABLECOIN_TO_FIAT",
+        "STABLECOIN_TO_STABLECOIN",
+        "CBDC_TO_STABLECOIN",
+        "STABLECOIN_TO_CBDC"
+    ]
+})
+
 @app.get("/", tags=["Root"])
 async def root():
     """Welcome endpoint with API overview"""
-    return {
-        "service": "FX Smart Routing Engine",
-        "version": "2.0.0",
-        "description": "Universal FX routing across Fiat, CBDC, and Stablecoin",
-        "endpoints": {
-            "smart_routing": "/api/v1/fx/routing/recommend",
-            "multi_rail": "/api/v1/fx/multi-rail/route",
-            "universal": "/api/v1/fx/universal/convert",
-            "docs": "/docs",
-            "redoc": "/redoc"
-        },
-        "supported_conversions": [
-            "FIAT_TO_FIAT",
-            "FIAT_TO_CBDC",
-            "CBDC_TO_FIAT",
-            "CBDC_TO_CBDC",
-            "FIAT_TO_STABLECOIN",
-            "STABLECOIN_TO_FIAT",
-            "STABLECOIN_TO_STABLECOIN",
-            "CBDC_TO_STABLECOIN",
-            "STABLECOIN_TO_CBDC"
-        ]
-    }
+    return Response(content=_ROOT_PAYLOAD, media_type="application/json")
 
 
 # Health check
+_HEALTH_PAYLOAD = _json_bytes({
+    "status": "healthy",
+    "service": "FX Smart Routing Engine",
+    "version": "2.0.0",
+    "components": {
+        "smart_routing": "operational",
+        "multi_rail": "operational",
+        "universal_conversion": "operational"
+    }
+})
+
 @app.get("/health", tags=["Health"])
 async def health_check():
     """Overall health check"""
-    return {
-        "status": "healthy",
-        "service": "FX Smart Routing Engine",
-        "version": "2.0.0",
-        "components": {
-            "smart_routing": "operational",
-            "multi_rail": "operational",
-            "universal_conversion": "operational"
-        }
-    }
+    return Response(content=_HEALTH_PAYLOAD, media_type="application/json")
 
 
 # API summary
+_API_INFO_PAYLOAD = _json_bytes({
+    "api_version": "v1",
+    "capabilities": {
+        "fiat_currencies": ["USD", "EUR", "GBP", "INR", "SGD", "AED", "CNY", "HKD", "THB", "JPY"],
+        "cbdc_currencies": ["e-INR", "e-CNY", "e-HKD", "e-THB", "e-AED", "e-SGD"],
+        "stablecoins": ["USDC", "USDT", "EURC", "PYUSD", "XSGD"],
+        "mbridge_participants": ["e-CNY", "e-HKD", "e-THB", "e-AED"],
+        "stablecoin_networks": ["ETHEREUM", "POLYGON", "SOLANA", "TRON", "AVALANCHE"]
+    },
+    "features": {
+        "multi_provider_routing": True,
+        "treasury_integration": True,
+        "customer_tier_pricing": True,
+        "cbdc_support": True,
+        "stablecoin_bridge": True,
+        "atomic_settlement": True,
+        "compliance_scoring": True
+    }
+})
+
 @app.get("/api", tags=["API Info"])
 async def api_info():
     """API information and capabilities"""
-    return {
-        "api_version": "v1",
-        "capabilities": {
-            "fiat_currencies": ["USD", "EUR", "GBP", "INR", "SGD", "AED", "CNY", "HKD", "THB", "JPY"],
-            "cbdc_currencies": ["e-INR", "e-CNY", "e-HKD", "e-THB", "e-AED", "e-SGD"],
-            "stablecoins": ["USDC", "USDT", "EURC", "PYUSD", "XSGD"],
-            "mbridge_participants": ["e-CNY", "e-HKD", "e-THB", "e-AED"],
-            "stablecoin_networks": ["ETHEREUM", "POLYGON", "SOLANA", "TRON", "AVALANCHE"]
-        },
-        "features": {
-            "multi_provider_routing": True,
-            "treasury_integration": True,
-            "customer_tier_pricing": True,
-            "cbdc_support": True,
-            "stablecoin_bridge": True,
-            "atomic_settlement": True,
-            "compliance_scoring": True
-        }
-    }
+    return Response(content=_API_INFO_PAYLOAD, media_type="application/json")
 
 
 if __name__ == "__main__":
@@ -4,9 +4,11 @@ Multi-Rail FX Routing API
 REST API endpoints for multi-rail routing (Fiat + CBDC + Stablecoin).
 """
 import logging
-from datetime import datetime
+import time
+from datetime import datetime, timezone
+from decimal import Decimal
 from fastapi import APIRouter, HTTPException, Depends, Query
-from typing import Optional
+from typing import Callable, Dict, Optional, Tuple
 
 from app.models.multi_rail_models import (
     MultiRailRoutingRequest,
@@ -21,6 +23,11 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/fx/multi-rail", tags=["Multi-Rail Routing"])
 
+# Reference data only changes on config reload, so payloads are cached per endpoint;
+# a reload is picked up once the TTL expires
+REFDATA_CACHE_TTL_SECONDS = 300
+_refdata_cache: Dict[str, Tuple[float, dict]] = {}
+
 
 def get_engine() -> MultiRailRoutingEngine:
     """Dependency to get multi-rail engine"""
@@ -33,7 +40,8 @@ def get_engine() -> MultiRailRoutingEngine:
 
 @router.post(
     "/route",
-    response_model=MultiRailRoutingResponse,
+    response_model=None,
+    responses={200: {"model": MultiRailRoutingResponse}},
     summary="Get Multi-Rail Route Recommendation",
     description="""
     Get intelligent routing recommendation across all available rails:
@@ -91,55 +99,59 @@ async def get_multi_rail_route(
 async def quick_compare(
     source: str,
     target: str,
-    amount: float = Query(default=10000, gt=0),
+    amount: Decimal = Query(default=Decimal("10000"), gt=0),
     engine: MultiRailRoutingEngine = Depends(get_engine)
 ):
     """
     Quick comparison of routes for a currency pair.
     """
-    from decimal import Decimal
-    
+    source = source.upper()
+    target = target.upper()
     request = MultiRailRoutingRequest(
-        source_currency=source.upper(),
-        target_currency=target.upper(),
-        source_amount=Decimal(str(amount)),
+        source_currency=source,
+        target_currency=target,
+        source_amount=amount,
         rail_preference=RailPreference.AUTO
     )
     
     try:
         result = await engine.get_multi_rail_route(request)
+        fiat_best = result.fiat_routes[0] if result.fiat_routes else None
+        cbdc_best = result.cbdc_routes[0] if result.cbdc_routes else None
+        stablecoin_best = result.stablecoin_routes[0] if result.stablecoin_routes else None
+        recommended = result.recommended_route
         
         return {
-            "currency_pair": f"{source.upper()}/{target.upper()}",
-            "amount": amount,
+            "currency_pair": f"{source}/{target}",
+            "amount": float(amount),
             "rails_available": result.rails_evaluated,
             "comparison": {
                 "fiat": {
                     "available": result.fiat_available,
                     "routes": len(result.fiat_routes),
-                    "best_rate": float(result.fiat_routes[0].effective_rate) if result.fiat_routes else None,
-                    "best_time_hours": result.fiat_routes[0].total_settlement_seconds / 3600 if result.fiat_routes else None
+                    "best_rate": float(fiat_best.effective_rate) if fiat_best else None,
+                    "best_time_hours": fiat_best.total_settlement_seconds / 3600 if fiat_best else None
                 },
                 "cbdc": {
                     "available": result.cbdc_available,
                     "routes": len(result.cbdc_routes),
-                    "best_rate": float(result.cbdc_routes[0].effective_rate) if result.cbdc_routes else None,
-                    "best_time_seconds": result.cbdc_routes[0].total_settlement_seconds if result.cbdc_routes else None
+                    "best_rate": float(cbdc_best.effective_rate) if cbdc_best else None,
+                    "best_time_seconds": cbdc_best.total_settlement_seconds if cbdc_best else None
                 },
                 "stablecoin": {
                     "available": result.stablecoin_available,
                     "routes": len(result.stablecoin_routes),
-                    "best_rate": float(result.stablecoin_routes[0].effective_rate) if result.stablecoin_routes else None,
-                    "best_time_hours": result.stablecoin_routes[0].total_settlement_seconds / 3600 if result.stablecoin_routes else None
+                    "best_rate": float(stablecoin_best.effective_rate) if stablecoin_best else None,
+                    "best_time_hours": stablecoin_best.total_settlement_seconds / 3600 if stablecoin_best else None
                 }
             },
             "recommended": {
-                "route": result.recommended_route.route_name,
-                "type": result.recommended_route.route_type,
-                "rate": float(result.recommended_route.effective_rate),
-                "target_amount": float(result.recommended_route.target_amount),
-                "cost_bps": result.recommended_route.total_cost_bps,
-                "settlement_seconds": result.recommended_route.total_settlement_seconds
+                "route": recommended.route_name,
+                "type": recommended.route_type,
+                "rate": float(recommended.effective_rate),
+                "target_amount": float(recommended.target_amount),
+                "cost_bps": recommended.total_cost_bps,
+                "settlement_seconds": recommended.total_settlement_seconds
             }
         }
     
@@ -151,6 +163,17 @@ async def quick_compare(
 # Reference Data Endpoints
 # =============================================================================
 
+def _cached_refdata(key: str, build: Callable[[], dict]) -> dict:
+    """Return a cached reference-data payload, rebuilding it once the TTL expires"""
+    now = time.monotonic()
+    entry = _refdata_cache.get(key)
+    if entry is not None and now - entry[0] < REFDATA_CACHE_TTL_SECONDS:
+        return entry[1]
+    payload = build()
+    _refdata_cache[key] = (now, payload)
+    return payload
+
+
 @router.get(
     "/cbdc",
     summary="List Available CBDCs",
@@ -158,9 +181,14 @@ async def quick_compare(
 )
 async def list_cbdc(engine: MultiRailRoutingEngine = Depends(get_engine)):
     """List all supported CBDCs."""
-    cbdcs = []
-    for code, info in engine.digital_currencies["cbdc"].items():
-        cbdcs.append({
+    return _cached_refdata("cbdc", lambda: _build_cbdc_list(engine))
+
+
+def _build_cbdc_list(engine: MultiRailRoutingEngine) -> dict:
+    """Build the CBDC listing payload."""
+    cbdc_config = engine.digital_currencies["cbdc"]
+    cbdcs = [
+        {
             "code": code,
             "name": info["name"],
             "issuer": info["issuer"],
@@ -171,12 +199,16 @@ async def list_cbdc(engine: MultiRailRoutingEngine = Depends(get_engine)):
             "cross_border": info.get("cross_border_enabled", False),
             "mbridge": info.get("mbridge_participant", False),
             "settlement_seconds": info.get("settlement_seconds", 5)
-        })
+        }
+        for code, info in cbdc_config.items()
+    ]
     
     return {
         "cbdcs": cbdcs,
         "count": len(cbdcs),
-        "mbridge_participants": [c["code"] for c in cbdcs if c["mbridge"]]
+        "mbridge_participants": [
+            code for code, info in cbdc_config.items() if info.get("mbridge_participant", False)
+        ]
     }
 
 
@@ -187,9 +219,14 @@ async def list_cbdc(engine: MultiRailRoutingEngine = Depends(get_engine)):
 )
 async def list_stablecoins(engine: MultiRailRoutingEngine = Depends(get_engine)):
     """List all supported stablecoins."""
-    stables = []
-    for code, info in engine.digital_currencies["stablecoins"].items():
-        stables.append({
+    return _cached_refdata("stablecoins", lambda: _build_stablecoin_list(engine))
+
+
+def _build_stablecoin_list(engine: MultiRailRoutingEngine) -> dict:
+    """Build the stablecoin listing payload."""
+    stable_config = engine.digital_currencies["stablecoins"]
+    stables = [
+        {
             "code": code,
             "name": info["name"],
             "issuer": info["issuer"],
@@ -199,12 +236,17 @@ async def list_stablecoins(engine: MultiRailRoutingEngine = Depends(get_engine))
             "liquidity_score": info.get("liquidity_score", 0),
             "networks": [n["chain"] for n in info["networks"]],
             "market_cap_usd": info.get("market_cap_usd", 0)
-        })
+        }
+        for code, info in stable_config.items()
+    ]
     
     return {
         "stablecoins": stables,
         "count": len(stables),
-        "regulated": [s["code"] for s in stables if "REGULATED" in s["regulatory_status"]]
+        "regulated": [
+            code for code, info in stable_config.items()
+            if "REGULATED" in info.get("regulatory_status", "UNREGULATED")
+        ]
     }
 
 
@@ -215,9 +257,13 @@ async def list_stablecoins(engine: MultiRailRoutingEngine = Depends(get_engine))
 )
 async def list_rails(engine: MultiRailRoutingEngine = Depends(get_engine)):
     """List all available rails."""
-    rails = []
-    for rail_id, info in engine.digital_rails["digital_rails"].items():
-        rails.append({
+    return _cached_refdata("rails", lambda: _build_rail_list(engine))
+
+
+def _build_rail_list(engine: MultiRailRoutingEngine) -> dict:
+    """Build the rail listing payload."""
+    rails = [
+        {
             "rail_id": rail_id,
             "name": info["name"],
             "type": info["type"],
@@ -225,7 +271,9 @@ async def list_rails(engine: MultiRailRoutingEngine = Depends(get_engine)):
             "settlement_type": info.get("settlement_type", "VARIABLE"),
             "avg_settlement_seconds": info.get("avg_settlement_seconds"),
             "description": info.get("description", "")
-        })
+        }
+        for rail_id, info in engine.digital_rails["digital_rails"].items()
+    ]
     
     return {"rails": rails, "count": len(rails)}
 
@@ -237,9 +285,13 @@ async def list_rails(engine: MultiRailRoutingEngine = Depends(get_engine)):
 )
 async def list_ramp_providers(engine: MultiRailRoutingEngine = Depends(get_engine)):
     """List on/off ramp providers."""
-    providers = []
-    for pid, info in engine.digital_rails["on_off_ramp_providers"].items():
-        providers.append({
+    return _cached_refdata("on_off_ramps", lambda: _build_ramp_provider_list(engine))
+
+
+def _build_ramp_provider_list(engine: MultiRailRoutingEngine) -> dict:
+    """Build the on/off ramp provider listing payload."""
+    providers = [
+        {
             "id": pid,
             "name": info["name"],
             "type": info["type"],
@@ -249,7 +301,9 @@ async def list_ramp_providers(engine: MultiRailRoutingEngine = Depends(get_engin
             "on_ramp_fee_bps": info["on_ramp"]["fee_bps"],
             "off_ramp_fee_bps": info["off_ramp"]["fee_bps"],
             "stp_enabled": info.get("stp_enabled", False)
-        })
+        }
+        for pid, info in engine.digital_rails["on_off_ramp_providers"].items()
+    ]
     
     return {"providers": providers, "count": len(providers)}
 
@@ -261,9 +315,17 @@ async def list_ramp_providers(engine: MultiRailRoutingEngine = Depends(get_engin
 @router.get("/health", summary="Multi-Rail Service Health Check")
 async def health_check(engine: MultiRailRoutingEngine = Depends(get_engine)):
     """Check multi-rail service health."""
+    counts = _cached_refdata("health", lambda: _build_health_counts(engine))
     return {
         "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        **counts
+    }
+
+
+def _build_health_counts(engine: MultiRailRoutingEngine) -> dict:
+    """Count the configured currencies, rails and ramp providers."""
+    return {
         "cbdc_supported": len(engine.digital_currencies["cbdc"]),
         "stablecoins_supported": len(engine.digital_currencies["stablecoins"]),
         "rails_configured": len(engine.digital_rails["digital_rails"]),
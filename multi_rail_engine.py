@@ -7,15 +7,32 @@ Intelligent routing engine that evaluates multiple rails:
 - Stablecoins (USDC, USDT, etc.)
 - Hybrid paths (Fiat→CBDC, Fiat→Stablecoin→Fiat, etc.)
 """
+import asyncio
+import itertools
 import json
+import secrets
 import uuid
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
 from typing import Optional, List, Dict, Tuple, Any
 from pathlib import Path
 import time
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
 from app.models.multi_rail_models import (
     MultiRailRoutingRequest,
     MultiRailRoutingResponse,
@@ -34,6 +51,98 @@ from app.models.multi_rail_models import (
 
 logger = logging.getLogger(__name__)
 
+# Enum members used by the route builders, bound once (avoids enum attribute lookups per route)
+_CT_CBDC = CurrencyType.CBDC
+_CT_FIAT = CurrencyType.FIAT
+_CT_STABLECOIN = CurrencyType.STABLECOIN
+_RT_CBDC_DOMESTIC = RailType.CBDC_DOMESTIC
+_RT_FIAT_LOCAL = RailType.FIAT_LOCAL
+_RT_FIAT_SWIFT = RailType.FIAT_SWIFT
+_RT_MBRIDGE = RailType.MBRIDGE
+_RT_STABLECOIN_BRIDGE = RailType.STABLECOIN_BRIDGE
+_ST_ATOMIC = SettlementType.ATOMIC
+_ST_INSTANT = SettlementType.INSTANT
+_ST_NEAR_INSTANT = SettlementType.NEAR_INSTANT
+_ST_SAME_DAY = SettlementType.SAME_DAY
+_ST_T_PLUS_2 = SettlementType.T_PLUS_2
+_CL_BASIC_KYC = ComplianceLevel.BASIC_KYC
+_CL_CENTRAL_BANK = ComplianceLevel.CENTRAL_BANK
+_CL_FULL_KYC = ComplianceLevel.FULL_KYC
+
+# Route lists at least this long are scored with NumPy (when installed)
+_VECTORIZE_MIN_ROUTES = 16
+
+# Scoring weights per preference: (cost, speed, reliability, compliance)
+_PREFERENCE_WEIGHTS: Dict[RailPreference, Tuple[float, float, float, float]] = {
+    RailPreference.LOWEST_COST: (0.50, 0.15, 0.20, 0.15),
+    RailPreference.FASTEST: (0.15, 0.50, 0.20, 0.15),
+    RailPreference.CBDC_PREFERRED: (0.25, 0.25, 0.25, 0.25),
+    RailPreference.STABLECOIN_PREFERRED: (0.35, 0.30, 0.20, 0.15),
+    RailPreference.FIAT_PREFERRED: (0.30, 0.20, 0.30, 0.20),
+    RailPreference.AUTO: (0.30, 0.25, 0.25, 0.20),
+}
+
+# route_type marker of the rail each rail-specific preference favours
+_PREFERRED_ROUTE_MARKERS = {
+    RailPreference.CBDC_PREFERRED: "CBDC",
+    RailPreference.STABLECOIN_PREFERRED: "STABLE",
+    RailPreference.FIAT_PREFERRED: "FIAT",
+}
+
+# Upper bound on requests in flight for a single get_multi_rail_routes batch
+_BATCH_MAX_CONCURRENCY = 32
+
+# Fixed fee levels (bps) and their precomputed fractional multipliers
+_FIAT_TO_CBDC_SPREAD_BPS = 20
+_ON_RAMP_BPS = 50
+_OFF_RAMP_BPS = 50
+_FIAT_TO_CBDC_SPREAD = _FIAT_TO_CBDC_SPREAD_BPS / 10000
+_ON_RAMP_FEE = _ON_RAMP_BPS / 10000
+_OFF_RAMP_FEE = _OFF_RAMP_BPS / 10000
+_STABLE_BRIDGE_FEE = (_ON_RAMP_BPS + _OFF_RAMP_BPS) / 10000
+
+# CBDC issued for each fiat currency
+_FIAT_TO_CBDC = {
+    "INR": "e-INR",
+    "CNY": "e-CNY",
+    "HKD": "e-HKD",
+    "THB": "e-THB",
+    "AED": "e-AED",
+    "SGD": "e-SGD"
+}
+
+# Stablecoins pegged to each fiat currency that the bridge routes can use
+_FIAT_STABLECOINS = {
+    "USD": ("USDC", "USDT"),
+    "EUR": ("EURC",),
+    "SGD": ("XSGD",),
+}
+
+
+# Decimal places for leg amounts/fees and leg exchange rates
+_AMOUNT_PLACES = 6
+_RATE_PLACES = 8
+
+_QUANTUMS = {places: Decimal(1).scaleb(-places) for places in (2, 4, _AMOUNT_PLACES, _RATE_PLACES)}
+
+
+def _dec(value: float, places: int) -> Decimal:
+    """Convert a float result to a Decimal with a fixed number of places at the response boundary"""
+    # Rounding to 10 places first settles ties that binary noise would push the wrong way
+    # (e.g. 6.1728499999999995 -> 6.17285); the fixed quantum then drops any remaining noise
+    return Decimal(repr(round(value, 10))).quantize(_QUANTUMS[places])
+
+
+@lru_cache(maxsize=8)
+def _load_config_files(config_dir: str) -> Dict[str, Dict]:
+    """Read and parse the engine's JSON configs once per config directory"""
+    base = Path(config_dir)
+    configs = {}
+    for name in ("digital_currencies", "digital_rails", "fx_providers", "customer_tiers"):
+        with open(base / f"{name}.json", "rb") as f:
+            configs[name] = orjson.loads(f.read()) if ORJSON_AVAILABLE else json.load(f)
+    return configs
+
 
 class MultiRailRoutingEngine:
     """
@@ -59,21 +168,61 @@ class MultiRailRoutingEngine:
             "USDTHB": Decimal("34.50"),
             "USDAED": Decimal("3.67"),
         }
+        # Route math runs in float; Decimals are only built for the response models
+        self._float_rates = {pair: float(rate) for pair, rate in self._fiat_rates.items()}
+        self._rate_table = self._build_rate_table()
+        self._to_usd_rates = {
+            source: rate for (source, target), rate in self._rate_table.items() if target == "USD"
+        }
+        self._provider_cache = self._build_provider_cache()
+        
+        # Route IDs: random per-engine prefix + process-local counter (no per-route uuid4)
+        self._route_id_prefix = secrets.token_hex(4).upper()
+        self._route_id_counter = itertools.count()
+        
+        mbridge_fees = self.digital_rails["digital_rails"]["MBRIDGE"]["fee_structure"]
+        self._mbridge_fee_bps = mbridge_fees["cross_border_bps"] + mbridge_fees["fx_spread_bps"]
+        self._mbridge_fee = self._mbridge_fee_bps / 10000
     
     def _load_configurations(self):
         """Load all configuration files"""
-        with open(self.config_dir / "digital_currencies.json") as f:
-            self.digital_currencies = json.load(f)
-        
-        with open(self.config_dir / "digital_rails.json") as f:
-            self.digital_rails = json.load(f)
+        configs = _load_config_files(str(self.config_dir))
+        self.digital_currencies = configs["digital_currencies"]
+        self.digital_rails = configs["digital_rails"]
         
         # Load existing configs
-        with open(self.config_dir / "fx_providers.json") as f:
-            self.fx_providers = json.load(f)
-        
-        with open(self.config_dir / "customer_tiers.json") as f:
-            self.customer_tiers = json.load(f)
+        self.fx_providers = configs["fx_providers"]
+        self.customer_tiers = configs["customer_tiers"]
+    
+    def _build_rate_table(self) -> Dict[Tuple[str, str], float]:
+        """Pre-expand direct, inverse and USD-cross rates for every quoted currency pair"""
+        currencies = {pair[:3] for pair in self._float_rates} | {pair[3:] for pair in self._float_rates}
+        return {
+            (source, target): self._derive_fiat_rate(source, target)
+            for source in currencies
+            for target in currencies
+        }
+    
+    def _build_provider_cache(self) -> List[Tuple]:
+        """Precompute per-provider fee and settlement terms for fiat routing"""
+        spread_bps = 25
+        cache = []
+        for provider in self.fx_providers["providers"].values():
+            if not provider["is_active"] or provider["type"] == "MARKET_DATA":
+                continue
+            total_cost_bps = provider.get("markup_bps", 10) + spread_bps
+            settlement_hours = provider.get("settlement_hours", 24)
+            cache.append((
+                provider["name"],
+                total_cost_bps,
+                total_cost_bps / 10000,
+                settlement_hours * 3600,
+                _RT_FIAT_SWIFT if settlement_hours > 4 else _RT_FIAT_LOCAL,
+                _ST_SAME_DAY if settlement_hours <= 4 else _ST_T_PLUS_2,
+                provider["capabilities"].get("stp_enabled", False),
+                provider.get("reliability_score", 0.9) * 100,
+            ))
+        return cache
     
     async def get_multi_rail_route(
         self,
@@ -82,40 +231,30 @@ class MultiRailRoutingEngine:
         """
         Get optimal route across all available rails.
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
+        timestamp = datetime.now(timezone.utc)
         request_id = f"MR-{uuid.uuid4().hex[:12].upper()}"
         
         # 1. Determine source and target currency types
         source_info = self._get_currency_info(request.source_currency, request.source_type)
         target_info = self._get_currency_info(request.target_currency, request.target_type)
         
-        # 2. Find all available routes
-        all_routes = []
-        rails_evaluated = []
-        
-        # 2a. Fiat routes
-        fiat_routes = await self._evaluate_fiat_routes(request, source_info, target_info)
-        all_routes.extend(fiat_routes)
-        if fiat_routes:
-            rails_evaluated.append("FIAT")
-        
-        # 2b. CBDC routes
-        cbdc_routes = await self._evaluate_cbdc_routes(request, source_info, target_info)
-        all_routes.extend(cbdc_routes)
-        if cbdc_routes:
-            rails_evaluated.append("CBDC")
-        
-        # 2c. Stablecoin routes
-        stable_routes = await self._evaluate_stablecoin_routes(request, source_info, target_info)
-        all_routes.extend(stable_routes)
-        if stable_routes:
-            rails_evaluated.append("STABLECOIN")
-        
-        # 2d. Hybrid routes (if applicable)
-        hybrid_routes = await self._evaluate_hybrid_routes(request, source_info, target_info)
-        all_routes.extend(hybrid_routes)
-        if hybrid_routes:
-            rails_evaluated.append("HYBRID")
+        # 2. Find all available routes (rail evaluators are independent, so run them together)
+        fiat_routes, cbdc_routes, stable_routes, hybrid_routes = await asyncio.gather(
+            self._evaluate_fiat_routes(request, source_info, target_info),
+            self._evaluate_cbdc_routes(request, source_info, target_info),
+            self._evaluate_stablecoin_routes(request, source_info, target_info),
+            self._evaluate_hybrid_routes(request, source_info, target_info),
+        )
+        
+        route_groups = (
+            ("FIAT", fiat_routes),
+            ("CBDC", cbdc_routes),
+            ("STABLECOIN", stable_routes),
+            ("HYBRID", hybrid_routes),
+        )
+        all_routes = [route for _, group in route_groups for route in group]
+        rails_evaluated = [rail for rail, group in route_groups if group]
         
         # 3. Score and rank routes
         scored_routes = self._score_routes(all_routes, request)
@@ -123,22 +262,19 @@ class MultiRailRoutingEngine:
         # 4. Select recommended route based on preference
         recommended = self._select_recommended(scored_routes, request.rail_preference)
         
-        # 5. Categorize routes
-        categorized = self._categorize_routes(scored_routes)
+        # 5. Categorize routes and build comparison
+        categorized, comparison = self._summarize_routes(scored_routes)
         
-        # 6. Build comparison
-        comparison = self._build_comparison(scored_routes)
-        
-        # 7. Get additional info
+        # 6. Get additional info
         cbdc_info = self._get_cbdc_route_info(recommended) if "CBDC" in recommended.route_type else None
         stable_info = self._get_stablecoin_route_info(recommended) if "STABLE" in recommended.route_type else None
         
-        execution_time = (time.time() - start_time) * 1000
-        logger.info(f"Multi-rail routing completed in {execution_time:.2f}ms")
+        execution_time = (time.perf_counter_ns() - start_time) / 1e6
+        logger.info("Multi-rail routing completed in %.2fms", execution_time)
         
         return MultiRailRoutingResponse(
             request_id=request_id,
-            timestamp=datetime.utcnow(),
+            timestamp=timestamp,
             source_currency=request.source_currency,
             source_type=request.source_type,
             source_amount=request.source_amount,
@@ -162,24 +298,41 @@ class MultiRailRoutingEngine:
             warnings=self._generate_warnings(request, recommended)
         )
     
+    async def get_multi_rail_routes(
+        self,
+        requests: List[MultiRailRoutingRequest],
+        max_concurrency: int = _BATCH_MAX_CONCURRENCY
+    ) -> List[MultiRailRoutingResponse]:
+        """
+        Route a batch of requests (bulk re-pricing, sweeps, EOD reports).
+        Responses are returned in request order.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def route_one(request: MultiRailRoutingRequest) -> MultiRailRoutingResponse:
+            async with semaphore:
+                return await self.get_multi_rail_route(request)
+        
+        return list(await asyncio.gather(*(route_one(r) for r in requests)))
+    
     def _get_currency_info(self, currency: str, currency_type: CurrencyType) -> Dict:
         """Get currency information"""
-        if currency_type == CurrencyType.CBDC:
+        if currency_type == _CT_CBDC:
             return {
                 "code": currency,
-                "type": CurrencyType.CBDC,
+                "type": _CT_CBDC,
                 "info": self.digital_currencies["cbdc"].get(currency, {})
             }
-        elif currency_type == CurrencyType.STABLECOIN:
+        elif currency_type == _CT_STABLECOIN:
             return {
                 "code": currency,
-                "type": CurrencyType.STABLECOIN,
+                "type": _CT_STABLECOIN,
                 "info": self.digital_currencies["stablecoins"].get(currency, {})
             }
         else:
             return {
                 "code": currency,
-                "type": CurrencyType.FIAT,
+                "type": _CT_FIAT,
                 "info": {"code": currency}
             }
     
@@ -204,63 +357,56 @@ class MultiRailRoutingEngine:
         if not rate:
             return routes
         
-        # Evaluate fiat providers
-        for provider_id, provider in self.fx_providers["providers"].items():
-            if not provider["is_active"]:
-                continue
-            if provider["type"] == "MARKET_DATA":
-                continue
-            
+        source_amount = float(request.source_amount)
+        
+        # Evaluate fiat providers (active, non market-data; terms precomputed at init)
+        for (provider_name, total_cost_bps, fee_fraction, settlement_seconds,
+             rail_type, settlement_type, stp_enabled, reliability_score) in self._provider_cache:
             # Calculate amounts
-            markup_bps = provider.get("markup_bps", 10)
-            spread_bps = 25
-            total_cost_bps = markup_bps + spread_bps
-            
-            effective_rate = rate * (1 + Decimal(total_cost_bps) / 10000)
-            target_amount = request.source_amount * effective_rate
-            
-            settlement_hours = provider.get("settlement_hours", 24)
+            effective_rate = rate * (1 + fee_fraction)
+            target_amount = source_amount * effective_rate
+            fee_amount = source_amount * fee_fraction
             
             route = MultiRailRoute(
-                route_id=f"FIAT-{uuid.uuid4().hex[:8].upper()}",
-                route_name=f"Fiat via {provider['name']}",
+                route_id=f"FIAT-{self._route_id_prefix}{next(self._route_id_counter):08X}",
+                route_name=f"Fiat via {provider_name}",
                 route_type="FIAT_DIRECT",
                 legs=[RailLeg(
                     leg_number=1,
-                    rail_type=RailType.FIAT_SWIFT if settlement_hours > 4 else RailType.FIAT_LOCAL,
-                    provider=provider["name"],
+                    rail_type=rail_type,
+                    provider=provider_name,
                     source_currency=source_fiat,
-                    source_type=CurrencyType.FIAT,
+                    source_type=_CT_FIAT,
                     source_amount=request.source_amount,
                     target_currency=target_fiat,
-                    target_type=CurrencyType.FIAT,
-                    target_amount=target_amount,
-                    exchange_rate=effective_rate,
-                    fee_amount=request.source_amount * Decimal(total_cost_bps) / 10000,
+                    target_type=_CT_FIAT,
+                    target_amount=_dec(target_amount, _AMOUNT_PLACES),
+                    exchange_rate=_dec(effective_rate, _RATE_PLACES),
+                    fee_amount=_dec(fee_amount, _AMOUNT_PLACES),
                     fee_currency=source_fiat,
-                    settlement_type=SettlementType.SAME_DAY if settlement_hours <= 4 else SettlementType.T_PLUS_2,
-                    settlement_seconds=settlement_hours * 3600,
-                    compliance_level=ComplianceLevel.FULL_KYC
+                    settlement_type=settlement_type,
+                    settlement_seconds=settlement_seconds,
+                    compliance_level=_CL_FULL_KYC
                 )],
                 total_legs=1,
                 source_currency=source_fiat,
-                source_type=CurrencyType.FIAT,
+                source_type=_CT_FIAT,
                 source_amount=request.source_amount,
                 target_currency=target_fiat,
-                target_type=CurrencyType.FIAT,
-                target_amount=target_amount.quantize(Decimal("0.01")),
-                effective_rate=effective_rate.quantize(Decimal("0.0001")),
-                total_fees_usd=self._to_usd(request.source_amount * Decimal(total_cost_bps) / 10000, source_fiat),
+                target_type=_CT_FIAT,
+                target_amount=_dec(target_amount, 2),
+                effective_rate=_dec(effective_rate, 4),
+                total_fees_usd=self._to_usd(fee_amount, source_fiat),
                 total_cost_bps=total_cost_bps,
-                total_settlement_seconds=settlement_hours * 3600,
-                settlement_type=SettlementType.SAME_DAY if settlement_hours <= 4 else SettlementType.T_PLUS_2,
-                stp_enabled=provider["capabilities"].get("stp_enabled", False),
+                total_settlement_seconds=settlement_seconds,
+                settlement_type=settlement_type,
+                stp_enabled=stp_enabled,
                 cost_score=0,
                 speed_score=0,
-                reliability_score=provider.get("reliability_score", 0.9) * 100,
+                reliability_score=reliability_score,
                 compliance_score=90,
                 overall_score=0,
-                compliance_level=ComplianceLevel.FULL_KYC,
+                compliance_level=_CL_FULL_KYC,
                 sanctions_screening="PROVIDER"
             )
             routes.append(route)
@@ -326,21 +472,14 @@ class MultiRailRoutingEngine:
         if not source_fiat or not target_fiat:
             return routes
         
-        # Find applicable stablecoins
-        # USD-pegged stablecoins for USD source/target
-        applicable_stables = []
-        
-        if source_fiat == "USD":
-            applicable_stables.extend(["USDC", "USDT"])
-        if target_fiat == "USD":
-            applicable_stables.extend(["USDC", "USDT"])
-        if source_fiat == "EUR" or target_fiat == "EUR":
-            applicable_stables.append("EURC")
-        if source_fiat == "SGD" or target_fiat == "SGD":
-            applicable_stables.append("XSGD")
+        # Corridors touching no stablecoin peg currency (e.g. JPY → CHF) have no bridge routes
+        if source_fiat not in _FIAT_STABLECOINS and target_fiat not in _FIAT_STABLECOINS:
+            return routes
         
-        # Remove duplicates
-        applicable_stables = list(set(applicable_stables))
+        # Find applicable stablecoins (pegged to either side), de-duplicated in a stable order
+        applicable_stables = dict.fromkeys(
+            _FIAT_STABLECOINS.get(source_fiat, ()) + _FIAT_STABLECOINS.get(target_fiat, ())
+        )
         
         for stable in applicable_stables:
             stable_info = self.digital_currencies["stablecoins"].get(stable)
@@ -378,45 +517,45 @@ class MultiRailRoutingEngine:
         """Build domestic CBDC route (Fiat ↔ CBDC same country)"""
         # This is instant and usually free
         return MultiRailRoute(
-            route_id=f"CBDC-DOM-{uuid.uuid4().hex[:8].upper()}",
+            route_id=f"CBDC-DOM-{self._route_id_prefix}{next(self._route_id_counter):08X}",
             route_name=f"Domestic CBDC ({cbdc_info['name']})",
             route_type="CBDC_DOMESTIC",
             legs=[RailLeg(
                 leg_number=1,
-                rail_type=RailType.CBDC_DOMESTIC,
+                rail_type=_RT_CBDC_DOMESTIC,
                 provider=cbdc_info["issuer"],
                 source_currency=fiat,
-                source_type=CurrencyType.FIAT,
+                source_type=_CT_FIAT,
                 source_amount=request.source_amount,
                 target_currency=cbdc,
-                target_type=CurrencyType.CBDC,
+                target_type=_CT_CBDC,
                 target_amount=request.source_amount,  # 1:1 for domestic
                 exchange_rate=Decimal("1.0"),
                 fee_amount=Decimal("0"),
                 fee_currency=fiat,
-                settlement_type=SettlementType.INSTANT,
+                settlement_type=_ST_INSTANT,
                 settlement_seconds=cbdc_info.get("settlement_seconds", 5),
-                compliance_level=ComplianceLevel.FULL_KYC
+                compliance_level=_CL_FULL_KYC
             )],
             total_legs=1,
             source_currency=fiat,
-            source_type=CurrencyType.FIAT,
+            source_type=_CT_FIAT,
             source_amount=request.source_amount,
             target_currency=cbdc,
-            target_type=CurrencyType.CBDC,
+            target_type=_CT_CBDC,
             target_amount=request.source_amount,
             effective_rate=Decimal("1.0"),
             total_fees_usd=Decimal("0"),
             total_cost_bps=0,
             total_settlement_seconds=cbdc_info.get("settlement_seconds", 5),
-            settlement_type=SettlementType.INSTANT,
+            settlement_type=_ST_INSTANT,
             stp_enabled=True,
             cost_score=100,
             speed_score=100,
             reliability_score=99,
             compliance_score=100,
             overall_score=0,
-            compliance_level=ComplianceLevel.FULL_KYC,
+            compliance_level=_CL_FULL_KYC,
             sanctions_screening="CENTRAL_BANK"
         )
     
@@ -429,77 +568,77 @@ class MultiRailRoutingEngine:
         target_cbdc: str
     ) -> Optional[MultiRailRoute]:
         """Build mBridge cross-border CBDC route"""
-        mbridge = self.digital_rails["digital_rails"]["MBRIDGE"]
-        
         # Get FX rate
         rate = self._get_fiat_rate(source_fiat, target_fiat)
         if not rate:
             return None
         
-        # mBridge fees
-        fee_bps = mbridge["fee_structure"]["cross_border_bps"] + mbridge["fee_structure"]["fx_spread_bps"]
-        effective_rate = rate * (1 + Decimal(fee_bps) / 10000)
-        target_amount = request.source_amount * effective_rate
+        # mBridge fees (cross-border + FX spread, precomputed at init)
+        fee_bps = self._mbridge_fee_bps
+        source_amount = float(request.source_amount)
+        effective_rate = rate * (1 + self._mbridge_fee)
+        target_amount = source_amount * effective_rate
+        fee_amount = source_amount * self._mbridge_fee
         
         return MultiRailRoute(
-            route_id=f"CBDC-MB-{uuid.uuid4().hex[:8].upper()}",
+            route_id=f"CBDC-MB-{self._route_id_prefix}{next(self._route_id_counter):08X}",
             route_name=f"mBridge ({source_cbdc} → {target_cbdc})",
             route_type="CBDC_MBRIDGE",
             legs=[
                 RailLeg(
                     leg_number=1,
-                    rail_type=RailType.CBDC_DOMESTIC,
+                    rail_type=_RT_CBDC_DOMESTIC,
                     provider="Originating Central Bank",
                     source_currency=source_fiat,
-                    source_type=CurrencyType.FIAT,
+                    source_type=_CT_FIAT,
                     source_amount=request.source_amount,
                     target_currency=source_cbdc,
-                    target_type=CurrencyType.CBDC,
+                    target_type=_CT_CBDC,
                     target_amount=request.source_amount,
                     exchange_rate=Decimal("1.0"),
                     fee_amount=Decimal("0"),
                     fee_currency=source_fiat,
-                    settlement_type=SettlementType.INSTANT,
+                    settlement_type=_ST_INSTANT,
                     settlement_seconds=5,
-                    compliance_level=ComplianceLevel.CENTRAL_BANK
+                    compliance_level=_CL_CENTRAL_BANK
                 ),
                 RailLeg(
                     leg_number=2,
-                    rail_type=RailType.MBRIDGE,
+                    rail_type=_RT_MBRIDGE,
                     provider="mBridge Platform",
                     source_currency=source_cbdc,
-                    source_type=CurrencyType.CBDC,
+                    source_type=_CT_CBDC,
                     source_amount=request.source_amount,
                     target_currency=target_cbdc,
-                    target_type=CurrencyType.CBDC,
-                    target_amount=target_amount,
-                    exchange_rate=effective_rate,
-                    fee_amount=request.source_amount * Decimal(fee_bps) / 10000,
+                    target_type=_CT_CBDC,
+                    target_amount=_dec(target_amount, _AMOUNT_PLACES),
+                    exchange_rate=_dec(effective_rate, _RATE_PLACES),
+                    fee_amount=_dec(fee_amount, _AMOUNT_PLACES),
                     fee_currency=source_fiat,
-                    settlement_type=SettlementType.ATOMIC,
+                    settlement_type=_ST_ATOMIC,
                     settlement_seconds=10,
-                    compliance_level=ComplianceLevel.CENTRAL_BANK
+                    compliance_level=_CL_CENTRAL_BANK
                 )
             ],
             total_legs=2,
             source_currency=source_fiat,
-            source_type=CurrencyType.FIAT,
+            source_type=_CT_FIAT,
             source_amount=request.source_amount,
             target_currency=target_fiat,
-            target_type=CurrencyType.FIAT,
-            target_amount=target_amount.quantize(Decimal("0.01")),
-            effective_rate=effective_rate.quantize(Decimal("0.0001")),
-            total_fees_usd=self._to_usd(request.source_amount * Decimal(fee_bps) / 10000, source_fiat),
+            target_type=_CT_FIAT,
+            target_amount=_dec(target_amount, 2),
+            effective_rate=_dec(effective_rate, 4),
+            total_fees_usd=self._to_usd(fee_amount, source_fiat),
             total_cost_bps=fee_bps,
             total_settlement_seconds=15,
-            settlement_type=SettlementType.ATOMIC,
+            settlement_type=_ST_ATOMIC,
             stp_enabled=True,
             cost_score=0,
             speed_score=0,
             reliability_score=98,
             compliance_score=100,
             overall_score=0,
-            compliance_level=ComplianceLevel.CENTRAL_BANK,
+            compliance_level=_CL_CENTRAL_BANK,
             sanctions_screening="BOTH_JURISDICTIONS"
         )
     
@@ -518,69 +657,72 @@ class MultiRailRoutingEngine:
         cbdc_info = self.digital_currencies["cbdc"].get(target_cbdc, {})
         
         # FX spread + CBDC fee
-        fee_bps = 20  # FX spread
-        effective_rate = rate * (1 + Decimal(fee_bps) / 10000)
-        target_amount = request.source_amount * effective_rate
+        fee_bps = _FIAT_TO_CBDC_SPREAD_BPS  # FX spread
+        source_amount = float(request.source_amount)
+        effective_rate = rate * (1 + _FIAT_TO_CBDC_SPREAD)
+        target_amount = source_amount * effective_rate
+        fee_amount = source_amount * _FIAT_TO_CBDC_SPREAD
+        target_amount_dec = _dec(target_amount, _AMOUNT_PLACES)
         
         return MultiRailRoute(
-            route_id=f"CBDC-FX-{uuid.uuid4().hex[:8].upper()}",
+            route_id=f"CBDC-FX-{self._route_id_prefix}{next(self._route_id_counter):08X}",
             route_name=f"FX to CBDC ({source_fiat} → {target_cbdc})",
             route_type="FIAT_TO_CBDC",
             legs=[
                 RailLeg(
                     leg_number=1,
-                    rail_type=RailType.FIAT_SWIFT,
+                    rail_type=_RT_FIAT_SWIFT,
                     provider="FX Provider",
                     source_currency=source_fiat,
-                    source_type=CurrencyType.FIAT,
+                    source_type=_CT_FIAT,
                     source_amount=request.source_amount,
                     target_currency=target_fiat,
-                    target_type=CurrencyType.FIAT,
-                    target_amount=target_amount,
-                    exchange_rate=effective_rate,
-                    fee_amount=request.source_amount * Decimal(fee_bps) / 10000,
+                    target_type=_CT_FIAT,
+                    target_amount=target_amount_dec,
+                    exchange_rate=_dec(effective_rate, _RATE_PLACES),
+                    fee_amount=_dec(fee_amount, _AMOUNT_PLACES),
                     fee_currency=source_fiat,
-                    settlement_type=SettlementType.SAME_DAY,
+                    settlement_type=_ST_SAME_DAY,
                     settlement_seconds=14400,
-                    compliance_level=ComplianceLevel.FULL_KYC
+                    compliance_level=_CL_FULL_KYC
                 ),
                 RailLeg(
                     leg_number=2,
-                    rail_type=RailType.CBDC_DOMESTIC,
+                    rail_type=_RT_CBDC_DOMESTIC,
                     provider=cbdc_info.get("issuer", "Central Bank"),
                     source_currency=target_fiat,
-                    source_type=CurrencyType.FIAT,
-                    source_amount=target_amount,
+                    source_type=_CT_FIAT,
+                    source_amount=target_amount_dec,
                     target_currency=target_cbdc,
-                    target_type=CurrencyType.CBDC,
-                    target_amount=target_amount,
+                    target_type=_CT_CBDC,
+                    target_amount=target_amount_dec,
                     exchange_rate=Decimal("1.0"),
                     fee_amount=Decimal("0"),
                     fee_currency=target_fiat,
-                    settlement_type=SettlementType.INSTANT,
+                    settlement_type=_ST_INSTANT,
                     settlement_seconds=5,
-                    compliance_level=ComplianceLevel.FULL_KYC
+                    compliance_level=_CL_FULL_KYC
                 )
             ],
             total_legs=2,
             source_currency=source_fiat,
-            source_type=CurrencyType.FIAT,
+            source_type=_CT_FIAT,
             source_amount=request.source_amount,
             target_currency=target_cbdc,
-            target_type=CurrencyType.CBDC,
-            target_amount=target_amount.quantize(Decimal("0.01")),
-            effective_rate=effective_rate.quantize(Decimal("0.0001")),
-            total_fees_usd=self._to_usd(request.source_amount * Decimal(fee_bps) / 10000, source_fiat),
+            target_type=_CT_CBDC,
+            target_amount=_dec(target_amount, 2),
+            effective_rate=_dec(effective_rate, 4),
+            total_fees_usd=self._to_usd(fee_amount, source_fiat),
             total_cost_bps=fee_bps,
             total_settlement_seconds=14405,
-            settlement_type=SettlementType.SAME_DAY,
+            settlement_type=_ST_SAME_DAY,
             stp_enabled=True,
             cost_score=0,
             speed_score=0,
             reliability_score=95,
             compliance_score=95,
             overall_score=0,
-            compliance_level=ComplianceLevel.FULL_KYC,
+            compliance_level=_CL_FULL_KYC,
             sanctions_screening="BANK_LEVEL"
         )
     
@@ -594,107 +736,112 @@ class MultiRailRoutingEngine:
         network: Dict
     ) -> Optional[MultiRailRoute]:
         """Build Fiat → Stablecoin → Fiat bridge route"""
+        pegged = stable_info["pegged_currency"]
+        
         # Get rates
-        source_to_stable_rate = self._get_fiat_rate(source_fiat, stable_info["pegged_currency"])
-        stable_to_target_rate = self._get_fiat_rate(stable_info["pegged_currency"], target_fiat)
+        source_to_stable_rate = self._get_fiat_rate(source_fiat, pegged)
+        stable_to_target_rate = self._get_fiat_rate(pegged, target_fiat)
         
         if not source_to_stable_rate or not stable_to_target_rate:
             return None
         
-        # Calculate fees
-        on_ramp_bps = 50
-        off_ramp_bps = 50
-        network_fee_usd = Decimal(str(network["fee_usd"]))
-        total_fee_bps = on_ramp_bps + off_ramp_bps
+        # Whole on-ramp → network → off-ramp amount chain in float, converted once below
+        source_amount = float(request.source_amount)
+        on_ramp_fee = source_amount * _ON_RAMP_FEE
+        stable_amount = source_amount * source_to_stable_rate * (1 - _ON_RAMP_FEE)
+        off_ramp_fee = stable_amount * _OFF_RAMP_FEE
+        target_amount = stable_amount * stable_to_target_rate * (1 - _OFF_RAMP_FEE)
+        effective_rate = target_amount / source_amount
         
-        # Calculate amounts
-        stable_amount = request.source_amount * source_to_stable_rate * (1 - Decimal(on_ramp_bps) / 10000)
-        target_amount = stable_amount * stable_to_target_rate * (1 - Decimal(off_ramp_bps) / 10000)
-        
-        effective_rate = target_amount / request.source_amount
+        stable_amount_dec = _dec(stable_amount, _AMOUNT_PLACES)
+        network_fee_usd = Decimal(str(network["fee_usd"]))
+        total_fee_bps = _ON_RAMP_BPS + _OFF_RAMP_BPS
         
-        settlement_seconds = network["settlement_seconds"] + 7200  # Network + off-ramp
+        chain = network["chain"]
+        blockchain_network = BlockchainNetwork(chain)
+        network_seconds = network["settlement_seconds"]
+        settlement_seconds = network_seconds + 7200  # Network + off-ramp
         
         return MultiRailRoute(
-            route_id=f"STABLE-{stable}-{network['chain'][:3]}-{uuid.uuid4().hex[:6].upper()}",
-            route_name=f"Stablecoin Bridge ({stable} on {network['chain']})",
+            route_id=f"STABLE-{stable}-{chain[:3]}-{self._route_id_prefix}{next(self._route_id_counter):08X}",
+            route_name=f"Stablecoin Bridge ({stable} on {chain})",
             route_type=f"STABLE_BRIDGE_{stable}",
             legs=[
                 RailLeg(
                     leg_number=1,
-                    rail_type=RailType.STABLECOIN_BRIDGE,
+                    rail_type=_RT_STABLECOIN_BRIDGE,
                     provider="On-Ramp Provider",
                     source_currency=source_fiat,
-                    source_type=CurrencyType.FIAT,
+                    source_type=_CT_FIAT,
                     source_amount=request.source_amount,
                     target_currency=stable,
-                    target_type=CurrencyType.STABLECOIN,
-                    target_amount=stable_amount,
-                    exchange_rate=source_to_stable_rate,
-                    fee_amount=request.source_amount * Decimal(on_ramp_bps) / 10000,
+                    target_type=_CT_STABLECOIN,
+                    target_amount=stable_amount_dec,
+                    exchange_rate=_dec(source_to_stable_rate, _RATE_PLACES),
+                    fee_amount=_dec(on_ramp_fee, _AMOUNT_PLACES),
                     fee_currency=source_fiat,
-                    settlement_type=SettlementType.SAME_DAY,
+                    settlement_type=_ST_SAME_DAY,
                     settlement_seconds=3600,
-                    blockchain_network=BlockchainNetwork(network["chain"]),
-                    compliance_level=ComplianceLevel.FULL_KYC
+                    blockchain_network=blockchain_network,
+                    compliance_level=_CL_FULL_KYC
                 ),
                 RailLeg(
                     leg_number=2,
-                    rail_type=RailType.STABLECOIN_BRIDGE,
-                    provider=f"{network['chain']} Network",
+                    rail_type=_RT_STABLECOIN_BRIDGE,
+                    provider=f"{chain} Network",
                     source_currency=stable,
-                    source_type=CurrencyType.STABLECOIN,
-                    source_amount=stable_amount,
+                    source_type=_CT_STABLECOIN,
+                    source_amount=stable_amount_dec,
                     target_currency=stable,
-                    target_type=CurrencyType.STABLECOIN,
-                    target_amount=stable_amount,
+                    target_type=_CT_STABLECOIN,
+                    target_amount=stable_amount_dec,
                     exchange_rate=Decimal("1.0"),
                     fee_amount=network_fee_usd,
                     fee_currency="USD",
-                    settlement_type=SettlementType.NEAR_INSTANT,
-                    settlement_seconds=network["settlement_seconds"],
-                    blockchain_network=BlockchainNetwork(network["chain"]),
+                    settlement_type=_ST_NEAR_INSTANT,
+                    settlement_seconds=network_seconds,
+                    blockchain_network=blockchain_network,
                     network_fee_usd=network_fee_usd,
-                    compliance_level=ComplianceLevel.BASIC_KYC
+                    compliance_level=_CL_BASIC_KYC
                 ),
                 RailLeg(
                     leg_number=3,
-                    rail_type=RailType.STABLECOIN_BRIDGE,
+                    rail_type=_RT_STABLECOIN_BRIDGE,
                     provider="Off-Ramp Provider",
                     source_currency=stable,
-                    source_type=CurrencyType.STABLECOIN,
-                    source_amount=stable_amount,
+                    source_type=_CT_STABLECOIN,
+                    source_amount=stable_amount_dec,
                     target_currency=target_fiat,
-                    target_type=CurrencyType.FIAT,
-                    target_amount=target_amount,
-                    exchange_rate=stable_to_target_rate,
-                    fee_amount=stable_amount * Decimal(off_ramp_bps) / 10000,
-                    fee_currency=stable_info["pegged_currency"],
-                    settlement_type=SettlementType.SAME_DAY,
+                    target_type=_CT_FIAT,
+                    target_amount=_dec(target_amount, _AMOUNT_PLACES),
+                    exchange_rate=_dec(stable_to_target_rate, _RATE_PLACES),
+                    fee_amount=_dec(off_ramp_fee, _AMOUNT_PLACES),
+                    fee_currency=pegged,
+                    settlement_type=_ST_SAME_DAY,
                     settlement_seconds=3600,
-                    blockchain_network=BlockchainNetwork(network["chain"]),
-                    compliance_level=ComplianceLevel.FULL_KYC
+                    blockchain_network=blockchain_network,
+                    compliance_level=_CL_FULL_KYC
                 )
             ],
             total_legs=3,
             source_currency=source_fiat,
-            source_type=CurrencyType.FIAT,
+            source_type=_CT_FIAT,
             source_amount=request.source_amount,
             target_currency=target_fiat,
-            target_type=CurrencyType.FIAT,
-            target_amount=target_amount.quantize(Decimal("0.01")),
-            effective_rate=effective_rate.quantize(Decimal("0.0001")),
-            total_fees_usd=self._to_usd(request.source_amount * Decimal(total_fee_bps) / 10000, source_fiat) + network_fee_usd,
+            target_type=_CT_FIAT,
+            target_amount=_dec(target_amount, 2),
+            effective_rate=_dec(effective_rate, 4),
+            total_fees_usd=self._to_usd(source_amount * _STABLE_BRIDGE_FEE, source_fiat) + network_fee_usd,
             total_cost_bps=total_fee_bps,
             total_settlement_seconds=settlement_seconds,
-            settlement_type=SettlementType.SAME_DAY,
+            settlement_type=_ST_SAME_DAY,
             stp_enabled=True,
             cost_score=0,
             speed_score=0,
             reliability_score=stable_info.get("liquidity_score", 80),
             compliance_score=85 if stable_info.get("regulatory_status") == "REGULATED_US" else 70,
             overall_score=0,
-            compliance_level=ComplianceLevel.FULL_KYC,
+            compliance_level=_CL_FULL_KYC,
             travel_rule_applicable=True,
             sanctions_screening="CHAINALYSIS"
         )
@@ -708,6 +855,16 @@ class MultiRailRoutingEngine:
         if not routes:
             return routes
         
+        # Define weights based on preference
+        weights = self._get_preference_weights(request.rail_preference)
+        w_cost, w_speed, w_reliability, w_compliance = weights
+        
+        if NUMPY_AVAILABLE and len(routes) >= _VECTORIZE_MIN_ROUTES:
+            overall_scores = self._score_routes_vectorized(routes, weights)
+            # Stable argsort keeps tied routes in evaluation order, matching list.sort
+            order = np.argsort(-overall_scores, kind="stable")
+            return [routes[i] for i in order.tolist()]
+        
         # Get min/max for normalization
         costs = [r.total_cost_bps for r in routes]
         min_cost, max_cost = min(costs), max(costs)
@@ -717,9 +874,6 @@ class MultiRailRoutingEngine:
         min_time, max_time = min(times), max(times)
         time_range = max_time - min_time if max_time != min_time else 1
         
-        # Define weights based on preference
-        weights = self._get_preference_weights(request.rail_preference)
-        
         for route in routes:
             # Cost score (lower is better)
             route.cost_score = (1 - (route.total_cost_bps - min_cost) / cost_range) * 100
@@ -729,26 +883,57 @@ class MultiRailRoutingEngine:
             
             # Overall score
             route.overall_score = (
-                weights["cost"] * route.cost_score +
-                weights["speed"] * route.speed_score +
-                weights["reliability"] * route.reliability_score +
-                weights["compliance"] * route.compliance_score
+                w_cost * route.cost_score +
+                w_speed * route.speed_score +
+                w_reliability * route.reliability_score +
+                w_compliance * route.compliance_score
             )
         
         routes.sort(key=lambda r: r.overall_score, reverse=True)
         return routes
     
-    def _get_preference_weights(self, preference: RailPreference) -> Dict[str, float]:
-        """Get scoring weights based on preference"""
-        weights = {
-            RailPreference.LOWEST_COST: {"cost": 0.50, "speed": 0.15, "reliability": 0.20, "compliance": 0.15},
-            RailPreference.FASTEST: {"cost": 0.15, "speed": 0.50, "reliability": 0.20, "compliance": 0.15},
-            RailPreference.CBDC_PREFERRED: {"cost": 0.25, "speed": 0.25, "reliability": 0.25, "compliance": 0.25},
-            RailPreference.STABLECOIN_PREFERRED: {"cost": 0.35, "speed": 0.30, "reliability": 0.20, "compliance": 0.15},
-            RailPreference.FIAT_PREFERRED: {"cost": 0.30, "speed": 0.20, "reliability": 0.30, "compliance": 0.20},
-            RailPreference.AUTO: {"cost": 0.30, "speed": 0.25, "reliability": 0.25, "compliance": 0.20},
-        }
-        return weights.get(preference, weights[RailPreference.AUTO])
+    def _score_routes_vectorized(self, routes: List[MultiRailRoute], weights: Tuple[float, float, float, float]) -> "np.ndarray":
+        """Set cost, speed and overall scores for a large route list in one NumPy pass; returns the overall scores"""
+        n = len(routes)
+        costs = np.fromiter((r.total_cost_bps for r in routes), dtype=np.float64, count=n)
+        times = np.fromiter((r.total_settlement_seconds for r in routes), dtype=np.float64, count=n)
+        reliability = np.fromiter((r.reliability_score for r in routes), dtype=np.float64, count=n)
+        compliance = np.fromiter((r.compliance_score for r in routes), dtype=np.float64, count=n)
+        
+        min_cost, min_time = costs.min(), times.min()
+        cost_range = (costs.max() - min_cost) or 1
+        time_range = (times.max() - min_time) or 1
+        
+        # Normalise in place (same operation order as the scalar path, no temporaries)
+        costs -= min_cost
+        costs /= cost_range
+        cost_scores = np.subtract(1, costs, out=costs)
+        cost_scores *= 100
+        times -= min_time
+        times /= time_range
+        speed_scores = np.subtract(1, times, out=times)
+        speed_scores *= 100
+        
+        w_cost, w_speed, w_reliability, w_compliance = weights
+        overall_scores = cost_scores * w_cost
+        overall_scores += speed_scores * w_speed
+        reliability *= w_reliability
+        overall_scores += reliability
+        compliance *= w_compliance
+        overall_scores += compliance
+        
+        for route, cost_score, speed_score, overall_score in zip(
+            routes, cost_scores.tolist(), speed_scores.tolist(), overall_scores.tolist()
+        ):
+            route.cost_score = cost_score
+            route.speed_score = speed_score
+            route.overall_score = overall_score
+        
+        return overall_scores
+    
+    def _get_preference_weights(self, preference: RailPreference) -> Tuple[float, float, float, float]:
+        """Get (cost, speed, reliability, compliance) scoring weights based on preference"""
+        return _PREFERENCE_WEIGHTS.get(preference, _PREFERENCE_WEIGHTS[RailPreference.AUTO])
     
     def _select_recommended(
         self,
@@ -759,58 +944,66 @@ class MultiRailRoutingEngine:
         if not routes:
             raise ValueError("No routes available")
         
-        # Filter by preference if specific rail requested
-        if preference == RailPreference.CBDC_PREFERRED:
-            cbdc_routes = [r for r in routes if "CBDC" in r.route_type]
-            if cbdc_routes:
-                return cbdc_routes[0]
-        
-        elif preference == RailPreference.STABLECOIN_PREFERRED:
-            stable_routes = [r for r in routes if "STABLE" in r.route_type]
-            if stable_routes:
-                return stable_routes[0]
-        
-        elif preference == RailPreference.FIAT_PREFERRED:
-            fiat_routes = [r for r in routes if "FIAT" in r.route_type]
-            if fiat_routes:
-                return fiat_routes[0]
+        # Routes are already ranked, so the first match is the best route on the preferred rail
+        marker = _PREFERRED_ROUTE_MARKERS.get(preference)
+        if marker is not None:
+            return next((r for r in routes if marker in r.route_type), routes[0])
         
         # Return highest scored route
         return routes[0]
     
-    def _categorize_routes(self, routes: List[MultiRailRoute]) -> Dict[str, List[MultiRailRoute]]:
-        """Categorize routes by rail type"""
-        return {
-            "cbdc": [r for r in routes if "CBDC" in r.route_type],
-            "stablecoin": [r for r in routes if "STABLE" in r.route_type],
-            "fiat": [r for r in routes if "FIAT" in r.route_type and "CBDC" not in r.route_type],
-            "hybrid": [r for r in routes if "HYBRID" in r.route_type]
-        }
-    
-    def _build_comparison(self, routes: List[MultiRailRoute]) -> Dict:
-        """Build comparison summary"""
+    def _summarize_routes(
+        self,
+        routes: List[MultiRailRoute]
+    ) -> Tuple[Dict[str, List[MultiRailRoute]], Dict]:
+        """Categorize routes by rail type and build the comparison summary in one pass"""
+        cbdc, stablecoin, fiat, hybrid = [], [], [], []
+        categorized = {"cbdc": cbdc, "stablecoin": stablecoin, "fiat": fiat, "hybrid": hybrid}
         if not routes:
-            return {}
+            return categorized, {}
         
-        best_rate = min(routes, key=lambda r: r.total_cost_bps)
-        fastest = min(routes, key=lambda r: r.total_settlement_seconds)
-        lowest_cost = min(routes, key=lambda r: float(r.total_fees_usd))
+        best_rate = fastest = lowest_cost = routes[0]
+        best_rate_bps = best_rate.total_cost_bps
+        fastest_seconds = fastest.total_settlement_seconds
+        lowest_cost_usd = float(lowest_cost.total_fees_usd)
         
-        return {
+        for route in routes:
+            route_type = route.route_type
+            is_cbdc = "CBDC" in route_type
+            if is_cbdc:
+                cbdc.append(route)
+            if "STABLE" in route_type:
+                stablecoin.append(route)
+            if not is_cbdc and "FIAT" in route_type:
+                fiat.append(route)
+            if "HYBRID" in route_type:
+                hybrid.append(route)
+            
+            # Strict comparisons keep the first route on ties, as min() does
+            if route.total_cost_bps < best_rate_bps:
+                best_rate, best_rate_bps = route, route.total_cost_bps
+            if route.total_settlement_seconds < fastest_seconds:
+                fastest, fastest_seconds = route, route.total_settlement_seconds
+            fees_usd = float(route.total_fees_usd)
+            if fees_usd < lowest_cost_usd:
+                lowest_cost, lowest_cost_usd = route, fees_usd
+        
+        comparison = {
             "best_rate_route": best_rate.route_id,
-            "best_rate_cost_bps": best_rate.total_cost_bps,
+            "best_rate_cost_bps": best_rate_bps,
             "fastest_route": fastest.route_id,
-            "fastest_seconds": fastest.total_settlement_seconds,
+            "fastest_seconds": fastest_seconds,
             "lowest_cost_route": lowest_cost.route_id,
-            "lowest_cost_usd": float(lowest_cost.total_fees_usd),
+            "lowest_cost_usd": lowest_cost_usd,
             "total_routes_evaluated": len(routes)
         }
+        return categorized, comparison
     
     def _get_cbdc_route_info(self, route: MultiRailRoute) -> Optional[CBDCRouteInfo]:
         """Get CBDC-specific route info"""
         # Extract CBDC code from route
         for leg in route.legs:
-            if leg.target_type == CurrencyType.CBDC:
+            if leg.target_type == _CT_CBDC:
                 cbdc_code = leg.target_currency
                 cbdc_info = self.digital_currencies["cbdc"].get(cbdc_code, {})
                 if cbdc_info:
@@ -829,7 +1022,7 @@ class MultiRailRoutingEngine:
     def _get_stablecoin_route_info(self, route: MultiRailRoute) -> Optional[StablecoinRouteInfo]:
         """Get stablecoin-specific route info"""
         for leg in route.legs:
-            if leg.target_type == CurrencyType.STABLECOIN:
+            if leg.target_type == _CT_STABLECOIN:
                 stable_code = leg.target_currency
                 stable_info = self.digital_currencies["stablecoins"].get(stable_code, {})
                 if stable_info:
@@ -854,7 +1047,7 @@ class MultiRailRoutingEngine:
             "travel_rule": route.travel_rule_applicable,
             "sanctions_screening": route.sanctions_screening,
             "reporting_required": True,
-            "documentation": ["KYC", "Source of Funds"] if route.compliance_level != ComplianceLevel.BASIC_KYC else ["KYC"]
+            "documentation": ["KYC", "Source of Funds"] if route.compliance_level != _CL_BASIC_KYC else ["KYC"]
         }
     
     def _generate_warnings(self, request: MultiRailRoutingRequest, route: MultiRailRoute) -> List[str]:
@@ -878,54 +1071,54 @@ class MultiRailRoutingEngine:
     # Helper methods
     def _get_fiat_currency(self, currency_info: Dict) -> Optional[str]:
         """Get fiat currency code"""
-        if currency_info["type"] == CurrencyType.FIAT:
+        if currency_info["type"] == _CT_FIAT:
             return currency_info["code"]
-        elif currency_info["type"] == CurrencyType.CBDC:
+        elif currency_info["type"] == _CT_CBDC:
             return currency_info["info"].get("fiat_currency")
-        elif currency_info["type"] == CurrencyType.STABLECOIN:
+        elif currency_info["type"] == _CT_STABLECOIN:
             return currency_info["info"].get("pegged_currency")
         return None
     
     def _get_cbdc_for_fiat(self, fiat: str) -> Optional[str]:
         """Get CBDC code for a fiat currency"""
-        mapping = {
-            "INR": "e-INR",
-            "CNY": "e-CNY",
-            "HKD": "e-HKD",
-            "THB": "e-THB",
-            "AED": "e-AED",
-            "SGD": "e-SGD"
-        }
-        return mapping.get(fiat)
+        return _FIAT_TO_CBDC.get(fiat)
     
-    def _get_fiat_rate(self, source: str, target: str) -> Optional[Decimal]:
+    def _get_fiat_rate(self, source: str, target: str) -> Optional[float]:
         """Get fiat exchange rate"""
+        rate = self._rate_table.get((source, target))
+        if rate is None:
+            rate = self._derive_fiat_rate(source, target)
+        return rate
+    
+    def _derive_fiat_rate(self, source: str, target: str) -> Optional[float]:
+        """Derive a fiat exchange rate from the quoted pairs"""
         if source == target:
-            return Decimal("1.0")
+            return 1.0
         
+        rates = self._float_rates
         pair = f"{source}{target}"
-        if pair in self._fiat_rates:
-            return self._fiat_rates[pair]
+        if pair in rates:
+            return rates[pair]
         
         inverse = f"{target}{source}"
-        if inverse in self._fiat_rates:
-            return Decimal("1") / self._fiat_rates[inverse]
+        if inverse in rates:
+            return 1.0 / rates[inverse]
         
         # Try cross via USD
-        source_usd = self._fiat_rates.get(f"USD{source}") or (Decimal("1") / self._fiat_rates.get(f"{source}USD", Decimal("1")))
-        usd_target = self._fiat_rates.get(f"USD{target}") or (Decimal("1") / self._fiat_rates.get(f"{target}USD", Decimal("1")))
+        source_usd = rates.get(f"USD{source}") or (1.0 / rates.get(f"{source}USD", 1.0))
+        usd_target = rates.get(f"USD{target}") or (1.0 / rates.get(f"{target}USD", 1.0))
         
         if source_usd and usd_target:
             return usd_target / source_usd
         
         return None
     
-    def _to_usd(self, amount: Decimal, currency: str) -> Decimal:
+    def _to_usd(self, amount: float, currency: str) -> Decimal:
         """Convert amount to USD"""
         if currency == "USD":
-            return amount
-        rate = self._get_fiat_rate(currency, "USD")
-        return (amount * rate).quantize(Decimal("0.01")) if rate else amount
+            return _dec(amount, _AMOUNT_PLACES)
+        # Unquoted currencies price 1:1 against USD, as in _derive_fiat_rate
+        return _dec(amount * self._to_usd_rates.get(currency, 1.0), 2)
 
 
 # Singleton
@@ -0,0 +1,227 @@
+"""
+Pydantic Models for the Multi-Rail FX Routing Engine (Fiat, CBDC, Stablecoin)
+"""
+from pydantic import BaseModel, Field
+from typing import Optional, List, Dict, Any
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+
+
+# =============================================================================
+# Enums
+# =============================================================================
+
+class CurrencyType(str, Enum):
+    """Kind of currency at either end of a route"""
+    FIAT = "FIAT"
+    CBDC = "CBDC"
+    STABLECOIN = "STABLECOIN"
+
+
+class RailType(str, Enum):
+    """Payment rail used by a route leg"""
+    FIAT_SWIFT = "FIAT_SWIFT"                # Correspondent banking
+    FIAT_LOCAL = "FIAT_LOCAL"                # Local payment systems
+    CBDC_DOMESTIC = "CBDC_DOMESTIC"          # Domestic CBDC issue/redeem
+    MBRIDGE = "MBRIDGE"                      # Cross-border CBDC (mBridge)
+    STABLECOIN_BRIDGE = "STABLECOIN_BRIDGE"  # On/off ramp via stablecoin
+
+
+class SettlementType(str, Enum):
+    """Settlement finality"""
+    INSTANT = "INSTANT"
+    NEAR_INSTANT = "NEAR_INSTANT"
+    SAME_DAY = "SAME_DAY"
+    T_PLUS_2 = "T_PLUS_2"
+    ATOMIC = "ATOMIC"
+
+
+class ComplianceLevel(str, Enum):
+    """KYC level required by a route"""
+    BASIC_KYC = "BASIC_KYC"
+    FULL_KYC = "FULL_KYC"
+    CENTRAL_BANK = "CENTRAL_BANK"
+
+
+class RailPreference(str, Enum):
+    """Rail preference for route selection"""
+    AUTO = "AUTO"
+    CBDC_PREFERRED = "CBDC_PREFERRED"
+    STABLECOIN_PREFERRED = "STABLECOIN_PREFERRED"
+    FIAT_PREFERRED = "FIAT_PREFERRED"
+    FASTEST = "FASTEST"
+    LOWEST_COST = "LOWEST_COST"
+
+
+class BlockchainNetwork(str, Enum):
+    """Networks stablecoin legs settle on"""
+    ETHEREUM = "ETHEREUM"
+    POLYGON = "POLYGON"
+    SOLANA = "SOLANA"
+    TRON = "TRON"
+    AVALANCHE = "AVALANCHE"
+
+
+# =============================================================================
+# Request Models
+# =============================================================================
+
+class MultiRailRoutingRequest(BaseModel):
+    """Request for a multi-rail routing recommendation"""
+    source_currency: str = Field(..., description="Fiat code, CBDC (e-INR) or stablecoin (USDC)")
+    target_currency: str
+    source_amount: Decimal = Field(..., gt=0)
+    source_type: CurrencyType = Field(default=CurrencyType.FIAT)
+    target_type: CurrencyType = Field(default=CurrencyType.FIAT)
+    rail_preference: RailPreference = Field(default=RailPreference.AUTO)
+
+
+# =============================================================================
+# Route Models
+# =============================================================================
+
+class RailLeg(BaseModel):
+    """Single leg of a multi-rail route"""
+    leg_number: int
+    rail_type: RailType
+    provider: str
+    
+    # Conversion
+    source_currency: str
+    source_type: CurrencyType
+    source_amount: Decimal
+    target_currency: str
+    target_type: CurrencyType
+    target_amount: Decimal
+    exchange_rate: Decimal
+    
+    # Fees
+    fee_amount: Decimal
+    fee_currency: str
+    
+    # Settlement
+    settlement_type: SettlementType
+    settlement_seconds: int
+    
+    # Stablecoin legs only
+    blockchain_network: Optional[BlockchainNetwork] = None
+    network_fee_usd: Optional[Decimal] = None
+    
+    compliance_level: ComplianceLevel
+
+
+class MultiRailRoute(BaseModel):
+    """A complete route across one or more rails"""
+    route_id: str
+    route_name: str
+    route_type: str
+    legs: List[RailLeg]
+    total_legs: int
+    
+    # Amounts
+    source_currency: str
+    source_type: CurrencyType
+    source_amount: Decimal
+    target_currency: str
+    target_type: CurrencyType
+    target_amount: Decimal
+    effective_rate: Decimal
+    
+    # Cost and speed
+    total_fees_usd: Decimal
+    total_cost_bps: int
+    total_settlement_seconds: int
+    settlement_type: SettlementType
+    stp_enabled: bool
+    
+    # Scores (0-100)
+    cost_score: float
+    speed_score: float
+    reliability_score: float
+    compliance_score: float
+    overall_score: float
+    
+    # Compliance
+    compliance_level: ComplianceLevel
+    travel_rule_applicable: bool = False
+    sanctions_screening: str
+
+
+class CBDCRouteInfo(BaseModel):
+    """CBDC details for a route that ends in a CBDC"""
+    cbdc_code: str
+    cbdc_name: str
+    issuing_central_bank: str
+    is_cross_border: bool
+    mbridge_route: bool
+    participating_banks: List[Any] = Field(default_factory=list)
+    wallet_type: str
+    offline_capable: bool = False
+
+
+class StablecoinRouteInfo(BaseModel):
+    """Stablecoin details for a route through a stablecoin"""
+    stablecoin_code: str
+    stablecoin_name: str
+    issuer: str
+    pegged_currency: str
+    network: BlockchainNetwork
+    network_fee_usd: Decimal
+    on_ramp_provider: str
+    off_ramp_provider: str
+    liquidity_score: float
+    regulatory_status: str
+
+
+class RailComparison(BaseModel):
+    """Best route summary for a single rail"""
+    rail: str
+    available: bool
+    routes: int
+    best_rate: Optional[Decimal] = None
+    best_settlement_seconds: Optional[int] = None
+    best_cost_bps: Optional[int] = None
+
+
+# =============================================================================
+# Response Models
+# =============================================================================
+
+class MultiRailRoutingResponse(BaseModel):
+    """Multi-rail routing recommendation response"""
+    request_id: str
+    timestamp: datetime
+    
+    # Request echo
+    source_currency: str
+    source_type: CurrencyType
+    source_amount: Decimal
+    target_currency: str
+    target_type: CurrencyType
+    
+    # Rail availability
+    rails_evaluated: List[str]
+    cbdc_available: bool
+    stablecoin_available: bool
+    fiat_available: bool
+    cbdc_info: Optional[CBDCRouteInfo] = None
+    stablecoin_info: Optional[StablecoinRouteInfo] = None
+    
+    # Recommended route
+    recommended_route: MultiRailRoute
+    
+    # Top routes per rail (sorted by overall_score desc)
+    cbdc_routes: List[MultiRailRoute] = Field(default_factory=list)
+    stablecoin_routes: List[MultiRailRoute] = Field(default_factory=list)
+    fiat_routes: List[MultiRailRoute] = Field(default_factory=list)
+    
+    # Summary
+    best_rate_route: Optional[str] = None
+    fastest_route: Optional[str] = None
+    lowest_cost_route: Optional[str] = None
+    comparison: Dict[str, Any] = Field(default_factory=dict)
+    
+    # Execution guidance
+    compliance_requirements: Dict[str, Any] = Field(default_factory=dict)
+    warnings: List[str] = Field(default_factory=list)
@@ -3,9 +3,18 @@ FX Smart Routing API Router
 
 REST API endpoints for smart routing recommendations.
 """
+import json
 import logging
 from datetime import datetime
-from fastapi import APIRouter, HTTPException, Depends
+from decimal import Decimal
+from typing import Dict, Tuple
+from fastapi import APIRouter, HTTPException, Depends, Response
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from app.models.routing_models import (
     SmartRoutingRequest,
@@ -27,6 +36,37 @@ def get_engine() -> SmartRoutingEngine:
     return get_routing_engine()
 
 
+def _json_default(value):
+    """Encode Decimal amounts as floats at the JSON boundary"""
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _encode_json(payload) -> bytes:
+    """Encode a payload to compact JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload, default=_json_default)
+    return json.dumps(payload, default=_json_default, separators=(",", ":")).encode("utf-8")
+
+
+def _json_response(payload) -> Response:
+    """Encode a payload straight to a JSON response, skipping FastAPI's jsonable_encoder"""
+    return Response(content=_encode_json(payload), media_type="application/json")
+
+
+# Encoded reference-data payloads, keyed by name; re-encoded when the engine rebuilds the payload
+_reference_blobs: Dict[str, Tuple[object, bytes]] = {}
+
+
+def _reference_blob(name: str, payload) -> bytes:
+    """Get the cached JSON encoding of a reference-data payload"""
+    cached = _reference_blobs.get(name)
+    if cached is None or cached[0] is not payload:
+        cached = _reference_blobs[name] = (payload, _encode_json(payload))
+    return cached[1]
+
+
 # =============================================================================
 # Smart Routing Endpoints
 # =============================================================================
@@ -97,9 +137,9 @@ async def compare_routes(
         result = await engine.get_smart_route(request)
         
         # Return all routes without ranking
-        all_routes = [result.recommended_route] + result.alternative_routes if result.recommended_route else []
+        all_routes = [result.recommended_route, *result.alternative_routes] if result.recommended_route else []
         
-        return {
+        return _json_response({
             "request_id": result.request_id,
             "currency_pair": f"{request.source_currency}/{request.target_currency}",
             "amount": float(request.amount),
@@ -111,7 +151,7 @@ async def compare_routes(
                     "target_amount": float(r.target_amount),
                     "settlement_hours": r.settlement_hours,
                     "stp_enabled": r.stp_enabled,
-                    "cost_breakdown": {k: float(v) for k, v in r.cost_breakdown.items()}
+                    "cost_breakdown": r.cost_breakdown
                 }
                 for r in all_routes
             ],
@@ -120,7 +160,7 @@ async def compare_routes(
                 "bridge_currency": result.triangulation.bridge_currency,
                 "potential_savings_bps": result.triangulation.savings_bps
             }
-        }
+        })
     
     except Exception as e:
         logger.error(f"Compare routes error: {e}", exc_info=True)
@@ -140,10 +180,7 @@ async def list_objectives(engine: SmartRoutingEngine = Depends(get_engine)):
     """
     List all available routing objectives.
     """
-    return {
-        "objectives": engine.routing_config["routing_objectives"],
-        "default": engine.routing_config["default_objective"]
-    }
+    return Response(content=_reference_blob("objectives", engine.objectives_summary), media_type="application/json")
 
 
 @router.get(
@@ -155,20 +192,7 @@ async def list_providers(engine: SmartRoutingEngine = Depends(get_engine)):
     """
     List all configured FX providers.
     """
-    providers = []
-    for pid, p in engine.providers_config["providers"].items():
-        providers.append({
-            "id": pid,
-            "name": p["name"],
-            "type": p["type"],
-            "is_active": p["is_active"],
-            "stp_enabled": p["capabilities"].get("stp_enabled", False),
-            "reliability_score": p.get("reliability_score", 0),
-            "settlement_hours": p.get("settlement_hours", 24),
-            "supported_pairs": p["supported_pairs"]
-        })
-    
-    return {"providers": providers, "count": len(providers)}
+    return Response(content=_reference_blob("providers", engine.providers_summary), media_type="application/json")
 
 
 @router.get(
@@ -180,20 +204,7 @@ async def list_customer_tiers(engine: SmartRoutingEngine = Depends(get_engine)):
     """
     List customer tier configurations.
     """
-    tiers = []
-    for tier_id, config in engine.customer_config["customer_tiers"].items():
-        tiers.append({
-            "id": tier_id,
-            "name": config["name"],
-            "description": config["description"],
-            "markup_discount_pct": config["markup_discount_pct"],
-            "spread_reduction_bps": config["spread_reduction_bps"],
-            "max_transaction_usd": config["max_transaction_usd"],
-            "stp_threshold_usd": config["stp_threshold_usd"],
-            "providers_allowed": config["providers_allowed"]
-        })
-    
-    return {"tiers": tiers}
+    return Response(content=_reference_blob("customer_tiers", engine.customer_tiers_summary), media_type="application/json")
 
 
 @router.get(
@@ -205,19 +216,13 @@ async def get_treasury_positions(engine: SmartRoutingEngine = Depends(get_engine
     """
     Get treasury positions for all currency pairs.
     """
-    positions = []
-    for pair, info in engine.treasury_config["treasury_rates"].items():
-        positions.append({
-            "pair": pair,
-            "position": info["position"],
-            "mid_rate": info["mid"],
-            "bid": info["bid"],
-            "ask": info["ask"],
-            "exposure_pct": (info["current_exposure_usd"] / info["max_exposure_usd"]) * 100,
-            "max_exposure_usd": info["max_exposure_usd"]
-        })
-    
-    return {"positions": positions, "timestamp": datetime.utcnow().isoformat()}
+    # Positions are encoded once; only the timestamp is encoded per request
+    positions = _reference_blob("treasury_positions", engine.treasury_positions)
+    timestamp = _encode_json(datetime.utcnow().isoformat())
+    return Response(
+        content=b'{"positions":' + positions + b',"timestamp":' + timestamp + b"}",
+        media_type="application/json"
+    )
 
 
 # =============================================================================
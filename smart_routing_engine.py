@@ -39,6 +39,10 @@ from app.models.routing_models import (
 
 logger = logging.getLogger(__name__)
 
+# Identical routing requests within this window reuse the computed routes
+ROUTE_CACHE_TTL_SECONDS = 2
+ROUTE_CACHE_MAX_ENTRIES = 256
+
 
 class SmartRoutingEngine:
     """
@@ -51,6 +55,7 @@ class SmartRoutingEngine:
     def __init__(self, config_dir: str = "config"):
         self.config_dir = Path(config_dir)
         self._load_configurations()
+        self._route_cache: Dict[str, Tuple[float, SmartRoutingResponse]] = {}
         
         # Mock base rates for demonstration
         self._market_rates = {
@@ -63,6 +68,7 @@ class SmartRoutingEngine:
             "AEDINR": Decimal("23.01"),
             "SGDINR": Decimal("62.85"),
         }
+        self._rate_table = self._build_rate_table()
     
     def _load_configurations(self):
         """Load all configuration files"""
@@ -81,6 +87,59 @@ class SmartRoutingEngine:
         # Treasury rates
         with open(self.config_dir / "treasury_rates.json") as f:
             self.treasury_config = json.load(f)
+        
+        self._build_reference_summaries()
+    
+    def _build_reference_summaries(self):
+        """Precompute the reference-data payloads served by the routing API"""
+        self.objectives_summary = {
+            "objectives": self.routing_config["routing_objectives"],
+            "default": self.routing_config["default_objective"]
+        }
+        
+        providers = [
+            {
+                "id": pid,
+                "name": p["name"],
+                "type": p["type"],
+                "is_active": p["is_active"],
+                "stp_enabled": p["capabilities"].get("stp_enabled", False),
+                "reliability_score": p.get("reliability_score", 0),
+                "settlement_hours": p.get("settlement_hours", 24),
+                "supported_pairs": p["supported_pairs"]
+            }
+            for pid, p in self.providers_config["providers"].items()
+        ]
+        self.providers_summary = {"providers": providers, "count": len(providers)}
+        
+        self.customer_tiers_summary = {
+            "tiers": [
+                {
+                    "id": tier_id,
+                    "name": config["name"],
+                    "description": config["description"],
+                    "markup_discount_pct": config["markup_discount_pct"],
+                    "spread_reduction_bps": config["spread_reduction_bps"],
+                    "max_transaction_usd": config["max_transaction_usd"],
+                    "stp_threshold_usd": config["stp_threshold_usd"],
+                    "providers_allowed": config["providers_allowed"]
+                }
+                for tier_id, config in self.customer_config["customer_tiers"].items()
+            ]
+        }
+        
+        self.treasury_positions = [
+            {
+                "pair": pair,
+                "position": info["position"],
+                "mid_rate": info["mid"],
+                "bid": info["bid"],
+                "ask": info["ask"],
+                "exposure_pct": (info["current_exposure_usd"] / info["max_exposure_usd"]) * 100,
+                "max_exposure_usd": info["max_exposure_usd"]
+            }
+            for pair, info in self.treasury_config["treasury_rates"].items()
+        ]
     
     async def get_smart_route(
         self, 
@@ -98,6 +157,17 @@ class SmartRoutingEngine:
         start_time = time.time()
         request_id = f"RT-{uuid.uuid4().hex[:12].upper()}"
         
+        # Requests carrying a reference ID always get a fresh evaluation
+        cache_key = None if getattr(request, "reference_id", None) else request.model_dump_json()
+        if cache_key is not None:
+            cached = self._route_cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < ROUTE_CACHE_TTL_SECONDS:
+                # Deep copy so callers never share routes, treasury info or discounts
+                return cached[1].model_copy(
+                    deep=True,
+                    update={"request_id": request_id, "timestamp": datetime.utcnow()}
+                )
+        
         # 1. Resolve customer context
         customer = request.customer or CustomerContext(
             customer_id="GUEST",
@@ -181,8 +251,24 @@ class SmartRoutingEngine:
         execution_time = (time.time() - start_time) * 1000
         logger.info(f"Smart routing completed in {execution_time:.2f}ms, {len(scored_routes)} routes evaluated")
         
+        if cache_key is not None:
+            self._cache_route(cache_key, response)
+        
         return response
     
+    def _cache_route(self, cache_key: str, response: SmartRoutingResponse):
+        """Store a routing response, evicting expired (then oldest) entries when full"""
+        now = time.monotonic()
+        # Re-insert rather than overwrite so dict order stays oldest-first
+        self._route_cache.pop(cache_key, None)
+        if len(self._route_cache) >= ROUTE_CACHE_MAX_ENTRIES:
+            for key in [k for k, (cached_at, _) in self._route_cache.items() if now - cached_at >= ROUTE_CACHE_TTL_SECONDS]:
+                del self._route_cache[key]
+            if len(self._route_cache) >= ROUTE_CACHE_MAX_ENTRIES:
+                del self._route_cache[next(iter(self._route_cache))]
+        # Store a private copy; the caller keeps (and may mutate) the original
+        self._route_cache[cache_key] = (now, response.model_copy(deep=True))
+    
     def _get_treasury_info(
         self,
         source: str,
@@ -290,17 +376,16 @@ class SmartRoutingEngine:
             recommended=False
         )
     
+    def _build_rate_table(self) -> Dict[Tuple[str, str], Decimal]:
+        """Precompute direct and inverse market rates keyed by (source, target)"""
+        table = {(pair[3:], pair[:3]): Decimal("1") / rate for pair, rate in self._market_rates.items()}
+        # Quoted rates win over inverses of the opposite quote
+        table.update(((pair[:3], pair[3:]), rate) for pair, rate in self._market_rates.items())
+        return table
+    
     def _get_market_rate(self, source: str, target: str) -> Optional[Decimal]:
         """Get market rate for a currency pair"""
-        pair = f"{source}{target}"
-        if pair in self._market_rates:
-            return self._market_rates[pair]
-        
-        inverse = f"{target}{source}"
-        if inverse in self._market_rates:
-            return Decimal("1") / self._market_rates[inverse]
-        
-        return None
+        return self._rate_table.get((source, target))
     
     async def _get_provider_rates(
         self,
@@ -0,0 +1,68 @@
+"""
+Unit tests for the CBDC ↔ Stablecoin Bridge
+"""
+import asyncio
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+import cbdc_stable_bridge
+from cbdc_stable_bridge import CBDCStableBridge
+
+CONFIG_DIR = str(Path(__file__).resolve().parent.parent)
+
+
+@pytest.fixture
+def bridge():
+    """Create fresh bridge for tests."""
+    return CBDCStableBridge(CONFIG_DIR)
+
+
+def _stable_to_cbdc(bridge, amount="5000", **kwargs):
+    return asyncio.run(bridge.get_stable_to_cbdc_routes(
+        "USDC", "e-INR", Decimal(amount), require_regulated=False, **kwargs
+    ))
+
+
+class TestTopK:
+    """top_k trims the ranked route list."""
+
+    def test_top_k_returns_best_routes_in_order(self, bridge):
+        """top_k=1 keeps only the highest scored route."""
+        all_routes = _stable_to_cbdc(bridge)
+        assert len(all_routes) >= 2
+
+        best = _stable_to_cbdc(bridge, top_k=1)
+        assert len(best) == 1
+        assert best[0].route_name == all_routes[0].route_name
+        assert best[0].overall_score == max(r.overall_score for r in all_routes)
+
+    def test_top_k_larger_than_route_count(self, bridge):
+        """Asking for more routes than exist returns them all."""
+        all_routes = _stable_to_cbdc(bridge)
+        assert [r.route_name for r in _stable_to_cbdc(bridge, top_k=10)] == [r.route_name for r in all_routes]
+
+    def test_top_k_zero(self, bridge):
+        """top_k=0 returns no routes."""
+        assert _stable_to_cbdc(bridge, top_k=0) == []
+
+
+class TestVectorizedScoring:
+    """The NumPy scoring path matches the per-route path."""
+
+    @staticmethod
+    def _scored(bridge, monkeypatch, threshold):
+        monkeypatch.setattr(cbdc_stable_bridge, "_VECTORIZE_MIN_ROUTES", threshold)
+        routes = asyncio.run(bridge.get_cbdc_to_stable_routes(
+            "e-CNY", "USDC", Decimal("5000"), require_regulated=False
+        ))
+        return [(r.route_name, r.overall_score) for r in routes]
+
+    @pytest.mark.skipif(not cbdc_stable_bridge.NUMPY_AVAILABLE, reason="numpy not installed")
+    def test_vector_path_matches_scalar_path(self, bridge, monkeypatch):
+        """Forcing the vector path gives the same scores and order."""
+        scalar = self._scored(bridge, monkeypatch, 10**9)
+        vector = self._scored(bridge, monkeypatch, 0)
+        assert len(scalar) >= 2
+        assert vector == scalar
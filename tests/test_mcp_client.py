@@ -0,0 +1,164 @@
+"""
+Tests for the FX MCP client against the real stdio MCP server
+"""
+import asyncio
+import textwrap
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from anthropic.types import Message, TextBlock, ToolUseBlock, Usage
+
+import fx_mcp_client
+
+SERVER_SCRIPT = str(Path(__file__).resolve().parent.parent / "app" / "fx_mcp_api_server.py")
+
+
+async def _call_two_tools():
+    await fx_mcp_client.mcp_client.start(SERVER_SCRIPT)
+    try:
+        await fx_mcp_client.initialize_mcp()
+        # Neither tool is cacheable, so both go to the server in the same turn
+        return await asyncio.wait_for(
+            fx_mcp_client.call_tools([("fx_health_check", {}), ("fx_list_deals", {"params": {}})]),
+            timeout=30
+        )
+    finally:
+        await fx_mcp_client.mcp_client.close()
+
+
+def test_call_tools_with_two_tools_gets_both_results():
+    """Two uncached tool calls in one turn both get answered"""
+    pytest.importorskip("mcp")
+    results = asyncio.run(_call_two_tools())
+    assert len(results) == 2
+    assert all(isinstance(r, str) and r for r in results)
+
+
+# Stand-in server: answers each request after writing non-JSON-RPC noise, exits on "quit"
+FAKE_SERVER = textwrap.dedent("""
+    import json, sys
+    print("FX MCP server starting...", flush=True)
+    for line in sys.stdin:
+        request = json.loads(line)
+        if request["method"] == "quit":
+            print("shutting down", flush=True)
+            break
+        print("[1, 2]", flush=True)
+        print(json.dumps({"jsonrpc": "2.0", "id": request["id"], "result": {"ok": True}}), flush=True)
+""")
+
+
+async def _run_against_fake_server(script, *methods):
+    client = fx_mcp_client.MCPClient()
+    await client.start(script)
+    try:
+        return [await asyncio.wait_for(client.request(m), timeout=10) for m in methods]
+    finally:
+        await client.close()
+
+
+class TestResponseReader:
+    """The reader survives stray stdout output and never strands a request."""
+
+    def test_non_json_lines_are_skipped(self, tmp_path):
+        """Banner and log lines do not stop responses being dispatched"""
+        script = tmp_path / "server.py"
+        script.write_text(FAKE_SERVER)
+        results = asyncio.run(_run_against_fake_server(str(script), "ping", "ping"))
+        assert [r["result"] for r in results] == [{"ok": True}, {"ok": True}]
+
+    def test_pending_request_released_when_server_exits(self, tmp_path):
+        """A request still waiting when the reader stops gets an empty response"""
+        script = tmp_path / "server.py"
+        script.write_text(FAKE_SERVER)
+        results = asyncio.run(_run_against_fake_server(str(script), "ping", "quit", "ping"))
+        assert results[0]["result"] == {"ok": True}
+        assert results[1:] == [{}, {}]
+
+
+def _message(*content, stop_reason="end_turn"):
+    return Message(
+        id="msg", type="message", role="assistant", model=fx_mcp_client.MODEL,
+        content=list(content), stop_reason=stop_reason, stop_sequence=None,
+        usage=Usage(input_tokens=1, output_tokens=1)
+    )
+
+
+class FakeBatches:
+    """Message Batches stand-in: answers each round from a list of replies per custom_id"""
+
+    def __init__(self, replies):
+        self.replies = replies
+        self.submitted = []
+
+    async def create(self, requests):
+        self.submitted.append(requests)
+        return SimpleNamespace(id=f"batch-{len(self.submitted)}", processing_status="in_progress")
+
+    async def retrieve(self, batch_id):
+        return SimpleNamespace(id=batch_id, processing_status="ended")
+
+    async def results(self, batch_id):
+        async def entries():
+            for request in self.submitted[-1]:
+                message = self.replies[request["custom_id"]].pop(0)
+                yield SimpleNamespace(
+                    custom_id=request["custom_id"],
+                    result=SimpleNamespace(type="succeeded", message=message)
+                )
+        return entries()
+
+
+class TestAnswerQueries:
+    """The --queries entry point answers each query, concurrently or in batches."""
+
+    def test_batch_resolves_tool_use_between_rounds(self, monkeypatch):
+        """A tool_use reply is answered locally and resubmitted in the next batch"""
+        batches = FakeBatches({
+            "q0": [
+                _message(ToolUseBlock(id="t1", type="tool_use", name="fx_get_rate", input={"pair": "USDINR"}),
+                         stop_reason="tool_use"),
+                _message(TextBlock(type="text", text="USD/INR is 83.2")),
+            ],
+            "q1": [_message(TextBlock(type="text", text="No tools needed"))],
+        })
+        monkeypatch.setattr(fx_mcp_client, "client", SimpleNamespace(messages=SimpleNamespace(batches=batches)))
+        monkeypatch.setattr(fx_mcp_client, "BATCH_POLL_SECONDS", 0)
+        calls = []
+
+        async def fake_call_tools(tool_calls):
+            calls.append(tool_calls)
+            return ["83.2"]
+        monkeypatch.setattr(fx_mcp_client, "call_tools", fake_call_tools)
+
+        answers = asyncio.run(fx_mcp_client.answer_queries(["rate?", "hello"], [], use_batch=True))
+
+        assert answers == ["USD/INR is 83.2", "No tools needed"]
+        assert calls == [[("fx_get_rate", {"pair": "USDINR"})]]
+        # Second round only resubmits the query that called a tool, with its tool_result
+        assert [r["custom_id"] for r in batches.submitted[1]] == ["q0"]
+        tool_result = batches.submitted[1][0]["params"]["messages"][-1]["content"][0]
+        assert tool_result["tool_use_id"] == "t1" and tool_result["content"] == "83.2"
+
+    def test_concurrent_failures_are_reported_per_query(self, monkeypatch):
+        """One failing query does not lose the others' answers"""
+        async def fake_chat(query, claude_tools, history):
+            if query == "bad":
+                raise RuntimeError("boom")
+            return f"answer to {query}"
+        monkeypatch.setattr(fx_mcp_client, "chat", fake_chat)
+
+        answers = asyncio.run(fx_mcp_client.answer_queries(["a", "bad", "b"], []))
+        assert answers == ["answer to a", "Error: boom", "answer to b"]
+
+    def test_batch_requires_queries(self):
+        """--batch alone is rejected"""
+        with pytest.raises(SystemExit):
+            fx_mcp_client._parse_args(["--batch"])
+
+    def test_read_queries_skips_blank_lines(self, tmp_path):
+        """Query files are read one stripped, non-empty line per query"""
+        path = tmp_path / "queries.txt"
+        path.write_text("USD to INR?\n\n  e-CNY to USDC?  \n")
+        assert fx_mcp_client._read_queries(str(path)) == ["USD to INR?", "e-CNY to USDC?"]
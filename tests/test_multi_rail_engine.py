@@ -0,0 +1,96 @@
+"""
+Unit tests for the Multi-Rail FX Routing Engine
+"""
+import asyncio
+import sys
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+try:
+    import app.models.multi_rail_models as multi_rail_models
+except ImportError:
+    # The multi-rail models ship at the project root alongside the engine
+    import multi_rail_models
+    sys.modules["app.models.multi_rail_models"] = multi_rail_models
+
+import multi_rail_engine
+from multi_rail_engine import MultiRailRoutingEngine
+from multi_rail_models import CurrencyType, MultiRailRoutingRequest
+
+CONFIG_DIR = str(Path(__file__).resolve().parent.parent)
+
+
+@pytest.fixture
+def engine():
+    """Create fresh multi-rail engine for tests."""
+    return MultiRailRoutingEngine(config_dir=CONFIG_DIR)
+
+
+def _route(engine, source, target, amount):
+    request = MultiRailRoutingRequest(
+        source_currency=source,
+        target_currency=target,
+        source_amount=Decimal(amount)
+    )
+    return asyncio.run(engine.get_multi_rail_route(request))
+
+
+def _all_routes(response):
+    return [response.recommended_route, *response.cbdc_routes, *response.stablecoin_routes, *response.fiat_routes]
+
+
+class TestDecimalBoundary:
+    """Float results become fixed-place Decimals on the response."""
+
+    def test_large_amount_legs_have_fixed_places(self, engine):
+        """Leg amounts and rates carry no float noise at transaction sizes."""
+        response = _route(engine, "USD", "INR", "10000000")
+        for route in _all_routes(response):
+            for leg in route.legs:
+                for value in (leg.target_amount, leg.fee_amount):
+                    assert value.as_tuple().exponent >= -multi_rail_engine._AMOUNT_PLACES
+                assert leg.exchange_rate.as_tuple().exponent >= -multi_rail_engine._RATE_PLACES
+
+    def test_dec_drops_noise_at_large_amounts(self):
+        """Noise past ~15 significant digits is quantized away."""
+        value = multi_rail_engine._dec(848379.9999999999, multi_rail_engine._AMOUNT_PLACES)
+        assert str(value) == "848380.000000"
+        assert str(multi_rail_engine._dec(6.1728499999999995, 4)) == "6.1728"
+
+
+class TestVectorizedScoring:
+    """The NumPy scoring path matches the per-route path."""
+
+    @staticmethod
+    def _scored(engine, monkeypatch, threshold):
+        monkeypatch.setattr(multi_rail_engine, "_VECTORIZE_MIN_ROUTES", threshold)
+        response = _route(engine, "USD", "INR", "250000")
+        return [
+            (r.route_name, r.cost_score, r.speed_score, r.overall_score)
+            for r in _all_routes(response)
+        ]
+
+    @pytest.mark.skipif(not multi_rail_engine.NUMPY_AVAILABLE, reason="numpy not installed")
+    def test_vector_path_matches_scalar_path(self, engine, monkeypatch):
+        """Forcing the vector path gives the same scores and order."""
+        scalar = self._scored(engine, monkeypatch, 10**9)
+        vector = self._scored(engine, monkeypatch, 0)
+        assert len(scalar) >= 2
+        assert vector == scalar
+
+
+class TestCurrencyInfo:
+    """Currency info lookups hand out independent dicts."""
+
+    def test_mutating_currency_info_does_not_leak(self, engine):
+        """A caller's changes are not seen by the next lookup."""
+        fiat = CurrencyType.FIAT
+        first = engine._get_currency_info("USD", fiat)
+        first["info"]["code"] = "MUTATED"
+        first["type"] = None
+
+        second = engine._get_currency_info("USD", fiat)
+        assert second is not first
+        assert second == {"code": "USD", "type": fiat, "info": {"code": "USD"}}
@@ -0,0 +1,65 @@
+"""
+Unit tests for the FX Smart Routing Engine
+"""
+import asyncio
+import sys
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+try:
+    import app.models.routing_models as routing_models
+except ImportError:
+    # The routing models ship at the project root alongside the engine
+    import routing_models
+    sys.modules["app.models.routing_models"] = routing_models
+
+from smart_routing_engine import SmartRoutingEngine
+
+CONFIG_DIR = str(Path(__file__).resolve().parent.parent)
+
+
+@pytest.fixture
+def engine():
+    """Create fresh smart routing engine for tests."""
+    return SmartRoutingEngine(config_dir=CONFIG_DIR)
+
+
+def _request(**overrides):
+    params = {"source_currency": "USD", "target_currency": "INR", "amount": Decimal("10000")}
+    params.update(overrides)
+    return routing_models.SmartRoutingRequest(**params)
+
+
+class TestRouteCache:
+    """Identical requests within the TTL reuse computed routes."""
+
+    def test_repeat_request_gets_fresh_copy(self, engine):
+        """A cache hit has its own request_id and shares no objects."""
+        first = asyncio.run(engine.get_smart_route(_request()))
+        second = asyncio.run(engine.get_smart_route(_request()))
+
+        assert second.request_id != first.request_id
+        assert second is not first
+        assert second.recommended_route is not first.recommended_route
+        assert second.alternative_routes is not first.alternative_routes
+        assert second.treasury is not first.treasury
+        assert second.customer_discounts_applied is not first.customer_discounts_applied
+        assert second.model_dump(exclude={"request_id", "timestamp"}) == \
+            first.model_dump(exclude={"request_id", "timestamp"})
+
+    def test_mutating_a_response_does_not_leak_into_hits(self, engine):
+        """Changes made by one caller are not seen by the next."""
+        first = asyncio.run(engine.get_smart_route(_request()))
+        first.recommended_route.provider_name = "MUTATED"
+        first.alternative_routes.clear()
+
+        second = asyncio.run(engine.get_smart_route(_request()))
+        assert second.recommended_route.provider_name != "MUTATED"
+        assert second.alternative_routes
+
+    def test_reference_id_bypasses_cache(self, engine):
+        """Requests with a reference_id are always evaluated fresh."""
+        asyncio.run(engine.get_smart_route(_request(reference_id="REF-1")))
+        assert not engine._route_cache